@@ -0,0 +1,100 @@
+"""Measures populating an inventory with the bulk setters against calling the per-crossing setters in a loop."""
+# 1. Standard python modules
+import argparse
+import time
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+def create_columns(num_crossings):
+    """Create the columns of an inventory, one value per crossing.
+
+    Args:
+        num_crossings (int): The number of crossings.
+
+    Returns:
+        dict: The column name to its values.
+    """
+    return {
+        'flow_max': [200.0 + index * 0.001 for index in range(num_crossings)],
+        'tw_invert_elevation': [98.0] * num_crossings,
+        'tw_constant_elevation': [100.0 + index * 0.001 for index in range(num_crossings)],
+        'roadway_width': [25.0] * num_crossings,
+        'span': [3.0 + index % 5 for index in range(num_crossings)],
+        'rise': [2.0 + index % 3 for index in range(num_crossings)],
+        'material': [('concrete', 'corrugated steel')[index % 2] for index in range(num_crossings)],
+        'inlet_invert_elevation': [100.0] * num_crossings,
+        'outlet_invert_elevation': [98.0] * num_crossings,
+    }
+
+
+def populate_with_loop(hy8_runner, columns):
+    """Populate a project by calling the per-crossing setters for each crossing, adding crossings as needed."""
+    for index in range(len(columns['span'])):
+        if index >= len(hy8_runner.crossings):
+            hy8_runner.add_crossing()
+        hy8_runner.set_discharge_min_max_inc_flow(0.0, columns['flow_max'][index], 50.0, index)
+        hy8_runner.set_tw_constant(columns['tw_invert_elevation'][index], columns['tw_constant_elevation'][index],
+                                   index)
+        hy8_runner.set_roadway_width(columns['roadway_width'][index], index)
+        hy8_runner.set_culvert_barrel_span_and_rise(columns['span'][index], columns['rise'][index], index)
+        hy8_runner.set_culvert_barrel_material(columns['material'][index], index)
+        hy8_runner.set_culvert_barrel_site_data(0.0, columns['inlet_invert_elevation'][index], 40.0,
+                                                columns['outlet_invert_elevation'][index], index)
+    return hy8_runner
+
+
+def populate_with_bulk_setters(hy8_runner, columns):
+    """Populate a project with one call of each bulk setter, which adds crossings as needed."""
+    num_crossings = len(columns['span'])
+    hy8_runner.set_bulk_discharge_min_max_inc_flow([0.0] * num_crossings, columns['flow_max'], [50.0] * num_crossings)
+    hy8_runner.set_bulk_tw_constant(columns['tw_invert_elevation'], columns['tw_constant_elevation'])
+    hy8_runner.set_bulk_roadway_width(columns['roadway_width'])
+    hy8_runner.set_bulk_culvert_barrel_span_and_rise(columns['span'], columns['rise'])
+    hy8_runner.set_bulk_culvert_barrel_material(columns['material'])
+    hy8_runner.set_bulk_culvert_barrel_site_data([0.0] * num_crossings, columns['inlet_invert_elevation'],
+                                                 [40.0] * num_crossings, columns['outlet_invert_elevation'])
+    return hy8_runner
+
+
+def main():
+    """Populate the same inventory both ways, time them, and check that they write the same HY-8 file.
+
+    Creating an inventory includes constructing the crossings, which costs the same both ways; updating one sets
+    the crossings of a project that already has them, which is the cost the bulk setters remove.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--crossings', type=int, default=20000, help='number of crossings')
+    parser.add_argument('--repeat', type=int, default=3, help='times to populate the inventory; the best is kept')
+    args = parser.parse_args()
+
+    columns = create_columns(args.crossings)
+    for scenario in ('create', 'update'):
+        hy8_texts = []
+        for label, populate in (('per-crossing setters', populate_with_loop),
+                                ('bulk setters', populate_with_bulk_setters)):
+            best = None
+            for _ in range(args.repeat):
+                hy8_runner = Hy8Runner()
+                if scenario == 'update':
+                    populate_with_bulk_setters(hy8_runner, create_columns(args.crossings))
+                start = time.perf_counter()
+                populate(hy8_runner, columns)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            hy8_texts.append(hy8_runner.to_hy8_string(project_date=1.5))
+            print(f'{scenario} with {label:20s}: {best:.3f} s, {args.crossings / best:,.0f} crossings/sec')
+        print(f'{scenario}: same HY-8 file: {hy8_texts[0] == hy8_texts[1]}')
+
+if __name__ == '__main__':
+    main()
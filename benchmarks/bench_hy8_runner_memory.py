@@ -0,0 +1,63 @@
+"""Measures the memory per crossing of a large inventory built through the Hy8Runner setters."""
+# 1. Standard python modules
+import argparse
+import tracemalloc
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+def create_inventory(num_crossings, num_stations, flow_increment):
+    """Create a project whose crossings have their own roadway profiles and flows.
+
+    Args:
+        num_crossings (int): The number of crossings.
+        num_stations (int): The number of roadway stations of each crossing.
+        flow_increment (float): The increment of the min-max-increment flows from 0 to 200.
+
+    Returns:
+        Hy8Runner: The project.
+    """
+    hy8_runner = Hy8Runner()
+    for index in range(num_crossings):
+        if index > 0:
+            hy8_runner.add_crossing()
+        hy8_runner.set_discharge_min_max_inc_flow(0.0, 200.0 + index * 0.001, flow_increment)
+        hy8_runner.set_tw_constant(98.0, 100.0)
+        hy8_runner.set_roadway_width(25.0)
+        hy8_runner.set_roadway_stations_and_elevations(
+            [float(station) + index for station in range(num_stations)],
+            [110.0 + 0.01 * station + index for station in range(num_stations)])
+        hy8_runner.set_culvert_barrel_span_and_rise(5.0, 4.0)
+        hy8_runner.set_culvert_barrel_site_data(0.0, 100.0, 40.0, 98.0)
+        hy8_runner.crossings[-1].flow.compute_list()
+    return hy8_runner
+
+
+def main():
+    """Build the inventory and report the memory it holds."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--crossings', type=int, default=2000, help='number of crossings')
+    parser.add_argument('--stations', type=int, default=50, help='roadway stations per crossing')
+    parser.add_argument('--flow-increment', type=float, default=10.0, help='flow increment from 0 to 200')
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    hy8_runner = create_inventory(args.crossings, args.stations, args.flow_increment)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{len(hy8_runner.crossings)} crossings: {current / 1024 ** 2:.2f} MiB held, {peak / 1024 ** 2:.2f} MiB peak, '
+          f'{current / len(hy8_runner.crossings):.0f} bytes per crossing')
+
+
+if __name__ == '__main__':
+    main()
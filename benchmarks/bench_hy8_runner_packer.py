@@ -0,0 +1,55 @@
+"""Measures the throughput of the crossing packer in crossings per second for several pack sizes."""
+# 1. Standard python modules
+import argparse
+import os
+import tempfile
+import time
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from benchmarks.bench_hy8_runner_parser import create_project
+from hy8runner.hy8_runner_packer import Hy8CrossingPacker
+from tests.hy8_stand_in import create_stand_in_hy8, launch_stand_ins
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+def main():
+    """Run the same crossings with each pack size and time the runs."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--crossings', type=int, default=400, help='number of crossings to run')
+    parser.add_argument('--pack-sizes', type=int, nargs='+', default=[1, 10, 50, 200], help='pack sizes to time')
+    parser.add_argument('--workers', type=int, default=None, help='HY-8 processes to run at the same time')
+    parser.add_argument('--hy8-exe-path', default='',
+                        help='directory of the HY-8 executable; a stand-in is used when omitted')
+    parser.add_argument('--startup', type=float, default=0.2, help='seconds of startup for the stand-in HY-8')
+    args = parser.parse_args()
+
+    crossings = create_project(args.crossings, 10).crossings
+    with tempfile.TemporaryDirectory() as directory, launch_stand_ins():
+        hy8_exe_path = args.hy8_exe_path
+        if not hy8_exe_path:
+            hy8_exe_path = os.path.join(directory, 'exe')
+            create_stand_in_hy8(hy8_exe_path, startup=args.startup)
+
+        for pack_size in args.pack_sizes:
+            packer = Hy8CrossingPacker(os.path.join(directory, f'pack_{pack_size}'), pack_size, hy8_exe_path,
+                                       args.workers)
+            for crossing in crossings:
+                packer.add_crossing(crossing)
+            start = time.perf_counter()
+            crossing_results = packer.run()
+            elapsed = time.perf_counter() - start
+            completed = sum([1 for values in crossing_results.values() if values is not None])
+            print(f'pack size {pack_size:5d}: {len(packer.job_results)} projects, {completed} crossings, '
+                  f'{elapsed:.3f} s, {completed / elapsed:.1f} crossings/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Measures the throughput of the HY-8 file parser in files per second."""
+# 1. Standard python modules
+import argparse
+import os
+import tempfile
+import time
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+def create_project(num_crossings, num_stations):
+    """Create an HY-8 Runner with the requested number of crossings.
+
+    Args:
+        num_crossings (int): The number of crossings in the project.
+        num_stations (int): The number of roadway stations per crossing.
+
+    Returns:
+        Hy8Runner: The HY-8 Runner.
+    """
+    hy8_runner = Hy8Runner()
+    stations = [float(station) for station in range(num_stations)]
+    elevations = [110.0 + 0.01 * station for station in range(num_stations)]
+    for index in range(num_crossings):
+        if index > 0:
+            hy8_runner.add_crossing()
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 10)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations(stations, elevations)
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+    return hy8_runner
+
+
+def main():
+    """Write a set of HY-8 files and time reading them back."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=200, help='number of HY-8 files to parse')
+    parser.add_argument('--crossings', type=int, default=10, help='crossings per HY-8 file')
+    parser.add_argument('--stations', type=int, default=50, help='roadway stations per crossing')
+    args = parser.parse_args()
+
+    hy8_text = create_project(args.crossings, args.stations).to_hy8_string()
+    with tempfile.TemporaryDirectory() as directory:
+        hy8_files = []
+        for index in range(args.files):
+            hy8_file = os.path.join(directory, f'project_{index}.hy8')
+            with open(hy8_file, 'w') as file:
+                file.write(hy8_text)
+            hy8_files.append(hy8_file)
+
+        start = time.perf_counter()
+        for hy8_file in hy8_files:
+            Hy8Runner.from_hy8_file(hy8_file)
+        elapsed = time.perf_counter() - start
+
+    print(f'{args.files} files x {args.crossings} crossings: {elapsed:.3f} s, '
+          f'{args.files / elapsed:.1f} files/sec, {args.files * args.crossings / elapsed:.1f} crossings/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Measures the headwater queries per second of a memory-mapped rating grid."""
+# 1. Standard python modules
+import argparse
+import os
+import tempfile
+import time
+
+# 2. Third party modules
+import numpy as np
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_rating import Hy8RatingGrid
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+def main():
+    """Build a synthetic grid, save it, and time vectorized queries of the memory-mapped grid."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=2000, help='flows on the grid')
+    parser.add_argument('--tailwaters', type=int, default=200, help='tailwaters on the grid')
+    parser.add_argument('--queries', type=int, default=1000000, help='points per query call')
+    parser.add_argument('--repeat', type=int, default=5, help='query calls; the best is kept')
+    args = parser.parse_args()
+
+    flows = np.linspace(0.0, 1000.0, args.flows)
+    tailwaters = np.linspace(95.0, 105.0, args.tailwaters)
+    headwaters = 100.0 + 0.01 * flows[:, np.newaxis] + 0.5 * (tailwaters[np.newaxis, :] - 95.0)
+    random = np.random.default_rng(0)
+    query_flows = random.uniform(-50.0, 1050.0, args.queries)
+    query_tailwaters = random.uniform(95.0, 105.0, args.queries)
+
+    with tempfile.TemporaryDirectory() as directory:
+        grid_dir = os.path.join(directory, 'grid')
+        Hy8RatingGrid(flows, tailwaters, headwaters).save(grid_dir)
+        grid = Hy8RatingGrid.load(grid_dir)
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            _, out_of_range = grid.interpolate(query_flows, query_tailwaters)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        del grid
+    print(f'{args.flows} x {args.tailwaters} grid, {args.queries} queries: {best:.3f} s, '
+          f'{args.queries / best:,.0f} queries/sec, {int(out_of_range.sum())} out of range')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,33 @@
 """HY-8 Runner class that will create an HY-8 file and run HY-8."""
 # 1. Standard python modules
+import asyncio
 import datetime
+import numbers
 import os
 import subprocess
+import threading
+import time
+import weakref
 
 # 2. Third party modules
 
 # 3. Aquaveo modules
 
 # 4. Local modules
+from hy8runner.hy8_runner_config import Hy8RunnerConfig, Hy8RunnerConfigField, Hy8RunnerConfigMeta
 from hy8runner.hy8_runner_crossing import Hy8RunnerCulvertCrossing
 from hy8runner.hy8_runner_culvert import Hy8RunnerCulvertBarrel
+from hy8runner.hy8_runner_environment import Hy8RunnerEnvironment
+from hy8runner.hy8_runner_index import Hy8RunnerCrossingIndex
+from hy8runner.hy8_runner_parser import Hy8RunnerFileParser
+from hy8runner.hy8_runner_plot import Hy8RunnerPlotData
+from hy8runner.hy8_runner_results import Hy8RunnerResultsReader
+from hy8runner.hy8_runner_rsql import Hy8RunnerRsqlReader
+from hy8runner.hy8_runner_run_result import (get_changed_files, Hy8RunnerRetryPolicy, Hy8RunnerRunResult,
+                                             snapshot_output_files)
+from hy8runner.hy8_runner_table import Hy8CrossingTable
+from hy8runner.hy8_runner_validation import Hy8RunnerValidator
+from hy8runner.hy8_runner_workspace import Hy8RunnerWorkspace
 
 __copyright__ = "(C) Copyright Aquaveo 2024"
 __license__ = "All rights reserved"
@@ -20,36 +37,88 @@ __license__ = "All rights reserved"
 __all__ = ['Hy8Runner']
 
 
-class Hy8Runner():
+def _get_bulk_fields():
+    """Map each scalar column of Hy8CrossingTable to the object and attribute set_bulk_columns sets, and its type.
+
+    Returns:
+        dict: The column name to ('crossing', 'flow', or 'culvert', the attribute name, the conversion or None).
+    """
+    table = Hy8CrossingTable
+    fields = {}
+    for names, target, convert in ((table.crossing_float_columns, 'crossing', float),
+                                   (table.crossing_int_columns, 'crossing', int),
+                                   (table.crossing_code_columns, 'crossing', str),
+                                   (table.crossing_text_columns, 'crossing', None),
+                                   (table.culvert_float_columns, 'culvert', float),
+                                   (table.culvert_int_columns, 'culvert', int),
+                                   (table.culvert_code_columns, 'culvert', str),
+                                   (table.culvert_text_columns, 'culvert', None)):
+        for name in names:
+            if name.startswith('flow_'):
+                fields[name] = ('flow', 'method' if name == 'flow_method' else name, convert)
+            elif name.startswith('culvert_'):
+                fields[name] = (target, name[len('culvert_'):], convert)
+            else:
+                fields[name] = (target, name, convert)
+    return fields
+
+
+_BULK_FIELDS = _get_bulk_fields()
+
+
+class Hy8Runner(metaclass=Hy8RunnerConfigMeta):
     """A class that will create an HY-8 file and run HY-8."""
 
-    hy8_exe_path = ''
-    hy8_basename_exe = 'HY864.exe'
-    version = 80.0
+    default_config = Hy8RunnerConfig()  # the config of runners created without one
+
+    # Each of these reads or replaces one setting of self.config; on the class they read or replace default_config
+    hy8_exe_path = Hy8RunnerConfigField()
+    hy8_basename_exe = Hy8RunnerConfigField()
+    version = Hy8RunnerConfigField()
 
-    si_units = False
-    exit_loss_option = 0  # 0 for standard or 1 for USU
+    si_units = Hy8RunnerConfigField()
+    exit_loss_option = Hy8RunnerConfigField()  # 0 for standard or 1 for USU
 
     name_counter = 0
+    _name_counter_lock = threading.Lock()
 
-    def __init__(self, hy8_exe_path='', hy8_file=''):
+    async_run_limit = os.cpu_count() or 1  # HY-8 processes that the async run functions run at the same time
+    _async_semaphores = weakref.WeakKeyDictionary()
+
+    def __init__(self, hy8_exe_path='', hy8_file='', config=None):
         """Initializes the HY-8 Runner class.
 
         Args:
-            hy8_exe_path (string): The path to the HY-8 executable.
+            hy8_exe_path (string): The path to the HY-8 executable; overrides the path in config.
             hy8_file (string): The path to the HY-8 file.
+            config (Hy8RunnerConfig): The executable, version, and unit settings; defaults to default_config.
         """
-        Hy8Runner.name_counter += 1
+        with Hy8Runner._name_counter_lock:
+            Hy8Runner.name_counter += 1
+
+        self.config = config if config is not None else self.default_config
+        if hy8_exe_path != '':
+            self.config = self.config.replace(hy8_exe_path=hy8_exe_path)
 
         self.crossings = [Hy8RunnerCulvertCrossing(0)]
         self.hy8_file = hy8_file
-        if hy8_exe_path != '':
-            Hy8Runner.hy8_exe_path = hy8_exe_path
 
         self.project_title = ''
         self.designer_name = ''
         self.project_notes = ''
 
+        self.timeout = None  # seconds before a run of HY-8 is killed; None waits forever
+        self.retry_policy = Hy8RunnerRetryPolicy()
+        self.results_cache = None  # a Hy8RunnerResultsCache to reuse the output files of identical runs
+        self.scratch_dir = None  # run HY-8 in a new workspace under this directory; None runs next to the file
+        self.scratch_artifacts = None  # the endings of the output files to move back from a workspace; None is all
+        self.environment = Hy8RunnerEnvironment()  # caches the executable checks of repeated validations
+
+        self.blocks_rendered = 0  # the crossing blocks rendered (not reused) by the last to_hy8_string
+        self._block_cache = {}  # id of each crossing to the crossing, its signature, and its block
+        self._table_cache = None  # the crossings and their signatures, and the crossing table validate_model built
+        self._crossing_index = Hy8RunnerCrossingIndex()  # built on the first lookup by name or UUID
+
     def set_hy8_exe_path(self, hy8_exe_path):
         """Set the path to the HY-8 executable.
 
@@ -68,59 +137,143 @@ class Hy8Runner():
             hy8_file += '.hy8'
         self.hy8_file = hy8_file
 
+    @classmethod
+    def from_hy8_file(cls, hy8_file, hy8_exe_path='', config=None):
+        """Create an HY-8 Runner from an existing HY-8 file.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file to read.
+            hy8_exe_path (string): The path to the HY-8 executable.
+            config (Hy8RunnerConfig): The settings to start from; the version and units are read from the file.
+
+        Returns:
+            Hy8Runner: The HY-8 Runner holding the project and crossings from the file.
+        """
+        hy8_runner = cls(hy8_exe_path, hy8_file, config)
+        return Hy8RunnerFileParser().read(hy8_file, hy8_runner)
+
     def add_crossing(self):
         """Set the path to the HY-8 executable.
 
         Returns:
             int: The index of the new crossing.
         """
-        self.crossings.append(Hy8RunnerCulvertCrossing(len(self.crossings)))
+        crossing = Hy8RunnerCulvertCrossing(len(self.crossings))
+        indexed = self._crossing_index.is_current(self.crossings)
+        self.crossings.append(crossing)
+        if indexed:
+            self._crossing_index.add(crossing)
         return len(self.crossings) - 1
 
     def delete_crossing(self, index=None):
         """Set the path to the HY-8 executable.
         Args:
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
+        if index is None or (isinstance(index, numbers.Integral) and index >= len(self.crossings)):
             index = len(self.crossings) - 1
-        del self.crossings[index]
+        elif not isinstance(index, numbers.Integral):
+            index = self.crossings.index(self.get_crossing(index))
+        indexed = self._crossing_index.is_current(self.crossings)
+        crossing = self.crossings.pop(index)
+        if indexed:
+            self._crossing_index.remove(crossing)
         if len(self.crossings) == 0:
             self.add_crossing()
 
+    def get_crossing(self, key):
+        """Return a crossing by its index, UUID, or name, in constant time.
+
+        Args:
+            key (int or string): The index, UUID, or name of the crossing.
+
+        Returns:
+            Hy8RunnerCulvertCrossing: The crossing.
+        """
+        if isinstance(key, numbers.Integral):
+            return self.crossings[key]
+        if not self._crossing_index.is_current(self.crossings):
+            self._crossing_index.rebuild(self.crossings)
+        crossing = self._crossing_index.get(key)
+        if crossing is None:
+            raise KeyError(f'No crossing has the name or UUID: {key}')
+        return crossing
+
+    def get_culvert_barrel(self, crossing_key, culvert_key):
+        """Return a culvert barrel by the key of its crossing and its index or name.
+
+        Args:
+            crossing_key (int or string): The index, UUID, or name of the crossing.
+            culvert_key (int or string): The index or name of the barrel.
+
+        Returns:
+            Hy8RunnerCulvertBarrel: The culvert barrel.
+        """
+        return self._find_culvert(self.get_crossing(crossing_key), culvert_key)
+
+    def reindex(self):
+        """Rebuild the name and UUID index after changing the list of crossings in place."""
+        self._crossing_index.rebuild(self.crossings)
+
+    def _get_crossing(self, index):
+        """Return the crossing a setter addresses: the last one if index is None or past the end."""
+        if index is None or (isinstance(index, numbers.Integral) and index >= len(self.crossings)):
+            return self.crossings[-1]
+        return self.get_crossing(index)
+
+    def _get_culvert(self, index_crossing, index_culvert):
+        """Return the culvert barrel a setter addresses: the last one if index_culvert is None or past the end."""
+        crossing = self._get_crossing(index_crossing)
+        if index_culvert is None or (isinstance(index_culvert, numbers.Integral) and index_culvert >= len(crossing.culverts)):
+            return crossing.culverts[-1]
+        return self._find_culvert(crossing, index_culvert)
+
+    @staticmethod
+    def _find_culvert(crossing, culvert_key):
+        """Return a culvert barrel of a crossing by its index or name."""
+        if isinstance(culvert_key, numbers.Integral):
+            return crossing.culverts[culvert_key]
+        for culvert in crossing.culverts:
+            if culvert.name == culvert_key:
+                return culvert
+        raise KeyError(f'Crossing {crossing.name} has no culvert barrel named: {culvert_key}')
+
     def add_culvert_barrel(self, index_crossing=None):
         """Set the path to the HY-8 executable.
         Args:
-            index_crossing (int): The index of the crossing.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
 
         Returns:
             int: The index of the new culvert.
         """
         if index_crossing is None:
             index_crossing = len(self.crossings) - 1
-        if index_crossing >= len(self.crossings):
+        if isinstance(index_crossing, numbers.Integral) and index_crossing >= len(self.crossings):
             return -1
 
-        self.crossings[index_crossing].culverts.append(
-            Hy8RunnerCulvertBarrel(len(self.crossings[index_crossing].culverts)))
-        return len(self.crossings[index_crossing].culverts) - 1
+        crossing = self.get_crossing(index_crossing)
+        crossing.culverts.append(Hy8RunnerCulvertBarrel(len(crossing.culverts)))
+        return len(crossing.culverts) - 1
 
     def delete_culvert_barrel(self, index_crossing=None, index_culvert=None):
         """Set the path to the HY-8 executable.
         Args:
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the culvert_barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the culvert_barrel.
         """
         if index_crossing is None:
             index_crossing = len(self.crossings) - 1
-        if index_crossing >= len(self.crossings):
+        if isinstance(index_crossing, numbers.Integral) and index_crossing >= len(self.crossings):
             return -1
+        crossing = self.get_crossing(index_crossing)
         if index_culvert is None:
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        if index_culvert >= len(self.crossings[index_crossing].culverts):
+            index_culvert = len(crossing.culverts) - 1
+        elif not isinstance(index_culvert, numbers.Integral):
+            index_culvert = crossing.culverts.index(self.get_culvert_barrel(index_crossing, index_culvert))
+        if index_culvert >= len(crossing.culverts):
             return -1
-        del self.crossings[index_crossing].culverts[index_culvert]
-        if len(self.crossings[index_crossing].culverts) == 0:
+        del crossing.culverts[index_culvert]
+        if len(crossing.culverts) == 0:
             self.add_culvert_barrel(index_crossing)
 
     def set_culvert_crossing_name(self, name, index=None):
@@ -128,11 +281,10 @@ class Hy8Runner():
 
         Args:
             name (string): The name of the crossing.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].name = name
+        crossing = self._get_crossing(index)
+        crossing.name = name
 
     def set_discharge_min_design_max_flow(self, flow_min, flow_design, flow_max, index=None):
         """Set the flow values for the culvert crossing.
@@ -141,28 +293,26 @@ class Hy8Runner():
             flow_min (float): The minimum flow.
             flow_design (float): The design flow.
             flow_max (float): The maximum flow.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
+        crossing = self._get_crossing(index)
 
-        self.crossings[index].flow.method = 'min-design-max'
-        self.crossings[index].flow.flow_min = flow_min
-        self.crossings[index].flow.flow_design = flow_design
-        self.crossings[index].flow.flow_max = flow_max
+        crossing.flow.method = 'min-design-max'
+        crossing.flow.flow_min = flow_min
+        crossing.flow.flow_design = flow_design
+        crossing.flow.flow_max = flow_max
 
     def set_discharge_user_list_flow(self, flow_list, index=None):
         """Set the flow values for the culvert crossing.
 
         Args:
             flow_list (list of floats): The list of flows.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
+        crossing = self._get_crossing(index)
 
-        self.crossings[index].flow.method = 'user-defined'
-        self.crossings[index].flow.flow_list = flow_list
+        crossing.flow.method = 'user-defined'
+        crossing.flow.flow_list = flow_list
 
     def set_discharge_min_max_inc_flow(self, flow_min, flow_max, flow_increment, index=None):
         """Set the flow values for the culvert crossing.
@@ -171,16 +321,15 @@ class Hy8Runner():
             flow_min (float): The minimum flow.
             flow_max (float): The maximum flow.
             flow_increment (float): The flow increment.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
+        crossing = self._get_crossing(index)
 
-        self.crossings[index].flow.method = 'min-max-increment'
-        self.crossings[index].flow.flow_min = flow_min
-        self.crossings[index].flow.flow_max = flow_max
-        self.crossings[index].flow.flow_increment = flow_increment
-        self.crossings[index].flow.compute_list()
+        crossing.flow.method = 'min-max-increment'
+        crossing.flow.flow_min = flow_min
+        crossing.flow.flow_max = flow_max
+        crossing.flow.flow_increment = flow_increment
+        crossing.flow.compute_list()
 
     def set_tw_rectangular(self, bottom_width, channel_slope, manning_n, invert_elevation, index=None):
         """Set the tailwater values for the culvert crossing.
@@ -188,15 +337,14 @@ class Hy8Runner():
         Args:
             tw_invert_elevation (float): The tailwater invert elevation.
             tw_constant_elevation (float): The constant tailwater elevation.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].tw_type = 1
-        self.crossings[index].tw_bottom_width = bottom_width
-        self.crossings[index].tw_channel_slope = channel_slope
-        self.crossings[index].tw_manning_n = manning_n
-        self.crossings[index].tw_invert_elevation = invert_elevation
+        crossing = self._get_crossing(index)
+        crossing.tw_type = 1
+        crossing.tw_bottom_width = bottom_width
+        crossing.tw_channel_slope = channel_slope
+        crossing.tw_manning_n = manning_n
+        crossing.tw_invert_elevation = invert_elevation
 
     def set_tw_trapezoidal(self, bottom_width, sideslope, channel_slope, manning_n, invert_elevation, index=None):
         """Set the tailwater values for the culvert crossing.
@@ -204,16 +352,15 @@ class Hy8Runner():
         Args:
             tw_invert_elevation (float): The tailwater invert elevation.
             tw_constant_elevation (float): The constant tailwater elevation.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].tw_type = 2
-        self.crossings[index].tw_bottom_width = bottom_width
-        self.crossings[index].tw_sideslope = sideslope
-        self.crossings[index].tw_channel_slope = channel_slope
-        self.crossings[index].tw_manning_n = manning_n
-        self.crossings[index].tw_invert_elevation = invert_elevation
+        crossing = self._get_crossing(index)
+        crossing.tw_type = 2
+        crossing.tw_bottom_width = bottom_width
+        crossing.tw_sideslope = sideslope
+        crossing.tw_channel_slope = channel_slope
+        crossing.tw_manning_n = manning_n
+        crossing.tw_invert_elevation = invert_elevation
 
     def set_tw_triangular(self, sideslope, channel_slope, manning_n, invert_elevation, index=None):
         """Set the tailwater values for the culvert crossing.
@@ -221,15 +368,14 @@ class Hy8Runner():
         Args:
             tw_invert_elevation (float): The tailwater invert elevation.
             tw_constant_elevation (float): The constant tailwater elevation.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].tw_type = 3
-        self.crossings[index].tw_sideslope = sideslope
-        self.crossings[index].tw_channel_slope = channel_slope
-        self.crossings[index].tw_manning_n = manning_n
-        self.crossings[index].tw_invert_elevation = invert_elevation
+        crossing = self._get_crossing(index)
+        crossing.tw_type = 3
+        crossing.tw_sideslope = sideslope
+        crossing.tw_channel_slope = channel_slope
+        crossing.tw_manning_n = manning_n
+        crossing.tw_invert_elevation = invert_elevation
 
     def set_tw_constant(self, tw_invert_elevation, tw_constant_elevation, index=None):
         """Set the tailwater values for the culvert crossing.
@@ -237,13 +383,12 @@ class Hy8Runner():
         Args:
             tw_invert_elevation (float): The tailwater invert elevation.
             tw_constant_elevation (float): The constant tailwater elevation.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].tw_type = 6
-        self.crossings[index].tw_constant_elevation = tw_constant_elevation
-        self.crossings[index].tw_invert_elevation = tw_invert_elevation
+        crossing = self._get_crossing(index)
+        crossing.tw_type = 6
+        crossing.tw_constant_elevation = tw_constant_elevation
+        crossing.tw_invert_elevation = tw_invert_elevation
 
     def set_tw_rating_curve(self, invert_elevation, rating_curve, index=None):
         """Set the rating curve for the culvert crossing.
@@ -252,33 +397,30 @@ class Hy8Runner():
             invert_elevation (float): The invert elevation of the culvert.
             rating_curve (list of list): The rating curve for the culvert.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].tw_type = 5
-        self.crossings[index].tw_invert_elevation = invert_elevation
-        self.crossings[index].tw_rating_curve = rating_curve
+        crossing = self._get_crossing(index)
+        crossing.tw_type = 5
+        crossing.tw_invert_elevation = invert_elevation
+        crossing.tw_rating_curve = rating_curve
 
     def set_roadway_width(self, roadway_width, index=None):
         """Set the roadway width for the culvert crossing.
 
         Args:
             roadway_width (float): The width of the roadway.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].roadway_width = roadway_width
+        crossing = self._get_crossing(index)
+        crossing.roadway_width = roadway_width
 
     def set_roadway_surface(self, roadway_surface, index=None):
         """Set the roadway surface for the culvert crossing.
 
         Args:
             roadway_surface (string): The surface of the roadway: 'paved' or 'gravel'.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].roadway_surface = roadway_surface
+        crossing = self._get_crossing(index)
+        crossing.roadway_surface = roadway_surface
 
     def set_roadway_stations_and_elevations(self, stations, elevations, index=None):
         """Add the roadway stations for the culvert crossing.
@@ -286,56 +428,48 @@ class Hy8Runner():
         Args:
             stations (list of floats): The stations of the roadway.
             elevations (list of floats): The elevations of the roadway.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].roadway_shape = 2
-        self.crossings[index].roadway_stations = stations
-        self.crossings[index].roadway_elevations = elevations
+        crossing = self._get_crossing(index)
+        crossing.roadway_shape = 2
+        crossing.roadway_stations = stations
+        crossing.roadway_elevations = elevations
 
     def set_constant_roadway(self, roadway_length, elevation, index=None):
         """Set the roadway stations to a constant elevation for the culvert crossing.
         Args:
             roadway_length (float): The length of the roadway.
             elevation (float): The elevation of the roadway.
-            index (int): The index of the crossing.
+            index (int or string): The index, name, or UUID of the crossing.
         """
-        if index is None or index >= len(self.crossings):
-            index = len(self.crossings) - 1
-        self.crossings[index].roadway_shape = 1
+        crossing = self._get_crossing(index)
+        crossing.roadway_shape = 1
         stations = [0.0, roadway_length]
         elevations = [elevation, elevation]
-        self.crossings[index].roadway_stations = stations
-        self.crossings[index].roadway_elevations = elevations
+        crossing.roadway_stations = stations
+        crossing.roadway_elevations = elevations
 
     def set_culvert_barrel_name(self, name, index_crossing=None, index_culvert=None):
         """Set the name of the culvert barrel.
 
         Args:
             name (string): The name of the culvert barrel.
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].name = name
+        culvert = self._get_culvert(index_crossing, index_culvert)
+        culvert.name = name
 
     def set_culvert_barrel_shape(self, shape, index_crossing=None, index_culvert=None):
         """Set the shape of the culvert barrel.
 
         Args:
             shape (string): The shape of the culvert barrel: 'circle' or 'box'.
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].shape = shape
+        culvert = self._get_culvert(index_crossing, index_culvert)
+        culvert.shape = shape
 
     def set_culvert_barrel_span_and_rise(self, span, rise=None, index_crossing=None, index_culvert=None):
         """Set the shape of the culvert barrel.
@@ -343,30 +477,24 @@ class Hy8Runner():
         Args:
             span (float): The span of the culvert barrel.
             rise (float): The rise of the culvert barrel (only need to specify for box shapes)
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].span = span
+        culvert = self._get_culvert(index_crossing, index_culvert)
+        culvert.span = span
         if rise is not None:
-            self.crossings[index_crossing].culverts[index_culvert].rise = rise
+            culvert.rise = rise
 
     def set_culvert_barrel_material(self, material, index_crossing=None, index_culvert=None):
         """Set the material of the culvert barrel.
 
         Args:
             material (string): The material of the culvert barrel: 'concrete' or 'corrugated steel'.
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].material = material
+        culvert = self._get_culvert(index_crossing, index_culvert)
+        culvert.material = material
 
     def set_culvert_barrel_site_data(self, inlet_invert_station, inlet_invert_elevation, outlet_invert_station,
                                      outlet_invert_elevation, index_crossing=None, index_culvert=None):
@@ -377,193 +505,737 @@ class Hy8Runner():
             inlet_invert_elevation (float): The inlet invert elevation.
             outlet_invert_station (float): The outlet invert station.
             outlet_invert_elevation (float): The outlet invert elevation.
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].inlet_invert_station = inlet_invert_station
-        self.crossings[index_crossing].culverts[index_culvert].inlet_invert_elevation = inlet_invert_elevation
-        self.crossings[index_crossing].culverts[index_culvert].outlet_invert_station = outlet_invert_station
-        self.crossings[index_crossing].culverts[index_culvert].outlet_invert_elevation = outlet_invert_elevation
+        culvert = self._get_culvert(index_crossing, index_culvert)
+        culvert.inlet_invert_station = inlet_invert_station
+        culvert.inlet_invert_elevation = inlet_invert_elevation
+        culvert.outlet_invert_station = outlet_invert_station
+        culvert.outlet_invert_elevation = outlet_invert_elevation
 
     def set_culvert_barrel_number_of_barrels(self, number_of_barrels, index_crossing=None, index_culvert=None):
         """Set the number of barrels of the culvert barrel.
 
         Args:
             number_of_barrels (int): The number of barrels.
-            index_crossing (int): The index of the crossing.
-            index_culvert (int): The index of the barrel.
+            index_crossing (int or string): The index, name, or UUID of the crossing.
+            index_culvert (int or string): The index or name of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].number_of_barrels = number_of_barrels
+        culvert = self._get_culvert(index_crossing, index_culvert)
+        culvert.number_of_barrels = number_of_barrels
 
-    def validate_crossings_data(self, overwrite=True):
-        """Validate the data.
+    def set_bulk_columns(self, columns, indices=None, index_culvert=None):
+        """Set fields of many crossings, and of one barrel of each, from equal-length columns in one call.
+
+        The columns are named like those of Hy8CrossingTable: the attributes of the crossing (tw_type, roadway_width,
+        ...), its flow (flow_method, flow_min, ...), and its barrels (span, material, ..., culvert_name). Every column
+        is checked and converted (numbers to float or int) before any crossing is changed, and each crossing, flow,
+        and barrel takes one new revision rather than one per attribute.
+
+        Args:
+            columns (dict): The column name to its values, one per crossing (lists, tuples, arrays, or NumPy arrays).
+            indices (list of int or string): The index, name, or UUID of the crossing each row sets. If None, row i
+                sets crossing i, and crossings are added until there is one per row.
+            index_culvert (int or string): The index or name of the barrel set in each crossing; None is the last.
 
         Returns:
-            bool: True if the data is valid.
-            string: The error message if the data is not valid.
+            list of Hy8RunnerCulvertCrossing: The crossings that were set, in the order of the rows.
         """
+        count = None
+        fields = []
+        for name, values in columns.items():
+            field = _BULK_FIELDS.get(name)
+            if field is None:
+                raise KeyError(f'Unknown bulk column: {name}')
+            if isinstance(values, str):
+                raise TypeError(f'Bulk column {name} must be a sequence of values, not a string.')
+            target, attribute, convert = field
+            values = list(values) if convert is None else [convert(value) for value in values]
+            if count is None:
+                count = len(values)
+            elif len(values) != count:
+                raise ValueError(f'Bulk column {name} has {len(values)} values; the other columns have {count}.')
+            fields.append((target, attribute, values))
+        if indices is not None:
+            indices = list(indices)
+            if count is None:
+                count = len(indices)
+            elif len(indices) != count:
+                raise ValueError(f'{len(indices)} indices were given for columns of {count} values.')
+        if count is None:
+            return []
+
+        if indices is None:
+            while len(self.crossings) < count:
+                self.add_crossing()
+            crossings = self.crossings[:count]
+        else:
+            crossings = [self.get_crossing(index) for index in indices]
+        used = {target for target, _, _ in fields}
+        targets = {}
+        if 'crossing' in used:
+            targets['crossing'] = crossings
+        if 'flow' in used:
+            targets['flow'] = [crossing.flow for crossing in crossings]
+        if 'culvert' in used:
+            if index_culvert is None:
+                targets['culvert'] = [crossing.culverts[-1] for crossing in crossings]
+            else:
+                targets['culvert'] = [self._find_culvert(crossing, index_culvert) for crossing in crossings]
+
+        for target, attribute, values in fields:
+            # The name and UUID go through the crossing, which keeps the crossing index up to date
+            set_value = setattr if attribute in ('name', 'uuid') and target == 'crossing' else object.__setattr__
+            for item, value in zip(targets[target], values):
+                set_value(item, attribute, value)
+        for items in targets.values():
+            for item in items:
+                item.mark_modified()
+        return crossings
+
+    def set_bulk_discharge_min_max_inc_flow(self, flow_mins, flow_maxes, flow_increments, indices=None):
+        """Set the min-max-increment flows of many crossings.
+
+        Args:
+            flow_mins (list of floats): The minimum flow of each crossing.
+            flow_maxes (list of floats): The maximum flow of each crossing.
+            flow_increments (list of floats): The flow increment of each crossing.
+            indices (list of int or string): The crossings; see set_bulk_columns.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings that were set.
+        """
+        crossings = self.set_bulk_columns({'flow_method': ['min-max-increment'] * len(flow_mins),
+                                           'flow_min': flow_mins, 'flow_max': flow_maxes,
+                                           'flow_increment': flow_increments}, indices)
+        for crossing in crossings:
+            crossing.flow.compute_list()
+        return crossings
+
+    def set_bulk_tw_constant(self, tw_invert_elevations, tw_constant_elevations, indices=None):
+        """Set a constant tailwater for many crossings.
+
+        Args:
+            tw_invert_elevations (list of floats): The tailwater invert elevation of each crossing.
+            tw_constant_elevations (list of floats): The constant tailwater elevation of each crossing.
+            indices (list of int or string): The crossings; see set_bulk_columns.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings that were set.
+        """
+        return self.set_bulk_columns({'tw_type': [6] * len(tw_invert_elevations),
+                                      'tw_invert_elevation': tw_invert_elevations,
+                                      'tw_constant_elevation': tw_constant_elevations}, indices)
+
+    def set_bulk_roadway_width(self, roadway_widths, indices=None):
+        """Set the roadway width of many crossings.
+
+        Args:
+            roadway_widths (list of floats): The roadway width of each crossing.
+            indices (list of int or string): The crossings; see set_bulk_columns.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings that were set.
+        """
+        return self.set_bulk_columns({'roadway_width': roadway_widths}, indices)
+
+    def set_bulk_culvert_barrel_span_and_rise(self, spans, rises=None, indices=None, index_culvert=None):
+        """Set the span and rise of a barrel of many crossings.
+
+        Args:
+            spans (list of floats): The span of each barrel.
+            rises (list of floats): The rise of each barrel (only needed for box shapes).
+            indices (list of int or string): The crossings; see set_bulk_columns.
+            index_culvert (int or string): The index or name of the barrel set in each crossing; None is the last.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings that were set.
+        """
+        columns = {'span': spans}
+        if rises is not None:
+            columns['rise'] = rises
+        return self.set_bulk_columns(columns, indices, index_culvert)
+
+    def set_bulk_culvert_barrel_material(self, materials, indices=None, index_culvert=None):
+        """Set the material of a barrel of many crossings.
+
+        Args:
+            materials (list of strings): The material of each barrel: 'concrete' or 'corrugated steel'.
+            indices (list of int or string): The crossings; see set_bulk_columns.
+            index_culvert (int or string): The index or name of the barrel set in each crossing; None is the last.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings that were set.
+        """
+        return self.set_bulk_columns({'material': materials}, indices, index_culvert)
+
+    def set_bulk_culvert_barrel_site_data(self, inlet_invert_stations, inlet_invert_elevations,
+                                          outlet_invert_stations, outlet_invert_elevations, indices=None,
+                                          index_culvert=None):
+        """Set the invert stations and elevations of a barrel of many crossings.
+
+        Args:
+            inlet_invert_stations (list of floats): The inlet invert station of each barrel.
+            inlet_invert_elevations (list of floats): The inlet invert elevation of each barrel.
+            outlet_invert_stations (list of floats): The outlet invert station of each barrel.
+            outlet_invert_elevations (list of floats): The outlet invert elevation of each barrel.
+            indices (list of int or string): The crossings; see set_bulk_columns.
+            index_culvert (int or string): The index or name of the barrel set in each crossing; None is the last.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings that were set.
+        """
+        return self.set_bulk_columns({'inlet_invert_station': inlet_invert_stations,
+                                      'inlet_invert_elevation': inlet_invert_elevations,
+                                      'outlet_invert_station': outlet_invert_stations,
+                                      'outlet_invert_elevation': outlet_invert_elevations}, indices, index_culvert)
+
+    def validate_model(self, fail_fast=False):
+        """Validate the crossings in memory, without looking at any file.
+
+        Args:
+            fail_fast (bool): Stop at the first error instead of collecting all of them.
+
+        Returns:
+            Hy8RunnerValidationResult: The error codes and the mask of valid crossings.
+        """
+        return Hy8RunnerValidator(fail_fast).validate(self._get_crossing_table())
+
+    def _get_crossing_table(self):
+        """Return a Hy8CrossingTable of the crossings, building it again only when a crossing changed.
+
+        The table is kept with the crossings and their signatures, and reused while they are the same, so
+        validating an unchanged project again (as each create_hy8_file does) does not copy every crossing.
+
+        Returns:
+            Hy8CrossingTable: The crossings as a table.
+        """
+        signatures = [(crossing, crossing.get_signature()) for crossing in self.crossings]
+        if self._table_cache is not None:
+            cached_signatures, table = self._table_cache
+            if len(cached_signatures) == len(signatures) and \
+                    all([crossing is cached_crossing and signature == cached_signature
+                         for (crossing, signature), (cached_crossing, cached_signature)
+                         in zip(signatures, cached_signatures)]):
+                return table
+        table = Hy8CrossingTable.from_crossings(self.crossings)
+        self._table_cache = (signatures, table)
+        return table
+
+    def check_environment(self, overwrite=True, environment=None):
+        """Check that the HY-8 executable exists and that the HY-8 file can be written, without changing any file.
+
+        Args:
+            overwrite (bool): Whether an existing HY-8 file may be replaced.
+            environment (Hy8RunnerEnvironment): The environment checks to use; defaults to self.environment. Share
+                one across a batch to check the executable once.
+
+        Returns:
+            bool: True if HY-8 can be run on the HY-8 file.
+            string: The error message if it can not.
+        """
+        if environment is None:
+            environment = self.environment
         messages = ''
         result = True
 
-        for crossing_index, crossing in enumerate(self.crossings):
-            crossing_str = f'Crossing: {crossing.name} with index: {crossing_index} '
-            result, messages = crossing.flow.validate_crossings_data(crossing_str)
-            if crossing.tw_type == 1:
-                if crossing.tw_bottom_width > 0.0:
-                    messages += \
-                        f'{crossing_str}Enter a tailwater bottom width.\n'
-                    result = False
-                if crossing.tw_channel_slope > 0.0:
-                    messages += \
-                        f'{crossing_str}Enter a tailwater channel slope.\n'
-                    result = False
-                if crossing.tw_manning_n > 0.0:
-                    messages += \
-                        f"{crossing_str}Enter a tailwater channel Manning's n value.\n"
-                    result = False
-                if crossing.tw_invert_elevation > 0.0:
-                    messages += \
-                        f'{crossing_str}Enter a tailwater invert elevation.\n'
-                    result = False
-            elif crossing.tw_type == 5:
-                if len(crossing.tw_rating_curve) == 0.0:
-                    messages += \
-                        f"{crossing_str}Enter a tailwater Rating curve.\n"
-                    result = False
-            elif crossing.tw_type == 6:
-                if crossing.tw_constant_elevation < crossing.tw_invert_elevation:
-                    messages += \
-                        f'{crossing_str}Tailwater constant elevation must be greater than tailwater invert elevation.\n'
-                    result = False
-            if crossing.roadway_width <= 0:
-                messages += f'{crossing_str}Roadway width must be greater than zero.\n'
-                result = False
-            if len(crossing.roadway_stations) < 2:
-                messages += f'{crossing_str}Roadway stations & elevations must have at least two values.\n'
-                result = False
-            if len(crossing.roadway_stations) != len(crossing.roadway_elevations):
-                messages += f'{crossing_str}Roadway stations and elevations must have the same number of values.\n'
-                result = False
-            if len(crossing.culverts) == 0:
-                messages += f'{crossing_str}Crossing must have at least one culvert barrel.\n'
-                result = False
-            for barrel in crossing.culverts:
-                culvert_barrel_str = f'{crossing_str}Culvert barrel: {barrel.name}\t'
-                if barrel.span <= 0.0:
-                    messages += f'{culvert_barrel_str}span of the culvert must be specified.\n'
-                    result = False
-                if barrel.shape == 'box' and barrel.rise <= 0.0:
-                    messages += f'{culvert_barrel_str}rise of the box culvert must be specified.\n'
-                    result = False
-                if barrel.number_of_barrels <= 0:
-                    messages += f'{culvert_barrel_str}Number of barrels must be greater than zero.\n'
-                    result = False
-
         hy8_exe = os.path.join(self.hy8_exe_path, self.hy8_basename_exe)
-        if not os.path.exists(hy8_exe):
+        exists, _ = environment.check_executable(hy8_exe)
+        if not exists:
             messages += f'HY-8 executable does not exist: {hy8_exe}\n'
             result = False
 
-        if self.hy8_file == '':
-            messages += 'HY-8 file must be specified.\n'
-            result = False
-        elif os.path.exists(self.hy8_file):
-            if overwrite:
-                try:
-                    with open(self.hy8_file, 'w'):
-                        pass  # We have verified that it isn't locked
-                except OSError:
-                    messages += f"File '{self.hy8_file}' is locked."
-                    return False, messages
-            else:
-                messages += f'HY-8 file already exists: {self.hy8_file}\n'
-                result = False, messages
-        elif os.path.dirname(self.hy8_file) != '' and not os.path.exists(os.path.dirname(self.hy8_file)):
-            os.makedirs(os.path.dirname(self.hy8_file))
+        file_result, file_messages = environment.check_output_file(self.hy8_file, overwrite)
+        return result and file_result, messages + file_messages
 
-        return result, messages
+    def validate_crossings_data(self, overwrite=True, environment=None):
+        """Validate the data.
+
+        The crossings are checked in memory by validate_model, and the executable and HY-8 file by
+        check_environment; neither changes any file.
+
+        Args:
+            overwrite (bool): Whether an existing HY-8 file may be replaced.
+            environment (Hy8RunnerEnvironment): The environment checks to use; defaults to self.environment.
+
+        Returns:
+            bool: True if the data is valid.
+            string: The error message if the data is not valid.
+        """
+        validation = self.validate_model()
+        environment_result, environment_messages = self.check_environment(overwrite, environment)
+        return validation.is_valid and environment_result, validation.get_messages() + environment_messages
+
+    def prepare_output_directory(self):
+        """Create the directory of the HY-8 file if it does not exist."""
+        self.environment.prepare_output_directory(self.hy8_file)
 
-    def create_hy8_file(self, overwrite=True):
+    def create_hy8_file(self, overwrite=True, environment=None):
         """Create the HY-8 file.
 
         Args:
             overwrite (bool): Overwrite the file if it already exists.
+            environment (Hy8RunnerEnvironment): The environment checks to use; defaults to self.environment.
 
         Returns:
             bool: True if the file was created successfully.
             string: The error message if the file was not created successfully.
         """
-        result, messages = self.validate_crossings_data(overwrite=overwrite)
+        result, messages = self.validate_crossings_data(overwrite=overwrite, environment=environment)
         if not result:
             return result, messages
 
-        if not overwrite and os.path.exists(self.hy8_file):
-            return False, 'HY-8 file already exists.'
+        self.prepare_output_directory()
+        with open(self.hy8_file, 'w') as hy8_file:
+            hy8_file.write(self.to_hy8_string())
+
+        messages += f'HY-8 file created: {self.hy8_file}\n'
+        return result, messages
+
+    def to_hy8_string(self, project_date=None):
+        """Serialize the project to the text of an HY-8 file.
+
+        Each crossing block is built in memory and the project is joined once, so the whole file can be written in
+        a single pass or hashed, compressed, or sent elsewhere without touching disk. The block of a crossing is only
+        rendered again after the crossing, its flow, or one of its barrels has been changed.
+
+        Args:
+            project_date (float): The value for the PROJDATE card; defaults to the current time in hours.
 
+        Returns:
+            string: The contents of the HY-8 file.
+        """
         units = 0
-        if Hy8Runner.si_units:
+        if self.si_units:
             units = 1
-        with open(self.hy8_file, 'w') as hy8_file:
-            hy8_file.write(f'HY8PROJECTFILE{Hy8Runner.version}\n')
-            hy8_file.write(f'UNITS  {units}\n')
-            hy8_file.write(f'EXITLOSSOPTION  {Hy8Runner.exit_loss_option}\n')
-            hy8_file.write(f'PROJTITLE  {self.project_title}\n')
-            hy8_file.write(f'PROJDESIGNER  {self.designer_name}\n')
-            hy8_file.write(f'STARTPROJNOTES  {self.project_notes}\nENDPROJNOTES\n')
-            hy8_file.write(f'PROJDATE  {datetime.datetime.now().timestamp()/3600}\n')
-            hy8_file.write(f'NUMCROSSINGS  {len(self.crossings)}\n')
+        if project_date is None:
+            project_date = datetime.datetime.now().timestamp() / 3600
 
-            for crossing in self.crossings:
-                crossing.write_crossing_to_file(hy8_file)
+        blocks = [f'HY8PROJECTFILE{self.version}\n'
+                  f'UNITS  {units}\n'
+                  f'EXITLOSSOPTION  {self.exit_loss_option}\n'
+                  f'PROJTITLE  {self.project_title}\n'
+                  f'PROJDESIGNER  {self.designer_name}\n'
+                  f'STARTPROJNOTES  {self.project_notes}\nENDPROJNOTES\n'
+                  f'PROJDATE  {project_date}\n'
+                  f'NUMCROSSINGS  {len(self.crossings)}\n']
+        blocks.extend(self._get_crossing_blocks())
+        blocks.append('ENDPROJECTFILE\n')
 
-            hy8_file.write('ENDPROJECTFILE\n')
+        return ''.join(blocks)
 
-        messages += f'HY-8 file created: {self.hy8_file}\n'
-        return result, messages
+    def _get_crossing_blocks(self):
+        """Return the crossing blocks of the HY-8 file, rendering only the crossings that changed.
 
-    def _run_hy8_executable(self, commandline_arguments):
-        """Run the HY-8 executable with command line arguments.
+        The text of each crossing is kept with its signature, and reused while the signature is the same; the
+        number of blocks that had to be rendered is kept in blocks_rendered.
+
+        Returns:
+            list of strings: The crossing blocks, in the order of the crossings.
+        """
+        block_cache = {}
+        blocks = []
+        self.blocks_rendered = 0
+        for crossing in self.crossings:
+            crossing.flow.compute_list()  # so computing the flows does not change the signature afterwards
+            signature = crossing.get_signature()
+            cached = self._block_cache.get(id(crossing))
+            if cached is not None and cached[0] is crossing and cached[1] == signature:
+                block = cached[2]
+            else:
+                block = crossing.to_hy8_string()
+                self.blocks_rendered += 1
+            block_cache[id(crossing)] = (crossing, signature, block)
+            blocks.append(block)
+        self._block_cache = block_cache
+        return blocks
+
+    def to_hy8_bytes(self, encoding='utf-8', project_date=None):
+        """Serialize the project to the encoded bytes of an HY-8 file.
+
+        Args:
+            encoding (string): The text encoding to use.
+            project_date (float): The value for the PROJDATE card; defaults to the current time in hours.
+
+        Returns:
+            bytes: The contents of the HY-8 file.
+        """
+        return self.to_hy8_string(project_date=project_date).encode(encoding)
+
+    def get_hy8_command(self, commandline_arguments, hy8_file=None):
+        """Return the command that runs the HY-8 executable on the HY-8 file.
 
         Args:
             commandline_arguments (list of strings): The command line arguments to pass to the HY-8
+            hy8_file (string): The HY-8 file to run; defaults to self.hy8_file.
+
+        Returns:
+            list of strings: The executable, the command line arguments, and the HY-8 file.
         """
         hy8_exe = os.path.join(self.hy8_exe_path, self.hy8_basename_exe)
         command = [hy8_exe]
         command.extend(commandline_arguments)
-        command.append(self.hy8_file)
-        completed_process = subprocess.run(command)
-        if completed_process.returncode != 0:
-            print(f"Command '{command}' failed with return code {completed_process.returncode}")
+        command.append(self.hy8_file if hy8_file is None else hy8_file)
+        return command
+
+    def run_hy8_executable(self, commandline_arguments, timeout=None, retry_policy=None):
+        """Run the HY-8 executable with command line arguments.
+
+        Args:
+            commandline_arguments (list of strings): The command line arguments to pass to the HY-8
+            timeout (float): The seconds before a run is killed; defaults to self.timeout.
+            retry_policy (Hy8RunnerRetryPolicy): When to run again after a failure; defaults to self.retry_policy.
+
+        Returns:
+            Hy8RunnerRunResult: The return code, wall time, captured output and output files of the run.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        if retry_policy is None:
+            retry_policy = self.retry_policy
+        command = self.get_hy8_command(commandline_arguments)
+        start = time.perf_counter()
+        cache_key, run_result = self._restore_cached_run(command, start)
+        if run_result.cached:
+            return run_result
+        workspace = self._create_workspace(run_result)
+        before = snapshot_output_files(run_result.command[-1])
+        while not run_result.error:
+            run_result.attempts += 1
+            run_result.timed_out = False
+            try:
+                completed_process = subprocess.run(run_result.command, capture_output=True, text=True,
+                                                   timeout=timeout)
+                run_result.returncode = completed_process.returncode
+                run_result.stdout = completed_process.stdout
+                run_result.stderr = completed_process.stderr
+            except subprocess.TimeoutExpired as error:  # subprocess.run has killed HY-8
+                run_result.returncode = None
+                run_result.timed_out = True
+                run_result.stdout = self._decode_output(error.stdout)
+                run_result.stderr = self._decode_output(error.stderr)
+            except OSError as error:
+                run_result.error = str(error)
+            if not retry_policy.should_retry(run_result):
+                break
+            time.sleep(retry_policy.get_delay(run_result.attempts))
+        return self._finish_run_result(run_result, before, start, cache_key, workspace)
+
+    @classmethod
+    def _get_async_semaphore(cls):
+        """Return the semaphore that limits the HY-8 processes run by the async functions on this event loop.
+
+        Returns:
+            asyncio.Semaphore: The semaphore, created with async_run_limit the first time it is used on the loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = cls._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(cls.async_run_limit)
+            cls._async_semaphores[loop] = semaphore
+        return semaphore
+
+    async def run_hy8_executable_async(self, commandline_arguments, semaphore=None, timeout=None,
+                                        retry_policy=None):
+        """Run the HY-8 executable with command line arguments without blocking the event loop.
+
+        Args:
+            commandline_arguments (list of strings): The command line arguments to pass to the HY-8
+            semaphore (asyncio.Semaphore): Limits the concurrent HY-8 processes; defaults to a shared semaphore
+                with async_run_limit slots. The wall time of the run starts once it holds the semaphore.
+            timeout (float): The seconds before a run is killed; defaults to self.timeout.
+            retry_policy (Hy8RunnerRetryPolicy): When to run again after a failure; defaults to self.retry_policy.
+
+        Returns:
+            Hy8RunnerRunResult: The return code, wall time, captured output and output files of the run.
+        """
+        if semaphore is None:
+            semaphore = self._get_async_semaphore()
+        if timeout is None:
+            timeout = self.timeout
+        if retry_policy is None:
+            retry_policy = self.retry_policy
+        command = self.get_hy8_command(commandline_arguments)
+        # The file work of a run (cache, workspace, and output files) runs in a thread, off the event loop
+        cache_key, run_result = await asyncio.to_thread(self._restore_cached_run, command, time.perf_counter())
+        if run_result.cached:
+            return run_result
+        workspace = await asyncio.to_thread(self._create_workspace, run_result)
+        before = await asyncio.to_thread(snapshot_output_files, run_result.command[-1])
+        start = None
+        while not run_result.error:
+            run_result.attempts += 1
+            run_result.timed_out = False
+            async with semaphore:
+                if start is None:  # the wall time starts when the run gets a slot, not while it waits for one
+                    start = time.perf_counter()
+                try:
+                    process = await asyncio.create_subprocess_exec(*run_result.command,
+                                                                   stdout=asyncio.subprocess.PIPE,
+                                                                   stderr=asyncio.subprocess.PIPE)
+                except OSError as error:
+                    run_result.error = str(error)
+                    break
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                    run_result.returncode = process.returncode
+                    run_result.stdout = self._decode_output(stdout)
+                    run_result.stderr = self._decode_output(stderr)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    run_result.returncode = None
+                    run_result.timed_out = True
+                except asyncio.CancelledError:
+                    process.kill()
+                    await process.wait()
+                    if workspace is not None:
+                        workspace.cleanup()
+                    raise
+            if not retry_policy.should_retry(run_result):
+                break
+            await asyncio.sleep(retry_policy.get_delay(run_result.attempts))
+        if start is None:
+            start = time.perf_counter()
+        return await asyncio.to_thread(self._finish_run_result, run_result, before, start, cache_key, workspace)
+
+    @staticmethod
+    def _decode_output(output):
+        """Return captured process output as a string.
+
+        Args:
+            output (bytes or string): The captured output.
+
+        Returns:
+            string: The output.
+        """
+        if output is None:
+            return ''
+        if isinstance(output, bytes):
+            return output.decode(errors='replace')
+        return output
+
+    def _restore_cached_run(self, command, start):
+        """Restore the output files of an identical earlier run from the results cache.
+
+        Args:
+            command (list of strings): The executable, the command line arguments, and the HY-8 file.
+            start (float): The performance counter when the run started.
+
+        Returns:
+            string: The cache key of the run, or None if the run is not cached.
+            Hy8RunnerRunResult: The run result; its cached flag is set if the output files were restored.
+        """
+        run_result = Hy8RunnerRunResult(command)
+        if self.results_cache is None:
+            return None, run_result
+        try:
+            cache_key = self.results_cache.get_key(self.hy8_file, command)
+        except OSError:  # the HY-8 file or executable is missing; the run reports the error
+            return None, run_result
+        artifacts = self.scratch_artifacts if self.scratch_dir is not None else None
+        output_files = self.results_cache.restore(cache_key, self.hy8_file, artifacts)
+        if output_files is not None:
+            run_result.returncode = 0
+            run_result.cached = True
+            run_result.output_files = output_files
+            run_result.elapsed = time.perf_counter() - start
+        return cache_key, run_result
+
+    def _create_workspace(self, run_result):
+        """Create a scratch workspace for a run and point the command of the run at the copy of the HY-8 file.
+
+        Args:
+            run_result (Hy8RunnerRunResult): The run result; its error is set if the workspace can not be created.
+
+        Returns:
+            Hy8RunnerWorkspace: The workspace, or None if HY-8 runs next to the HY-8 file.
+        """
+        if self.scratch_dir is None:
+            return None
+        workspace = Hy8RunnerWorkspace(self.hy8_file, self.scratch_dir, self.scratch_artifacts)
+        try:
+            run_result.command[-1] = workspace.create()
+        except OSError as error:
+            run_result.error = str(error)
+            return None
+        return workspace
+
+    def _finish_run_result(self, run_result, before, start, cache_key=None, workspace=None):
+        """Record the wall time and the output files of a run, store a successful run, and report a failure.
+
+        Output files written in a workspace are moved back next to the HY-8 file and the workspace is removed.
+
+        Args:
+            run_result (Hy8RunnerRunResult): The run result.
+            before (dict): The output files next to the HY-8 file that was run, before the run.
+            start (float): The performance counter when the run started.
+            cache_key (string): The key to store the output files under in the results cache.
+            workspace (Hy8RunnerWorkspace): The workspace the run worked in.
+
+        Returns:
+            Hy8RunnerRunResult: The run result.
+        """
+        run_hy8_file = run_result.command[-1]
+        run_result.output_files = get_changed_files(before, snapshot_output_files(run_hy8_file))
+        try:
+            if cache_key is not None and run_result.succeeded:
+                self.results_cache.store(cache_key, run_hy8_file, run_result.output_files)
+            if workspace is not None:
+                run_result.output_files = workspace.collect(run_result.output_files)
+        finally:
+            if workspace is not None:
+                workspace.cleanup()
+        run_result.command[-1] = self.hy8_file
+        run_result.elapsed = time.perf_counter() - start
+        if run_result.timed_out:
+            print(f"Command '{run_result.command}' timed out after {run_result.attempts} attempt(s)")
+        elif run_result.error:
+            print(f"Command '{run_result.command}' could not be run: {run_result.error}")
+        elif run_result.returncode != 0:
+            print(f"Command '{run_result.command}' failed with return code {run_result.returncode}")
+        return run_result
+
+    @staticmethod
+    def get_build_flow_tw_table_arguments(flow_coef=1.1, flow_const=0.25, units='EN', tw_inc=0.25):
+        """Return the command line arguments that build the flow-tailwater table."""
+        return ['-BuildFlowTwTable', 'FLOWCOEF', str(flow_coef), 'FLOWCONST', str(flow_const), 'UNITS', units,
+                'HWINC', 'TWINC', str(tw_inc)]
+
+    @staticmethod
+    def get_build_hw_tw_table_arguments(units='EN', hw_inc=0.25, tw_inc=0.25):
+        """Return the command line arguments that build the headwater-tailwater table."""
+        return ['-BuildHwTwTable', 'UNITS', units, 'HWINC', str(hw_inc), 'TWINC', str(tw_inc)]
+
+    def run_build_full_report(self, timeout=None):
+        """Runs HY-8 and generates a full report in docx.
 
-    def run_build_full_report(self):
-        """Runs HY-8 and generates a full report in docx."""
-        self._run_hy8_executable(['-BuildFullReport'])
+        Args:
+            timeout (float): The seconds before the run is killed; defaults to self.timeout.
+
+        Returns:
+            Hy8RunnerRunResult: The result of the run.
+        """
+        return self.run_hy8_executable(['-BuildFullReport'], timeout)
 
-    def run_open_save(self):
+    def run_open_save(self, timeout=None):
         """opens, runs, saves; this creates the rst, plt, rsql files. The rst file has HY-8 results.
         The plt file has the plot information. The rsql file has results beyond HY-8,
-        which may be beneficial (freeboard depth, for example)."""
-        self._run_hy8_executable(['-OpenRunSave'])
-
-    def run_open_save_plots(self):
-        """opens, runs, saves (same as last function), and creates bitmap plot images for each discharge."""
-        self._run_hy8_executable(['-OpenRunSavePlots'])
-
-    def run_build_flow_tw_table(self, flow_coef=1.1, flow_const=0.25, units='EN', tw_inc=0.25):
-        """Generates a table for the culvert where it tells you the headwater for a given flow and tailwater."""
-        commandline_arguments = ['-BuildFlowTwTable', 'FLOWCOEF', str(flow_coef), 'FLOWCONST', str(flow_const),
-                                 'UNITS', units, 'HWINC', 'TWINC', str(tw_inc)]
-        self._run_hy8_executable(commandline_arguments)
-
-    def run_build_hw_tw_table(self, units='EN', hw_inc=0.25, tw_inc=0.25):
-        """Generates a table for the culvert where it tells you the flow for a given headwater and tailwater."""
-        commandline_arguments = ['-BuildHwTwTable', 'UNITS', units, 'HWINC', str(hw_inc), 'TWINC', str(tw_inc)]
-        self._run_hy8_executable(commandline_arguments)
+        which may be beneficial (freeboard depth, for example).
+
+        Args:
+            timeout (float): The seconds before the run is killed; defaults to self.timeout.
+
+        Returns:
+            Hy8RunnerRunResult: The result of the run.
+        """
+        return self.run_hy8_executable(['-OpenRunSave'], timeout)
+
+    def run_open_save_plots(self, timeout=None):
+        """opens, runs, saves (same as last function), and creates bitmap plot images for each discharge.
+
+        Args:
+            timeout (float): The seconds before the run is killed; defaults to self.timeout.
+
+        Returns:
+            Hy8RunnerRunResult: The result of the run.
+        """
+        return self.run_hy8_executable(['-OpenRunSavePlots'], timeout)
+
+    def run_build_flow_tw_table(self, flow_coef=1.1, flow_const=0.25, units='EN', tw_inc=0.25, timeout=None):
+        """Generates a table for the culvert where it tells you the headwater for a given flow and tailwater.
+
+        Returns:
+            Hy8RunnerRunResult: The result of the run.
+        """
+        commandline_arguments = self.get_build_flow_tw_table_arguments(flow_coef, flow_const, units, tw_inc)
+        return self.run_hy8_executable(commandline_arguments, timeout)
+
+    def run_build_hw_tw_table(self, units='EN', hw_inc=0.25, tw_inc=0.25, timeout=None):
+        """Generates a table for the culvert where it tells you the flow for a given headwater and tailwater.
+
+        Returns:
+            Hy8RunnerRunResult: The result of the run.
+        """
+        commandline_arguments = self.get_build_hw_tw_table_arguments(units, hw_inc, tw_inc)
+        return self.run_hy8_executable(commandline_arguments, timeout)
+
+    async def run_build_full_report_async(self, semaphore=None, timeout=None):
+        """Runs HY-8 and generates a full report in docx, without blocking the event loop."""
+        return await self.run_hy8_executable_async(['-BuildFullReport'], semaphore, timeout)
+
+    async def run_open_save_async(self, semaphore=None, timeout=None):
+        """opens, runs, saves (same as run_open_save), without blocking the event loop."""
+        return await self.run_hy8_executable_async(['-OpenRunSave'], semaphore, timeout)
+
+    async def run_open_save_plots_async(self, semaphore=None, timeout=None):
+        """opens, runs, saves, and creates plot images (same as run_open_save_plots), without blocking the loop."""
+        return await self.run_hy8_executable_async(['-OpenRunSavePlots'], semaphore, timeout)
+
+    async def run_build_flow_tw_table_async(self, flow_coef=1.1, flow_const=0.25, units='EN', tw_inc=0.25,
+                                            semaphore=None, timeout=None):
+        """Generates the flow-tailwater table (same as run_build_flow_tw_table), without blocking the loop."""
+        commandline_arguments = self.get_build_flow_tw_table_arguments(flow_coef, flow_const, units, tw_inc)
+        return await self.run_hy8_executable_async(commandline_arguments, semaphore, timeout)
+
+    async def run_build_hw_tw_table_async(self, units='EN', hw_inc=0.25, tw_inc=0.25, semaphore=None,
+                                          timeout=None):
+        """Generates the headwater-tailwater table (same as run_build_hw_tw_table), without blocking the loop."""
+        commandline_arguments = self.get_build_hw_tw_table_arguments(units, hw_inc, tw_inc)
+        return await self.run_hy8_executable_async(commandline_arguments, semaphore, timeout)
+
+    def get_output_file(self, extension):
+        """Return the path of an output file that HY-8 writes next to the HY-8 file.
+
+        Args:
+            extension (string): The extension of the output file, for example '.rst'.
+
+        Returns:
+            string: The path to the output file.
+        """
+        return os.path.splitext(self.hy8_file)[0] + extension
+
+    def read_results(self):
+        """Read the rst results file created by run_open_save.
+
+        Returns:
+            Hy8RunnerResults: The per-crossing, per-flow results.
+        """
+        return Hy8RunnerResultsReader().read(self.get_output_file('.rst'))
+
+    def read_rsql(self, columns, crossings=None, flows=None, table='Results'):
+        """Read selected columns from the rsql results database created by run_open_save.
+
+        Args:
+            columns (list of strings): The columns to read, for example ['Freeboard'].
+            crossings (list): The crossing keys to read; None reads every crossing.
+            flows (list): The flow keys to read; None reads every flow.
+            table (string): The results table to read.
+
+        Returns:
+            dict: The crossing column, the flow column, and each requested column, keyed by column name.
+        """
+        with Hy8RunnerRsqlReader(self.get_output_file('.rsql'), table=table) as reader:
+            return reader.read(columns, crossings, flows)
+
+    def read_plot_data(self):
+        """Index the plt file created by run_open_save for random access to the plot data of each discharge.
+
+        Returns:
+            Hy8RunnerPlotData: The plot data; close it when done.
+        """
+        return Hy8RunnerPlotData(self.get_output_file('.plt'))
+
+    def read_rating_grid(self, value_name='headwater'):
+        """Read the table created by run_build_flow_tw_table or run_build_hw_tw_table into a grid (needs NumPy).
+
+        Args:
+            value_name (string): 'headwater' for the headwater by flow and tailwater, or 'flow' for the flow by
+                headwater and tailwater.
+
+        Returns:
+            Hy8RatingGrid: The grid, queried with interpolate.
+        """
+        from hy8runner.hy8_runner_rating import Hy8RatingGrid
+        return Hy8RatingGrid.read_table(self.get_output_file('.table'), value_name)
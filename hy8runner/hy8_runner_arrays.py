@@ -0,0 +1,73 @@
+"""HY-8 Runner float array that stores numeric sequences of the data model compactly."""
+# 1. Standard python modules
+from array import array
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerFloatArray', 'to_float_array']
+
+
+class Hy8RunnerFloatArray(array):
+    """An array('d') that compares equal to a list or tuple with the same values.
+
+    The stations, elevations, and flows of the data model are stored in these arrays (8 bytes per value instead of
+    a list slot plus a float object), while code that compares them with lists keeps working.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, values=()):
+        """Create the array.
+
+        Args:
+            values (iterable of floats): The initial values.
+        """
+        return super().__new__(cls, 'd', values)
+
+    def __eq__(self, other):
+        """Return True if other has the same values, whether it is an array, a list, or a tuple."""
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all([value == other_value for value, other_value in zip(self, other)])
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        """Return True if other does not have the same values."""
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __reduce_ex__(self, protocol):
+        """Pickle the array as its values."""
+        return type(self), (list(self),)
+
+    def __copy__(self):
+        """Return a copy of the array."""
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        """Return a copy of the array; its floats are immutable."""
+        return type(self)(self)
+
+
+def to_float_array(values):
+    """Return values as a Hy8RunnerFloatArray, reusing the array if it already is one.
+
+    Args:
+        values (iterable of floats): The values.
+
+    Returns:
+        Hy8RunnerFloatArray: The values.
+    """
+    if type(values) is Hy8RunnerFloatArray:
+        return values
+    return Hy8RunnerFloatArray(values)
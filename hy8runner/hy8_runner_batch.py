@@ -0,0 +1,262 @@
+"""HY-8 batch runner that runs many HY-8 projects on a bounded pool of HY-8 processes."""
+# 1. Standard python modules
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import os
+import time
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_environment import Hy8RunnerEnvironment
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8BatchJobResult', 'Hy8BatchRunner']
+
+
+class Hy8BatchJobResult():
+    """The outcome of one HY-8 project run by the batch runner."""
+
+    def __init__(self, hy8_file, action):
+        """Initializes the job result.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file of the job.
+            action (string): The action that was run.
+        """
+        self.hy8_file = hy8_file
+        self.action = action
+        self.status = 'pending'  # 'success', 'failed', 'timeout', 'invalid', or 'error'
+        self.returncode = None
+        self.elapsed = 0.0
+        self.messages = ''
+        self.run_result = None  # the Hy8RunnerRunResult, once HY-8 has been run
+
+    @property
+    def succeeded(self):
+        """Return True if HY-8 ran and returned zero."""
+        return self.status == 'success'
+
+
+class Hy8BatchRunner():
+    """Runs many HY-8 projects, each as its own HY-8 process, with a bounded number of processes at a time."""
+
+    actions = {
+        'BuildFullReport': ['-BuildFullReport'],
+        'OpenRunSave': ['-OpenRunSave'],
+        'OpenRunSavePlots': ['-OpenRunSavePlots'],
+        'BuildFlowTwTable': Hy8Runner.get_build_flow_tw_table_arguments(),
+        'BuildHwTwTable': Hy8Runner.get_build_hw_tw_table_arguments(),
+    }
+
+    def __init__(self, projects=None, action='OpenRunSave', max_workers=None, hy8_exe_path='', timeout=None,
+                 retry_policy=None, results_cache=None, scratch_dir=None):
+        """Initializes the batch runner.
+
+        Args:
+            projects (list): HY-8 Runners, or paths to existing HY-8 files, to run.
+            action (string or list of strings): An action name from actions, or the command line arguments to pass.
+            max_workers (int): The most HY-8 processes to run at the same time; defaults to the number of CPUs.
+            hy8_exe_path (string): The path to the HY-8 executable, used for projects given as paths.
+            timeout (float): The seconds before each HY-8 run is killed; None waits for HY-8 to finish.
+            retry_policy (Hy8RunnerRetryPolicy): Decides which failed runs are tried again; None runs each once.
+            results_cache (Hy8RunnerResultsCache): The results cache used for projects given as paths.
+            scratch_dir (string): The directory for the run workspaces of projects given as paths; None runs them
+                next to their HY-8 files.
+        """
+        self.projects = []
+        self.action = action
+        self.max_workers = max_workers if max_workers else (os.cpu_count() or 1)
+        self.hy8_exe_path = hy8_exe_path
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.results_cache = results_cache
+        self.scratch_dir = scratch_dir
+        self.write_projects = True
+        self.environment = Hy8RunnerEnvironment()  # checks the executable once for the whole batch
+        self.job_callback = None  # called with the HY-8 Runner and the job result as each job finishes
+
+        for project in projects or []:
+            self.add_project(project)
+
+    def add_project(self, project):
+        """Add a project to the batch.
+
+        Args:
+            project (Hy8Runner or string): An HY-8 Runner, or the path to an existing HY-8 file.
+
+        Returns:
+            int: The index of the project in the batch.
+        """
+        self.projects.append(project)
+        return len(self.projects) - 1
+
+    def get_commandline_arguments(self):
+        """Return the command line arguments for the action of the batch.
+
+        Returns:
+            list of strings: The command line arguments.
+        """
+        if isinstance(self.action, str):
+            if self.action not in self.actions:
+                raise ValueError(f'Unknown HY-8 action: {self.action}')
+            return list(self.actions[self.action])
+        return list(self.action)
+
+    def run(self):
+        """Run every project of the batch.
+
+        Returns:
+            list of Hy8BatchJobResult: The job results, in the order of the projects.
+        """
+        commandline_arguments = self.get_commandline_arguments()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda project: self._run_job(project, commandline_arguments), self.projects))
+
+    async def run_async(self):
+        """Run every project of the batch from an event loop, with at most max_workers HY-8 processes at a time.
+
+        Returns:
+            list of Hy8BatchJobResult: The job results, in the order of the projects.
+        """
+        commandline_arguments = self.get_commandline_arguments()
+        semaphore = asyncio.Semaphore(self.max_workers)
+        return list(await asyncio.gather(*[self._run_job_async(project, commandline_arguments, semaphore)
+                                           for project in self.projects]))
+
+    def _get_hy8_runner(self, project):
+        """Return the HY-8 Runner for a project.
+
+        Args:
+            project (Hy8Runner or string): An HY-8 Runner, or the path to an existing HY-8 file.
+
+        Returns:
+            Hy8Runner: The HY-8 Runner.
+        """
+        if isinstance(project, Hy8Runner):
+            return project
+        hy8_runner = Hy8Runner(hy8_file=project)
+        hy8_runner.set_hy8_exe_path(self.hy8_exe_path)
+        hy8_runner.results_cache = self.results_cache
+        hy8_runner.scratch_dir = self.scratch_dir
+        return hy8_runner
+
+    def _write_project(self, project, job_result):
+        """Write the HY-8 file of a project given as an HY-8 Runner.
+
+        Args:
+            project (Hy8Runner or string): An HY-8 Runner, or the path to an existing HY-8 file.
+            job_result (Hy8BatchJobResult): The job result; its status is set to 'invalid' if the file is not written.
+
+        Returns:
+            bool: True if the project is ready to run.
+        """
+        if self.write_projects and isinstance(project, Hy8Runner):
+            result, messages = project.create_hy8_file(environment=self.environment)
+            if not result:
+                job_result.status = 'invalid'
+                job_result.messages = messages
+                return False
+        return True
+
+    @staticmethod
+    def _set_run_result(job_result, run_result):
+        """Copy the outcome of an HY-8 run to a job result.
+
+        Args:
+            job_result (Hy8BatchJobResult): The job result.
+            run_result (Hy8RunnerRunResult): The result of the HY-8 run.
+        """
+        job_result.run_result = run_result
+        job_result.returncode = run_result.returncode
+        job_result.status = run_result.status
+        if run_result.error:
+            job_result.messages = run_result.error
+        elif not run_result.succeeded:
+            job_result.messages = run_result.stderr
+
+    @staticmethod
+    def _set_error(job_result, error):
+        """Record an exception raised by a job in its job result.
+
+        Args:
+            job_result (Hy8BatchJobResult): The job result.
+            error (Exception): The exception.
+        """
+        job_result.status = 'error'
+        message = str(error) if isinstance(error, OSError) else f'{type(error).__name__}: {error}'
+        job_result.messages += message if not job_result.messages else f'\n{message}'
+
+    def _call_job_callback(self, hy8_runner, job_result):
+        """Call the job callback, recording an exception it raises in the job result.
+
+        Args:
+            hy8_runner (Hy8Runner): The HY-8 Runner of the job.
+            job_result (Hy8BatchJobResult): The job result.
+        """
+        if self.job_callback is None:
+            return
+        try:
+            self.job_callback(hy8_runner, job_result)
+        except Exception as error:
+            self._set_error(job_result, error)
+
+    def _run_job(self, project, commandline_arguments):
+        """Write (for HY-8 Runners) and run a single project.
+
+        Args:
+            project (Hy8Runner or string): An HY-8 Runner, or the path to an existing HY-8 file.
+            commandline_arguments (list of strings): The command line arguments to pass to HY-8.
+
+        Returns:
+            Hy8BatchJobResult: The job result.
+        """
+        hy8_runner = self._get_hy8_runner(project)
+        job_result = Hy8BatchJobResult(hy8_runner.hy8_file, self.action)
+        start = time.perf_counter()
+        try:
+            if self._write_project(project, job_result):
+                run_result = hy8_runner.run_hy8_executable(commandline_arguments, self.timeout, self.retry_policy)
+                self._set_run_result(job_result, run_result)
+        except Exception as error:  # one project that can not be written or run does not stop the batch
+            self._set_error(job_result, error)
+        job_result.elapsed = time.perf_counter() - start
+        self._call_job_callback(hy8_runner, job_result)
+        return job_result
+
+    async def _run_job_async(self, project, commandline_arguments, semaphore):
+        """Write (for HY-8 Runners) and run a single project without blocking the event loop.
+
+        Args:
+            project (Hy8Runner or string): An HY-8 Runner, or the path to an existing HY-8 file.
+            commandline_arguments (list of strings): The command line arguments to pass to HY-8.
+            semaphore (asyncio.Semaphore): Limits the concurrent jobs, and so the concurrent HY-8 processes.
+
+        Returns:
+            Hy8BatchJobResult: The job result.
+        """
+        hy8_runner = self._get_hy8_runner(project)
+        job_result = Hy8BatchJobResult(hy8_runner.hy8_file, self.action)
+        async with semaphore:
+            # Like a worker thread of run, the job holds its slot from writing the project to the end of the run, so
+            # the elapsed time does not count the time the job waited for a slot
+            start = time.perf_counter()
+            try:
+                if await asyncio.to_thread(self._write_project, project, job_result):
+                    run_result = await hy8_runner.run_hy8_executable_async(commandline_arguments,
+                                                                            contextlib.nullcontext(), self.timeout,
+                                                                            self.retry_policy)
+                    self._set_run_result(job_result, run_result)
+            except Exception as error:  # one project that can not be written or run does not stop the batch
+                self._set_error(job_result, error)
+            job_result.elapsed = time.perf_counter() - start
+        self._call_job_callback(hy8_runner, job_result)
+        return job_result
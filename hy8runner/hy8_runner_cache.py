@@ -0,0 +1,238 @@
+"""HY-8 results cache that stores the output files of HY-8 runs on disk, keyed by the content of the run."""
+# 1. Standard python modules
+import hashlib
+import os
+import re
+import shutil
+import threading
+import uuid
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_run_result import get_output_suffix
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerResultsCache']
+
+_PROJDATE = re.compile(rb'^[ \t]*PROJDATE\b[^\n]*\n?', re.MULTILINE)
+
+
+class Hy8RunnerResultsCache():
+    """An on-disk cache of the files that HY-8 writes next to an HY-8 file (rst, rsql, plt, tables, and so on).
+
+    The key of a run is a hash of the HY-8 file without its PROJDATE card (the time the file was written), the
+    command line arguments, and a fingerprint of the HY-8 executable. Each entry is a directory named by its key;
+    the least recently used entries are removed when the cache grows beyond max_size bytes. The size of the cache
+    is scanned once and then kept as a running total, so storing a run does not stat every entry; entries stored or
+    removed by another process sharing the directory are counted at the next eviction.
+    """
+
+    manifest_name = 'manifest.txt'
+
+    def __init__(self, cache_dir, max_size=1024 ** 3):
+        """Initializes the results cache.
+
+        Args:
+            cache_dir (string): The directory that holds the cache entries.
+            max_size (int): The most bytes the entries may use before the least recently used are removed.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._size = None  # the bytes used by the entries, or None until the cache directory is scanned
+        self._fingerprints = {}  # executable path to (modified time, size, fingerprint)
+
+    @staticmethod
+    def get_project_key_text(hy8_file):
+        """Return the contents of an HY-8 file without the PROJDATE card.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file.
+
+        Returns:
+            bytes: The canonical contents of the file.
+        """
+        with open(hy8_file, 'rb') as file:
+            return _PROJDATE.sub(b'', file.read().replace(b'\r\n', b'\n'))
+
+    def get_executable_fingerprint(self, hy8_exe):
+        """Return a hash of the contents of the HY-8 executable, computed once per version of the file.
+
+        Args:
+            hy8_exe (string): The path to the HY-8 executable.
+
+        Returns:
+            string: The fingerprint.
+        """
+        stat = os.stat(hy8_exe)
+        path = os.path.realpath(hy8_exe)
+        cached = self._fingerprints.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        sha = hashlib.sha256()
+        with open(hy8_exe, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                sha.update(chunk)
+        fingerprint = sha.hexdigest()
+        self._fingerprints[path] = (stat.st_mtime_ns, stat.st_size, fingerprint)
+        return fingerprint
+
+    def get_key(self, hy8_file, command):
+        """Return the cache key of a run.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file.
+            command (list of strings): The executable, the command line arguments, and the HY-8 file.
+
+        Returns:
+            string: The key.
+        """
+        sha = hashlib.sha256()
+        sha.update(self.get_project_key_text(hy8_file))
+        for argument in command[1:-1]:
+            sha.update(b'\0' + argument.encode())
+        sha.update(b'\0' + self.get_executable_fingerprint(command[0]).encode())
+        return sha.hexdigest()
+
+    def restore(self, key, hy8_file, artifacts=None):
+        """Copy the output files of a cached run next to an HY-8 file.
+
+        Every file is copied to a temporary file first, and the output files are replaced only once all of them
+        are copied, so an entry that is missing a file (being evicted, for example) is a miss that changes nothing.
+
+        Args:
+            key (string): The cache key of the run.
+            hy8_file (string): The path to the HY-8 file.
+            artifacts (list of strings): The endings of the output files to restore; None restores every file.
+
+        Returns:
+            list of strings: The restored files, or None if the run is not in the cache.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        manifest = os.path.join(entry_dir, self.manifest_name)
+        stem = os.path.splitext(hy8_file)[0]
+        copies = []  # the temporary copy and the output file of each restored file
+        try:
+            with open(manifest) as file:
+                suffixes = [line.rstrip('\n') for line in file if line.strip()]
+            for index, suffix in enumerate(suffixes):
+                output_file = stem + suffix
+                if get_output_suffix(output_file, hy8_file) is None:
+                    continue  # not an output file of this HY-8 file
+                if artifacts is not None and not suffix.lower().endswith(tuple([a.lower() for a in artifacts])):
+                    continue
+                temp_file = f'{output_file}.{uuid.uuid4().hex}.tmp'
+                copies.append((temp_file, output_file))
+                shutil.copyfile(os.path.join(entry_dir, str(index)), temp_file)
+            os.utime(manifest)  # the manifest time orders the entries for eviction
+        except OSError:  # the entry is missing or incomplete
+            for temp_file, _ in copies:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+            with self._lock:
+                self.misses += 1
+            return None
+        for temp_file, output_file in copies:
+            os.replace(temp_file, output_file)
+        with self._lock:
+            self.hits += 1
+        return sorted([output_file for _, output_file in copies])
+
+    def store(self, key, hy8_file, output_files):
+        """Copy the output files of a run into the cache.
+
+        Args:
+            key (string): The cache key of the run.
+            hy8_file (string): The path to the HY-8 file.
+            output_files (list of strings): The files that the run wrote next to the HY-8 file; files of other HY-8
+                files (see get_output_suffix) are not stored.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_dir = os.path.join(self.cache_dir, f'.{key}.{uuid.uuid4().hex}')
+        os.makedirs(temp_dir)
+        try:
+            suffixes = []
+            for output_file in output_files:
+                suffix = get_output_suffix(output_file, hy8_file)
+                if suffix is None:
+                    continue
+                shutil.copyfile(output_file, os.path.join(temp_dir, str(len(suffixes))))
+                suffixes.append(suffix)
+            with open(os.path.join(temp_dir, self.manifest_name), 'w') as file:
+                file.write(''.join([f'{suffix}\n' for suffix in suffixes]))
+            entry_size = self._get_entry_size(temp_dir)
+            os.replace(temp_dir, os.path.join(self.cache_dir, key))
+        except OSError:  # another run stored the same key first
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum([size for _, _, size in self._scan_entries()])
+            else:
+                self._size += entry_size
+            too_large = self._size > self.max_size
+        if too_large:
+            self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in max_size bytes."""
+        with self._lock:
+            entries = []
+            total_size = 0
+            for entry_dir, last_used, size in self._scan_entries():
+                entries.append((last_used, entry_dir, size))
+                total_size += size
+            entries.sort()
+            for _, entry_dir, size in entries:
+                if total_size <= self.max_size:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total_size -= size
+                self.evictions += 1
+            self._size = total_size
+
+    def clear(self):
+        """Remove every entry of the cache."""
+        with self._lock:
+            for entry_dir, _, _ in self._scan_entries():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            self._size = 0
+
+    @property
+    def size(self):
+        """Return the bytes used by the entries of the cache, from the running total once it is known."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum([size for _, _, size in self._scan_entries()])
+            return self._size
+
+    @staticmethod
+    def _get_entry_size(entry_dir):
+        """Return the bytes used by the files of one entry."""
+        return sum([file.stat().st_size for file in os.scandir(entry_dir) if file.is_file()])
+
+    def _scan_entries(self):
+        """Yield the directory, last use time, and size in bytes of each entry of the cache."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+                try:
+                    last_used = os.stat(os.path.join(entry.path, self.manifest_name)).st_mtime_ns
+                    size = self._get_entry_size(entry.path)
+                except FileNotFoundError:
+                    continue
+                yield entry.path, last_used, size
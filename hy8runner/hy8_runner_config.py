@@ -0,0 +1,80 @@
+"""HY-8 Runner configuration that holds the executable, version, and unit settings of one runner."""
+# 1. Standard python modules
+import dataclasses
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerConfig', 'Hy8RunnerConfigField', 'Hy8RunnerConfigMeta']
+
+
+@dataclasses.dataclass(frozen=True)
+class Hy8RunnerConfig():
+    """The settings of an HY-8 Runner that used to be shared by every runner.
+
+    A config can not be changed once it is created, so runners in different threads can share one safely; use
+    replace to make a copy with different settings.
+    """
+
+    hy8_exe_path: str = ''
+    hy8_basename_exe: str = 'HY864.exe'
+    version: float = 80.0
+    si_units: bool = False
+    exit_loss_option: int = 0  # 0 for standard or 1 for USU
+
+    def replace(self, **changes):
+        """Return a copy of the config with some settings changed.
+
+        Args:
+            changes (dict): The settings to change, by name.
+
+        Returns:
+            Hy8RunnerConfig: The new config.
+        """
+        return dataclasses.replace(self, **changes)
+
+
+class Hy8RunnerConfigField():
+    """A runner attribute that reads and writes one setting of the config of the runner.
+
+    Read from the class, it gives the setting of the shared default config. Set on a runner, it replaces the config
+    of that runner only; set on the class, Hy8RunnerConfigMeta replaces the default config.
+    """
+
+    def __set_name__(self, owner, name):
+        """Remember the name of the setting."""
+        self.name = name
+
+    def __get__(self, instance, owner):
+        """Return the setting from the config of the runner, or from the default config."""
+        if instance is None:
+            return getattr(owner.default_config, self.name)
+        return getattr(instance.config, self.name)
+
+    def __set__(self, instance, value):
+        """Replace the config of the runner with one that has the new setting."""
+        instance.config = instance.config.replace(**{self.name: value})
+
+
+class Hy8RunnerConfigMeta(type):
+    """The metaclass of a runner class, so setting a config field on the class changes its default config.
+
+    Without it, Hy8Runner.si_units = True would replace the field with a plain value, and a runner's si_units would no
+    longer agree with its config. Runners created after the change use the new default config.
+    """
+
+    def __setattr__(cls, name, value):
+        """Replace the default config when name is a config field; otherwise set the class attribute."""
+        for klass in cls.__mro__:
+            if isinstance(klass.__dict__.get(name), Hy8RunnerConfigField):
+                cls.default_config = cls.default_config.replace(**{name: value})
+                return
+        super().__setattr__(name, value)
@@ -6,8 +6,10 @@
 # 3. Aquaveo modules
 
 # 4. Local modules
-from hy8runner.hy8_runner_flow import Hy8RunnerFlow
+from hy8runner.hy8_runner_arrays import to_float_array
 from hy8runner.hy8_runner_culvert import Hy8RunnerCulvertBarrel
+from hy8runner.hy8_runner_flow import Hy8RunnerFlow
+from hy8runner.hy8_runner_revision import Hy8RunnerRevisioned
 
 __copyright__ = "(C) Copyright Aquaveo 2024"
 __license__ = "All rights reserved"
@@ -15,11 +17,21 @@ __license__ = "All rights reserved"
 # FHWA will not be providing any technical supporting, funding or maintenance.
 
 
-class Hy8RunnerCulvertCrossing():
-    """A class that will create an HY-8 file and run HY-8."""
+class Hy8RunnerCulvertCrossing(Hy8RunnerRevisioned):
+    """A class that will create an HY-8 file and run HY-8.
+
+    The roadway stations and elevations are stored as arrays of floats and the attributes are slots, so a large
+    inventory of crossings stays compact; see benchmarks/bench_hy8_runner_memory.py.
+    """
+
+    __slots__ = ('name', 'notes', 'flow', 'tw_type', 'tw_bottom_width', 'tw_sideslope', 'tw_channel_slope',
+                 'tw_manning_n', 'tw_constant_elevation', 'tw_invert_elevation', 'tw_rating_curve', 'roadway_shape',
+                 'roadway_width', '_roadway_stations', '_roadway_elevations', 'roadway_surface', 'culverts', 'uuid',
+                 '_crossing_index')
 
     def __init__(self, count):
         """Initializes the HY-8 Runner class."""
+        object.__setattr__(self, '_crossing_index', None)  # the index that finds the crossing by name or UUID
         self.name = f'Crossing {count+1}'
         self.notes = ''
 
@@ -44,6 +56,75 @@ class Hy8RunnerCulvertCrossing():
 
         self.uuid = None
 
+    def __setattr__(self, name, value):
+        """Set the attribute, and move the crossing in its crossing index if it is the name or UUID."""
+        if name in ('name', 'uuid'):
+            crossing_index = getattr(self, '_crossing_index', None)
+            if crossing_index is not None:
+                crossing_index.update_key(self, name, getattr(self, name, None), value)
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        """Pickle and copy the crossing without the crossing index of the runner that holds it."""
+        names = [name for name in self.__slots__ + Hy8RunnerRevisioned.__slots__ if name != '_crossing_index']
+        return None, {name: getattr(self, name) for name in names if hasattr(self, name)}
+
+    @property
+    def crossing_index(self):
+        """Return the Hy8RunnerCrossingIndex that finds the crossing by name or UUID, or None."""
+        return getattr(self, '_crossing_index', None)
+
+    def set_crossing_index(self, crossing_index):
+        """Set the crossing index to tell when the name or UUID is set.
+
+        Args:
+            crossing_index (Hy8RunnerCrossingIndex): The index, or None.
+        """
+        object.__setattr__(self, '_crossing_index', crossing_index)
+
+    @property
+    def roadway_stations(self):
+        """Return the roadway stations, stored as an array of floats."""
+        return self._roadway_stations
+
+    @roadway_stations.setter
+    def roadway_stations(self, roadway_stations):
+        """Set the roadway stations."""
+        self._roadway_stations = to_float_array(roadway_stations)
+
+    @property
+    def roadway_elevations(self):
+        """Return the roadway elevations, stored as an array of floats."""
+        return self._roadway_elevations
+
+    @roadway_elevations.setter
+    def roadway_elevations(self, roadway_elevations):
+        """Set the roadway elevations."""
+        self._roadway_elevations = to_float_array(roadway_elevations)
+
+    @property
+    def guid(self):
+        """Return the crossing GUID (the same as uuid)."""
+        return self.uuid
+
+    @guid.setter
+    def guid(self, guid):
+        """Set the crossing GUID (the same as uuid)."""
+        self.uuid = guid
+
+    def get_signature(self):
+        """Return a value that changes whenever the crossing block of the HY-8 file may change.
+
+        The signature is made of the revisions of the crossing, its flow, and its culvert barrels, and the lengths
+        of its lists, so appending to a list is noticed too. Call mark_modified after changing a value in place.
+
+        Returns:
+            tuple: The signature.
+        """
+        return (self._revision, self.flow._revision, tuple([culvert._revision for culvert in self.culverts]),
+                len(self.flow.flow_list), len(self._roadway_stations), len(self._roadway_elevations),
+                len(self.tw_rating_curve))
+
     def write_crossing_to_file(self, hy8_file):
         """Write the crossing data to the file.
 
@@ -57,85 +138,135 @@ class Hy8RunnerCulvertCrossing():
         messages = ''
         result = True
 
-        hy8_file.write(f'STARTCROSSING   "{self.name}"\n')
-        # Placeholders
-        # hy8_file.write(f'LATITUDE {self.lattitude}\n')
-        # hy8_file.write(f'LONGITUDE    {self.longitude}\n')
-        # hy8_file.write(f'EXISTINGCROSSING {self.existing_crossing}\n')
-        # hy8_file.write(f'DISTRICT {self.district}\n')
-        # hy8_file.write(f'ADDRESS  {self.address}\n')
-        # hy8_file.write(f'COUNTY   {self.county}\n')
-        # hy8_file.write(f'CITY {self.city}\n')
-        # hy8_file.write(f'STATE    {self.state}\n')
-        # hy8_file.write(f'ZIP  {self.zip}\n')
-
-        hy8_file.write(f'STARTCROSSNOTES    "{self.notes}"\n')
-
-        # Discharge
-        self.flow.compute_list()
-        discharge_method = 0
-        if self.flow.method != 'min-design-max':
-            discharge_method = 1
-        # Recurrence Flow not currently supported
-        hy8_file.write(f'DISCHARGERANGE {self.flow.flow_min} {self.flow.flow_design} {self.flow.flow_max}\n')
-        hy8_file.write(f'DISCHARGEMETHOD {discharge_method}\n')
-        hy8_file.write(f'DISCHARGEXYUSER {len(self.flow.flow_list)}\n')
-        for flow in self.flow.flow_list:
-            hy8_file.write(f'DISCHARGEXYUSER_Y {flow}\n')
-
-        # Tailwater
-        # 1 for rectangular, 2 for trapezoidal, 3 for triangle, 4 for irregular, 5 for rating curve, 6 for constant tw
-        channel_type = self.tw_type
-        hy8_file.write(f'TAILWATERTYPE {channel_type}\n')
-        hy8_file.write(f'CHANNELGEOMETRY {self.tw_bottom_width} {self.tw_sideslope} {self.tw_channel_slope} '
-                       f'{self.tw_manning_n} {self.tw_invert_elevation}\n')
-        tw_list = [self.tw_constant_elevation] * 6
-        vel = 0.0
-        shear = 0.0
-        froude = 0.0
-        hy8_file.write(f'NUMRATINGCURVE {len(tw_list)}\n')
-        hy8_file.write(f'TWRATINGCURVE {tw_list[0]} {vel} {shear} {froude}\n')
-        for tw in tw_list:
-            hy8_file.write(f'              {tw} {vel} {shear} {froude}\n')
-        # hy8_file.write(f'IRREGTWCHANNELPTS {num_channel_pts}\n')
-        # hy8_file.write(f'IRREGTWCOORDS {station} {elevation} {self.tw_manning_n}\n')
-        # for channel_pt in channel_pts:
-        #     hy8_file.write(f'              {station} {elevation} {self.tw_manning_n}\n')
-        # Additonal rating curve data
-        size = len(self.tw_rating_curve)
-        if size > 0:
-            hy8_file.write('RATINGCURVE\n')
-            hy8_file.write(f'NUMPOINTS {size}\n')
-            for index in range(size):
-                hy8_file.write(f'\tFLOW {self.tw_rating_curve[index][0]}\n')
-                hy8_file.write(f'\tELEVATION {self.tw_rating_curve[index][1]}\n')
-                hy8_file.write(f'\tVELOCITY {self.tw_rating_curve[index][2]}\n')
-            hy8_file.write('END RATINGCURVE\n')
-
-        # Roadway Data
-        surface_index = 1
-        if self.roadway_surface == 'gravel':
-            surface_index = 2
-        elif self.roadway_surface == 'user-defined':
-            surface_index = 3
-        hy8_file.write(f'ROADWAYSHAPE {self.roadway_shape}\n')
-        hy8_file.write(f'ROADWIDTH {self.roadway_width}\n')
-        # hy8_file.write(f'WEIRCOEFF {self.weir_coeff}\n')
-        hy8_file.write(f'SURFACE {surface_index}\n')
-        hy8_file.write(f'NUMSTATIONS {len(self.roadway_stations)}\n')
-        roadway_cardname = 'ROADWAYSECDATA'
-        for station, elevation in zip(self.roadway_stations, self.roadway_elevations):
-            hy8_file.write(f'{roadway_cardname} {station} {elevation}\n')
-            roadway_cardname = 'ROADWAYPOINT'
-
-        # Culvert Data
-        hy8_file.write(f'NUMCULVERTS  {len(self.culverts)}\n')
-
-        for culvert in self.culverts:
-            culvert.write_culvert_to_file(hy8_file)
-
-        if self.uuid is not None:
-            hy8_file.write('CROSSGUID            {self.uuid}\n')
-        hy8_file.write('ENDCROSSING\n')
+        hy8_file.write(self.to_hy8_string())
 
         return result, messages
+
+    def to_hy8_string(self):
+        """Build the crossing block of the HY-8 file in memory.
+
+        Returns:
+            string: The crossing cards, from STARTCROSSING to ENDCROSSING.
+        """
+        self.flow.compute_list()
+        return get_crossing_string(self.name, self.notes, self.flow.method, self.flow.flow_min, self.flow.flow_design,
+                                   self.flow.flow_max, self.flow.flow_list, self.tw_type, self.tw_bottom_width,
+                                   self.tw_sideslope, self.tw_channel_slope, self.tw_manning_n,
+                                   self.tw_constant_elevation, self.tw_invert_elevation, self.tw_rating_curve,
+                                   self.roadway_shape, self.roadway_width, self.roadway_surface, self.roadway_stations,
+                                   self.roadway_elevations, [culvert.to_hy8_string() for culvert in self.culverts],
+                                   self.uuid)
+
+
+def get_crossing_string(name, notes, flow_method, flow_min, flow_design, flow_max, flows, tw_type, tw_bottom_width,
+                        tw_sideslope, tw_channel_slope, tw_manning_n, tw_constant_elevation, tw_invert_elevation,
+                        tw_rating_curve, roadway_shape, roadway_width, roadway_surface, roadway_stations,
+                        roadway_elevations, culvert_strings, uuid):
+    """Build the crossing block of the HY-8 file from the values of a crossing.
+
+    Hy8RunnerCulvertCrossing.to_hy8_string and Hy8CrossingTable both write their crossings with this function. The
+    block is assembled as a list of lines and joined once, so a crossing with long flow lists or dense roadway
+    profiles costs a single write.
+
+    Args:
+        name (string): The crossing name.
+        notes (string): The crossing notes.
+        flow_method (string): The flow method of Hy8RunnerFlow.
+        flow_min (float): The minimum flow.
+        flow_design (float): The design flow.
+        flow_max (float): The maximum flow.
+        flows (list of floats): The flows to run.
+        tw_type (int): The tailwater type.
+        tw_bottom_width (float): The tailwater channel bottom width.
+        tw_sideslope (float): The tailwater channel side slope.
+        tw_channel_slope (float): The tailwater channel slope.
+        tw_manning_n (float): The tailwater channel Manning's n.
+        tw_constant_elevation (float): The constant tailwater elevation.
+        tw_invert_elevation (float): The tailwater channel invert elevation.
+        tw_rating_curve (list): The tailwater rating curve, as (flow, elevation, velocity) points.
+        roadway_shape (int): The roadway shape.
+        roadway_width (float): The roadway width.
+        roadway_surface (string): 'paved', 'gravel', or 'user-defined'.
+        roadway_stations (list of floats): The roadway stations.
+        roadway_elevations (list of floats): The roadway elevations.
+        culvert_strings (list of strings): The culvert blocks, from get_culvert_string.
+        uuid (string): The crossing UUID, or None.
+
+    Returns:
+        string: The crossing cards, from STARTCROSSING to ENDCROSSING.
+    """
+    lines = [f'STARTCROSSING   "{name}"\n']
+    # Placeholders
+    # lines.append(f'LATITUDE {lattitude}\n')
+    # lines.append(f'LONGITUDE    {longitude}\n')
+    # lines.append(f'EXISTINGCROSSING {existing_crossing}\n')
+    # lines.append(f'DISTRICT {district}\n')
+    # lines.append(f'ADDRESS  {address}\n')
+    # lines.append(f'COUNTY   {county}\n')
+    # lines.append(f'CITY {city}\n')
+    # lines.append(f'STATE    {state}\n')
+    # lines.append(f'ZIP  {zip}\n')
+
+    lines.append(f'STARTCROSSNOTES    "{notes}"\n')
+
+    # Discharge
+    discharge_method = 0
+    if flow_method != 'min-design-max':
+        discharge_method = 1
+    # Recurrence Flow not currently supported
+    lines.append(f'DISCHARGERANGE {flow_min} {flow_design} {flow_max}\n')
+    lines.append(f'DISCHARGEMETHOD {discharge_method}\n')
+    lines.append(f'DISCHARGEXYUSER {len(flows)}\n')
+    lines.extend([f'DISCHARGEXYUSER_Y {flow}\n' for flow in flows])
+
+    # Tailwater
+    # 1 for rectangular, 2 for trapezoidal, 3 for triangle, 4 for irregular, 5 for rating curve, 6 for constant tw
+    channel_type = tw_type
+    lines.append(f'TAILWATERTYPE {channel_type}\n')
+    lines.append(f'CHANNELGEOMETRY {tw_bottom_width} {tw_sideslope} {tw_channel_slope} '
+                 f'{tw_manning_n} {tw_invert_elevation}\n')
+    tw_list = [tw_constant_elevation] * 6
+    vel = 0.0
+    shear = 0.0
+    froude = 0.0
+    lines.append(f'NUMRATINGCURVE {len(tw_list)}\n')
+    lines.append(f'TWRATINGCURVE {tw_list[0]} {vel} {shear} {froude}\n')
+    lines.extend([f'              {tw} {vel} {shear} {froude}\n' for tw in tw_list])
+    # lines.append(f'IRREGTWCHANNELPTS {num_channel_pts}\n')
+    # lines.append(f'IRREGTWCOORDS {station} {elevation} {tw_manning_n}\n')
+    # for channel_pt in channel_pts:
+    #     lines.append(f'              {station} {elevation} {tw_manning_n}\n')
+    # Additonal rating curve data
+    size = len(tw_rating_curve)
+    if size > 0:
+        lines.append('RATINGCURVE\n')
+        lines.append(f'NUMPOINTS {size}\n')
+        lines.extend([f'\tFLOW {point[0]}\n\tELEVATION {point[1]}\n\tVELOCITY {point[2]}\n'
+                      for point in tw_rating_curve])
+        lines.append('END RATINGCURVE\n')
+
+    # Roadway Data
+    surface_index = 1
+    if roadway_surface == 'gravel':
+        surface_index = 2
+    elif roadway_surface == 'user-defined':
+        surface_index = 3
+    lines.append(f'ROADWAYSHAPE {roadway_shape}\n')
+    lines.append(f'ROADWIDTH {roadway_width}\n')
+    # lines.append(f'WEIRCOEFF {weir_coeff}\n')
+    lines.append(f'SURFACE {surface_index}\n')
+    lines.append(f'NUMSTATIONS {len(roadway_stations)}\n')
+    roadway_cardname = 'ROADWAYSECDATA'
+    for station, elevation in zip(roadway_stations, roadway_elevations):
+        lines.append(f'{roadway_cardname} {station} {elevation}\n')
+        roadway_cardname = 'ROADWAYPOINT'
+
+    # Culvert Data
+    lines.append(f'NUMCULVERTS  {len(culvert_strings)}\n')
+    lines.extend(culvert_strings)
+
+    if uuid is not None:
+        lines.append(f'CROSSGUID            {uuid}\n')
+    lines.append('ENDCROSSING\n')
+
+    return ''.join(lines)
@@ -6,6 +6,7 @@
 # 3. Aquaveo modules
 
 # 4. Local modules
+from hy8runner.hy8_runner_revision import Hy8RunnerRevisioned
 
 __copyright__ = "(C) Copyright Aquaveo 2024"
 __license__ = "All rights reserved"
@@ -13,9 +14,12 @@ __license__ = "All rights reserved"
 # FHWA will not be providing any technical supporting, funding or maintenance.
 
 
-class Hy8RunnerCulvertBarrel():
+class Hy8RunnerCulvertBarrel(Hy8RunnerRevisioned):
     """A class that will create an HY-8 file and run HY-8."""
 
+    __slots__ = ('name', 'notes', 'shape', 'material', 'span', 'rise', 'inlet_invert_elevation', 'inlet_invert_station',
+                 'outlet_invert_elevation', 'outlet_invert_station', 'number_of_barrels')
+
     def __init__(self, count):
         """Initializes the HY-8 Runner class."""
         self.name = f'Culvert {count+1}'
@@ -46,40 +50,72 @@ class Hy8RunnerCulvertBarrel():
         messages = ''
         result = True
 
-        hy8_file.write(f'STARTCULVERT    "{self.name}"\n')
-
-        # Barrel data
-        culvert_shape = 1
-        culvert_material = 1
-        if self.material == 'corrugated steel':
-            culvert_material = 2
-        if self.shape == 'box':
-            culvert_shape = 2
-            culvert_material = 1  # boxes must be concrete (0)
-
-        n_top = 0.012
-        n_bot = 0.012
-        if culvert_material == 2:
-            n_top = 0.024
-            n_bot = 0.024
-        hy8_file.write(f'CULVERTSHAPE    {culvert_shape}\n')
-        hy8_file.write(f'CULVERTMATERIAL {culvert_material}\n')
-        hy8_file.write(f'BARRELDATA  {self.span} {self.rise} {n_top} {n_bot}\n')
-
-        # Site Data
-        hy8_file.write('EMBANKMENTTYPE 2\n')
-        hy8_file.write(f'NUMBEROFBARRELS {self.number_of_barrels}\n')
-        hy8_file.write(f'INVERTDATA {self.inlet_invert_station} {self.inlet_invert_elevation} '
-                       f'{self.outlet_invert_station} {self.outlet_invert_elevation}\n')
-
-        # Optional for plotting front view
-        self.roadway_station = 0.0
-        hy8_file.write(f'ROADCULVSTATION {self.roadway_station}\n')
-        self.barrel_spacing = 1.5 * self.span
-        hy8_file.write(f'BARRELSPACING {self.barrel_spacing}\n')
-
-        hy8_file.write(f'STARTCULVNOTES "{self.notes}"\nENDCULVNOTES\n')
-
-        hy8_file.write('ENDCULVERT\n')
+        hy8_file.write(self.to_hy8_string())
 
         return result, messages
+
+    def to_hy8_string(self):
+        """Build the culvert block of the HY-8 file in memory.
+
+        Returns:
+            string: The culvert cards, from STARTCULVERT to ENDCULVERT.
+        """
+        return get_culvert_string(self.name, self.notes, self.shape, self.material, self.span, self.rise,
+                                  self.number_of_barrels, self.inlet_invert_station, self.inlet_invert_elevation,
+                                  self.outlet_invert_station, self.outlet_invert_elevation)
+
+
+def get_culvert_string(name, notes, shape, material, span, rise, number_of_barrels, inlet_invert_station,
+                       inlet_invert_elevation, outlet_invert_station, outlet_invert_elevation):
+    """Build the culvert block of the HY-8 file from the values of a culvert barrel.
+
+    Hy8RunnerCulvertBarrel.to_hy8_string and Hy8CrossingTable both write their culverts with this function.
+
+    Args:
+        name (string): The culvert name.
+        notes (string): The culvert notes.
+        shape (string): 'circle' or 'box'.
+        material (string): 'concrete' or 'corrugated steel'.
+        span (float): The barrel span.
+        rise (float): The barrel rise.
+        number_of_barrels (int): The number of barrels.
+        inlet_invert_station (float): The inlet invert station.
+        inlet_invert_elevation (float): The inlet invert elevation.
+        outlet_invert_station (float): The outlet invert station.
+        outlet_invert_elevation (float): The outlet invert elevation.
+
+    Returns:
+        string: The culvert cards, from STARTCULVERT to ENDCULVERT.
+    """
+    # Barrel data
+    culvert_shape = 1
+    culvert_material = 1
+    if material == 'corrugated steel':
+        culvert_material = 2
+    if shape == 'box':
+        culvert_shape = 2
+        culvert_material = 1  # boxes must be concrete (0)
+
+    n_top = 0.012
+    n_bot = 0.012
+    if culvert_material == 2:
+        n_top = 0.024
+        n_bot = 0.024
+
+    # Optional for plotting front view
+    roadway_station = 0.0
+    barrel_spacing = 1.5 * span
+
+    return (f'STARTCULVERT    "{name}"\n'
+            f'CULVERTSHAPE    {culvert_shape}\n'
+            f'CULVERTMATERIAL {culvert_material}\n'
+            f'BARRELDATA  {span} {rise} {n_top} {n_bot}\n'
+            # Site Data
+            'EMBANKMENTTYPE 2\n'
+            f'NUMBEROFBARRELS {number_of_barrels}\n'
+            f'INVERTDATA {inlet_invert_station} {inlet_invert_elevation} '
+            f'{outlet_invert_station} {outlet_invert_elevation}\n'
+            f'ROADCULVSTATION {roadway_station}\n'
+            f'BARRELSPACING {barrel_spacing}\n'
+            f'STARTCULVNOTES "{notes}"\nENDCULVNOTES\n'
+            'ENDCULVERT\n')
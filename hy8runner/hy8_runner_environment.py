@@ -0,0 +1,120 @@
+"""HY-8 environment checks that are kept apart from the in-memory validation of the crossings."""
+# 1. Standard python modules
+import mmap
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerEnvironment']
+
+# The FileVersion entry of the version resource of a Windows executable, in UTF-16
+_FILE_VERSION_KEY = 'FileVersion\0'.encode('utf-16-le')
+
+
+class Hy8RunnerEnvironment():
+    """Checks of the files an HY-8 run needs, none of which change the files they check.
+
+    Whether the HY-8 executable exists, and its version, are looked up once per executable path and kept, so one
+    environment shared by a batch (or by the repeated validations of a design loop) checks the executable once.
+    Call clear after installing or replacing HY-8. Creating the directory of the HY-8 file is a separate, explicit
+    step (prepare_output_directory).
+    """
+
+    def __init__(self):
+        """Initializes the environment checks."""
+        self._executables = {}  # executable path to (exists, version)
+
+    def clear(self):
+        """Forget the executable checks, so they are made again."""
+        self._executables.clear()
+
+    def check_executable(self, hy8_exe):
+        """Return whether the HY-8 executable exists, and its version, checking each path only once.
+
+        Args:
+            hy8_exe (string): The path to the HY-8 executable.
+
+        Returns:
+            bool: True if the executable exists.
+            string: The file version of the executable, or None if it does not exist or has no version resource.
+        """
+        cached = self._executables.get(hy8_exe)
+        if cached is not None:
+            return cached
+        exists = os.path.isfile(hy8_exe)
+        version = self.get_executable_version(hy8_exe) if exists else None
+        self._executables[hy8_exe] = (exists, version)
+        return exists, version
+
+    @staticmethod
+    def get_executable_version(hy8_exe):
+        """Read the FileVersion of a Windows executable from its version resource.
+
+        Args:
+            hy8_exe (string): The path to the executable.
+
+        Returns:
+            string: The version, for example '8.0.1.0'; None if the file has no version resource.
+        """
+        try:
+            with open(hy8_exe, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    position = data.rfind(_FILE_VERSION_KEY)
+                    if position < 0:
+                        return None
+                    position += len(_FILE_VERSION_KEY)
+                    position += -position % 4  # the value starts on a 32-bit boundary
+                    end = position
+                    while end + 1 < len(data) and data[end:end + 2] != b'\0\0':
+                        end += 2
+                    return data[position:end].decode('utf-16-le', errors='replace').strip() or None
+        except OSError:
+            return None
+
+    @staticmethod
+    def check_output_file(hy8_file, overwrite=True):
+        """Check that an HY-8 file can be written, without creating, truncating, or changing it.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file.
+            overwrite (bool): Whether an existing file may be replaced.
+
+        Returns:
+            bool: True if the file can be written.
+            string: The error message if it can not.
+        """
+        if hy8_file == '':
+            return False, 'HY-8 file must be specified.\n'
+        if not os.path.exists(hy8_file):
+            return True, ''
+        if not overwrite:
+            return False, f'HY-8 file already exists: {hy8_file}\n'
+        try:
+            # Opening to append fails if another process holds the file, but leaves its contents alone
+            file_descriptor = os.open(hy8_file, os.O_WRONLY | os.O_APPEND)
+            os.close(file_descriptor)
+        except OSError:
+            return False, f"File '{hy8_file}' is locked.\n"
+        return True, ''
+
+    @staticmethod
+    def prepare_output_directory(hy8_file):
+        """Create the directory of an HY-8 file if it does not exist.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file.
+        """
+        directory = os.path.dirname(hy8_file)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
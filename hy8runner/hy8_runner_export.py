@@ -0,0 +1,243 @@
+"""HY-8 results exporter that appends parsed results to Parquet, Arrow, or compressed CSV files as jobs finish."""
+# 1. Standard python modules
+from array import array
+import csv
+import gzip
+import math
+import threading
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerResultsExporter']
+
+
+class Hy8RunnerResultsExporter():
+    """Writes the rows of Hy8RunnerResults to one file, a chunk of rows at a time.
+
+    Each row is one flow of one crossing: the source rst file, the index and name of the crossing, the flow,
+    headwater, tailwater, control type, outlet velocity, overtopping flow, and freeboard (the lowest roadway
+    elevation of the crossing minus the headwater; NaN when the crossing is not given). Rows are buffered in typed
+    arrays and written every chunk_rows rows, as a row group (Parquet), a record batch (Arrow), or lines (CSV), so
+    memory is bounded by the chunk size and not by the length of the run.
+
+    Parquet and Arrow files need pyarrow. A CSV file whose name ends in .gz is gzip compressed. add_job and
+    add_results may be called from the worker threads of a batch (see Hy8BatchRunner.job_callback).
+    """
+
+    columns = ('source', 'crossing', 'crossing_name', 'flow', 'headwater', 'tailwater', 'control', 'outlet_velocity',
+               'overtopping_flow', 'freeboard')
+    float_columns = ('flow', 'headwater', 'tailwater', 'outlet_velocity', 'overtopping_flow', 'freeboard')
+    text_columns = ('source', 'crossing_name', 'control')
+
+    def __init__(self, output_file, file_format=None, chunk_rows=100000):
+        """Initializes the results exporter.
+
+        Args:
+            output_file (string): The path to the file to write; it is replaced when the first chunk is written.
+            file_format (string): 'parquet', 'arrow', or 'csv'; None chooses from the file extension.
+            chunk_rows (int): The rows buffered before they are written.
+        """
+        if file_format is None:
+            lower_file = output_file.lower()
+            if lower_file.endswith(('.parquet', '.pq')):
+                file_format = 'parquet'
+            elif lower_file.endswith(('.arrow', '.feather')):
+                file_format = 'arrow'
+            elif lower_file.endswith(('.csv', '.gz')):
+                file_format = 'csv'
+            else:
+                raise ValueError(f'The results file format can not be chosen from the extension: {output_file}')
+        if file_format not in ('parquet', 'arrow', 'csv'):
+            raise ValueError(f'Unknown results file format: {file_format}')
+        if chunk_rows < 1:
+            raise ValueError('Chunk rows must be at least one row.')
+        if file_format != 'csv':
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as error:
+                raise ImportError(f'Writing {file_format} results requires pyarrow; install it with pip install '
+                                  'hy8Runner[parquet].') from error
+
+        self.output_file = output_file
+        self.file_format = file_format
+        self.chunk_rows = chunk_rows
+        self.rows_written = 0
+        self.chunks_written = 0
+        self.closed = False
+
+        self._writer = None  # the open writer, created with the first chunk
+        self._file = None  # the open CSV file
+        self._schema = None  # the Arrow schema of Parquet and Arrow files
+        self._lock = threading.Lock()
+        self._clear_buffer()
+
+    def __enter__(self):
+        """Return the exporter, to be closed at the end of a with block."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the buffered rows and close the file."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of rows added, written or buffered."""
+        return self.rows_written + len(self._buffer['flow'])
+
+    def _clear_buffer(self):
+        """Start a new chunk of rows."""
+        self._buffer = {name: array('d') for name in self.float_columns}
+        self._buffer['crossing'] = array('q')
+        for name in self.text_columns:
+            self._buffer[name] = []
+
+    def add_results(self, results, crossings=None):
+        """Add the rows of parsed HY-8 results, writing every full chunk.
+
+        Args:
+            results (Hy8RunnerResults): The results.
+            crossings (list of Hy8RunnerCulvertCrossing): The crossings of the results, in order, used for the
+                freeboard; None leaves the freeboard NaN.
+
+        Returns:
+            int: The number of rows added.
+        """
+        num_rows = len(results)
+        crest_elevations = [math.nan] * results.num_crossings
+        if crossings is not None:
+            for index, crossing in enumerate(crossings[:results.num_crossings]):
+                if len(crossing.roadway_elevations) > 0:
+                    crest_elevations[index] = min(crossing.roadway_elevations)
+        row_crossings = []
+        row_names = []
+        freeboard = array('d')
+        for index in range(results.num_crossings):
+            rows = results.crossing_rows(index)
+            row_crossings.extend(results.crossing[rows.start:rows.stop])
+            row_names.extend([results.crossing_names[index]] * len(rows))
+            crest_elevation = crest_elevations[index]
+            freeboard.extend([crest_elevation - headwater for headwater in results.headwater[rows.start:rows.stop]])
+        control_types = results.control_types
+        sources = results.sources
+
+        with self._lock:
+            if self.closed:
+                raise ValueError(f'The results file is closed: {self.output_file}')
+            buffer = self._buffer
+            for name in ('flow', 'headwater', 'tailwater', 'outlet_velocity', 'overtopping_flow'):
+                buffer[name].extend(getattr(results, name))
+            buffer['freeboard'].extend(freeboard)
+            buffer['crossing'].extend(row_crossings)
+            buffer['crossing_name'].extend(row_names)
+            buffer['source'].extend([sources[source] for source in results.source])
+            buffer['control'].extend([control_types[code] for code in results.control])
+            written = 0
+            while len(buffer['flow']) - written >= self.chunk_rows:
+                self._write_rows(written, written + self.chunk_rows)
+                written += self.chunk_rows
+            self._drop_rows(written)
+        return num_rows
+
+    def add_job(self, hy8_runner, job_result=None):
+        """Add the results of a project run by HY-8, if it succeeded; usable as Hy8BatchRunner.job_callback.
+
+        Args:
+            hy8_runner (Hy8Runner): The project, whose rst file is read.
+            job_result (Hy8BatchJobResult): The result of the run; None reads the results without checking it.
+
+        Returns:
+            int: The number of rows added.
+        """
+        if job_result is not None and not job_result.succeeded:
+            return 0
+        try:
+            results = hy8_runner.read_results()
+        except (OSError, ValueError) as error:
+            if job_result is None:
+                raise
+            job_result.messages += f'Results could not be read: {error}\n'
+            return 0
+        return self.add_results(results, hy8_runner.crossings)
+
+    def flush(self):
+        """Write the buffered rows, even if they are less than a chunk."""
+        with self._lock:
+            num_rows = len(self._buffer['flow'])
+            if num_rows > 0:
+                self._write_rows(0, num_rows)
+                self._drop_rows(num_rows)
+
+    def close(self):
+        """Write the buffered rows and close the file; the file is written (with no rows) even if nothing was added."""
+        if self.closed:
+            return
+        self.flush()
+        with self._lock:
+            if self._writer is None:
+                self._open_writer()
+            if self.file_format == 'csv':
+                self._file.close()
+            else:
+                self._writer.close()
+            self._writer = None
+            self._file = None
+            self.closed = True
+
+    def _open_writer(self):
+        """Open the file and write its header or schema."""
+        if self.file_format == 'csv':
+            if self.output_file.lower().endswith('.gz'):
+                self._file = gzip.open(self.output_file, 'wt', compresslevel=6, newline='')
+            else:
+                self._file = open(self.output_file, 'w', newline='')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.columns)
+            return
+        import pyarrow as pa
+        schema = pa.schema([(name, pa.string() if name in self.text_columns else
+                             pa.int64() if name == 'crossing' else pa.float64()) for name in self.columns])
+        if self.file_format == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.output_file, schema)
+        else:
+            self._writer = pa.ipc.new_file(self.output_file, schema)
+        self._schema = schema
+
+    def _drop_rows(self, num_rows):
+        """Remove the first rows of the buffer once they are written; the caller holds the lock."""
+        if num_rows == 0:
+            return
+        if num_rows == len(self._buffer['flow']):
+            self._clear_buffer()
+            return
+        for name in self.columns:
+            del self._buffer[name][:num_rows]
+
+    def _write_rows(self, start, stop):
+        """Write a chunk of rows of the buffer; the caller holds the lock."""
+        if self.closed:
+            raise ValueError(f'The results file is closed: {self.output_file}')
+        if self._writer is None:
+            self._open_writer()
+        num_rows = stop - start
+        chunk = {name: self._buffer[name][start:stop] for name in self.columns}
+        if self.file_format == 'csv':
+            self._writer.writerows(zip(*[chunk[name] for name in self.columns]))
+        else:
+            import pyarrow as pa
+            # The typed arrays are handed to Arrow as buffers, without converting each value
+            arrays = [pa.array(chunk[name], type=pa.string()) if name in self.text_columns else
+                      pa.Array.from_buffers(self._schema.field(name).type, num_rows, [None, pa.py_buffer(chunk[name])])
+                      for name in self.columns]
+            batch = pa.record_batch(arrays, schema=self._schema)
+            self._writer.write_batch(batch)  # one row group of a Parquet file, or one record batch of an Arrow file
+        self.rows_written += num_rows
+        self.chunks_written += 1
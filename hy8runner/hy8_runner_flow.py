@@ -1,11 +1,14 @@
 """HY-8 Runner class that will create an HY-8 file and run HY-8."""
 # 1. Standard python modules
+import math
 
 # 2. Third party modules
 
 # 3. Aquaveo modules
 
 # 4. Local modules
+from hy8runner.hy8_runner_arrays import to_float_array
+from hy8runner.hy8_runner_revision import Hy8RunnerRevisioned
 
 __copyright__ = "(C) Copyright Aquaveo 2024"
 __license__ = "All rights reserved"
@@ -13,9 +16,11 @@ __license__ = "All rights reserved"
 # FHWA will not be providing any technical supporting, funding or maintenance.
 
 
-class Hy8RunnerFlow():
+class Hy8RunnerFlow(Hy8RunnerRevisioned):
     """A class that will create an HY-8 file and run HY-8."""
 
+    __slots__ = ('method', 'flow_min', 'flow_design', 'flow_max', 'flow_increment', '_flow_list', '_computed')
+
     def __init__(self):
         """Initializes the HY-8 Runner class."""
         self.method = 'min-design-max'  # 'min-design-max', 'user-defined', or 'min-max-increment'
@@ -25,59 +30,77 @@ class Hy8RunnerFlow():
         self.flow_increment = 0.0
         self.flow_list = []
 
+        self._computed = None  # the flow values and the list computed from them
+
+    @property
+    def flow_list(self):
+        """Return the flows, stored as an array of floats."""
+        return self._flow_list
+
+    @flow_list.setter
+    def flow_list(self, flow_list):
+        """Set the flows."""
+        self._flow_list = to_float_array(flow_list)
+
     def compute_list(self):
-        """Compute the list of flows."""
+        """Compute the list of flows.
+
+        The computed list is kept until the method or one of the flow values changes (or flow_list is replaced), so
+        writing a crossing again does not rebuild it. A user-defined list is left as it is.
+        """
+        if self.method not in ('min-design-max', 'min-max-increment'):
+            return
+        key = (self.method, self.flow_min, self.flow_design, self.flow_max, self.flow_increment)
+        if self._computed is not None and self._computed[0] == key and self._computed[1] is self.flow_list:
+            return
         if self.method == 'min-design-max':
             self.flow_list = [self.flow_min, self.flow_design, self.flow_max]
-        elif self.method == 'min-max-increment':
-            self.flow_list = []
-            flow = self.flow_min
-            while flow <= self.flow_max:
-                self.flow_list.append(flow)
-                flow += self.flow_increment
+        else:
+            self.flow_list = get_flow_range(self.flow_min, self.flow_max, self.flow_increment)
+        self._computed = (key, self.flow_list)
 
     def validate_crossings_data(self, crossing_str):
-        """Validate the data.
+        """Validate the data with the flow checks of Hy8RunnerValidator.
+
+        Args:
+            crossing_str (string): The text that starts each message.
 
         Returns:
             bool: True if the data is valid.
             string: The error message if the data is not valid.
         """
-        messages = ''
-        result = True
+        # Imported here because the validator imports this module through the crossing table
+        from hy8runner.hy8_runner_crossing import Hy8RunnerCulvertCrossing
+        from hy8runner.hy8_runner_validation import Hy8RunnerValidator
+        crossing = Hy8RunnerCulvertCrossing(0)
+        crossing.flow = self
+        checks = Hy8RunnerValidator.checks
+        messages = ''.join([f'{crossing_str}{checks[code][2]}\n'
+                            for code in Hy8RunnerValidator().validate([crossing]).code
+                            if checks[code][0].startswith('flow_')])
+        return messages == '', messages
 
-        if self.method == 'min-design-max':
-            if self.flow_min >= self.flow_design:
-                messages += f'{crossing_str}Minimum flow must be less than or equal to design flow.\n'
-                result = False
-            if self.flow_design >= self.flow_max:
-                messages += f'{crossing_str}Design flow must be less than or equal to maximum flow.\n'
-                result = False
-            if self.flow_min < 0.0:
-                messages += f'{crossing_str}Minimum flow must be zero or greater.\n'
-                result = False
-        elif self.method == 'min-max-increment':
-            if self.flow_min >= self.flow_max:
-                messages += f'{crossing_str}Minimum flow must be less than maximum flow.\n'
-                result = False
-            if self.flow_min < 0.0:
-                messages += f'{crossing_str}Minimum flow must be zero or greater.\n'
-                result = False
-            if self.flow_increment <= 0.0:
-                messages += f'{crossing_str}Flow increment must be greater than zero.\n'
-                result = False
-        elif self.method == 'user-defined':
-            if len(self.flow_list) < 2:
-                messages += f'{crossing_str}User-defined flow list must have at least two values.\n'
-                result = False
-            elif len(self.flow_list) >= 2:
-                for i in range(len(self.flow_list) - 1):
-                    if self.flow_list[i] >= self.flow_list[i + 1]:
-                        messages += f'{crossing_str}Flow list values must increase in value.\n'
-                        result = False
-                        break
-        else:
-            messages += f'{crossing_str}Flow method must be min-design-max, user-defined, or min-max-increment.\n'
-            result = False
 
-        return result, messages
+def get_flow_range(flow_min, flow_max, flow_increment):
+    """Return the flows from the minimum to the maximum flow by the increment.
+
+    Each flow is computed from its index (flow_min + index * flow_increment) rather than by adding the increment
+    again and again, so rounding error does not build up, and the maximum flow is included exactly when the range
+    is a whole number of increments.
+
+    Args:
+        flow_min (float): The minimum flow.
+        flow_max (float): The maximum flow.
+        flow_increment (float): The flow increment.
+
+    Returns:
+        list of floats: The flows; empty if the increment is not positive or the maximum is less than the minimum.
+    """
+    if flow_increment <= 0 or flow_max < flow_min:
+        return []
+    steps = (flow_max - flow_min) / flow_increment
+    num_steps = math.floor(steps + 1e-9 * max(1.0, steps))
+    flows = [flow_min + index * flow_increment for index in range(num_steps + 1)]
+    if abs(steps - num_steps) <= 1e-9 * max(1.0, steps):
+        flows[-1] = flow_max
+    return flows
@@ -0,0 +1,262 @@
+"""HY-8 inventory importer that streams CSV or Parquet culvert inventories into Hy8Runner projects."""
+# 1. Standard python modules
+import csv
+import gzip
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_table import Hy8CrossingTable
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8InventoryImporter']
+
+
+class Hy8InventoryImporter():
+    """Reads an inventory with one row per culvert barrel, in chunks, and builds crossings and projects from it.
+
+    Each inventory column is mapped to a column of Hy8CrossingTable (name, tw_type, flow_max, roadway_width, span,
+    material, culvert_name, ...) or to one of the extra columns: crossing_key (the value that groups the barrels of
+    a crossing; defaults to uuid, then name), roadway_length and roadway_elevation (a constant roadway), and
+    roadway_stations and roadway_elevations (a roadway profile, as values separated by spaces or semicolons).
+    The crossing values are read from the first row of each crossing, and the barrel values from every row.
+    Empty values leave the default of the field.
+
+    The rows of a crossing must be next to each other (the inventory sorted or grouped by crossing); a key that
+    comes back after other crossings starts a new crossing. Only one chunk of rows, and the crossings built from it,
+    are held at a time. Parquet inventories need pyarrow; CSV inventories may be gzip compressed (.csv.gz).
+    """
+
+    crossing_columns = Hy8CrossingTable.crossing_float_columns + Hy8CrossingTable.crossing_int_columns + \
+        Hy8CrossingTable.crossing_code_columns + Hy8CrossingTable.crossing_text_columns
+    culvert_columns = Hy8CrossingTable.culvert_float_columns + Hy8CrossingTable.culvert_int_columns + \
+        Hy8CrossingTable.culvert_code_columns + Hy8CrossingTable.culvert_text_columns
+    extra_columns = ('crossing_key', 'roadway_length', 'roadway_elevation', 'roadway_stations', 'roadway_elevations')
+
+    def __init__(self, column_map=None, chunk_size=10000, defaults=None):
+        """Initializes the inventory importer.
+
+        Args:
+            column_map (dict): The inventory column name to the column it sets; None reads the inventory columns
+                that already have those names.
+            chunk_size (int): The number of rows read at a time.
+            defaults (dict): Values given to every crossing or barrel that the inventory leaves empty, for example
+                {'flow_method': 'min-max-increment', 'tw_type': 6}.
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least one row.')
+        self._targets = set(self.crossing_columns + self.culvert_columns + self.extra_columns)
+        for target in list((column_map or {}).values()) + list(defaults or {}):
+            if target not in self._targets:
+                raise KeyError(f'Unknown inventory column target: {target}')
+        self.column_map = column_map
+        self.chunk_size = chunk_size
+        self.defaults = dict(defaults or {})
+
+    def iter_chunks(self, inventory, file_format=None):
+        """Read the rows of an inventory a chunk at a time.
+
+        Args:
+            inventory (string or file object): The path to a CSV, gzip CSV, or Parquet file, or an open CSV file.
+            file_format (string): 'csv' or 'parquet'; None chooses from the file extension.
+
+        Yields:
+            list of dicts: Up to chunk_size rows, each the inventory column name to its value.
+        """
+        if file_format is None:
+            file_format = 'csv'
+            if isinstance(inventory, str) and inventory.lower().endswith(('.parquet', '.pq')):
+                file_format = 'parquet'
+        if file_format == 'parquet':
+            yield from self._iter_parquet_chunks(inventory)
+        elif file_format == 'csv':
+            if not isinstance(inventory, str):
+                yield from self._iter_csv_chunks(inventory)
+            elif inventory.lower().endswith('.gz'):
+                with gzip.open(inventory, 'rt', newline='') as file:
+                    yield from self._iter_csv_chunks(file)
+            else:
+                with open(inventory, 'r', newline='') as file:
+                    yield from self._iter_csv_chunks(file)
+        else:
+            raise ValueError(f'Unknown inventory file format: {file_format}')
+
+    def _iter_csv_chunks(self, file):
+        """Read the rows of an open CSV file a chunk at a time."""
+        chunk = []
+        for row in csv.DictReader(file):
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _iter_parquet_chunks(self, inventory):
+        """Read the rows of a Parquet file a record batch at a time, reading only the mapped columns."""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError('Reading Parquet inventories requires pyarrow; install it with pip install '
+                              'hy8Runner[parquet].') from error
+        parquet_file = pq.ParquetFile(inventory)
+        columns = None
+        if self.column_map is not None:
+            columns = [name for name in parquet_file.schema_arrow.names if name in self.column_map]
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size, columns=columns):
+            yield batch.to_pylist()
+
+    def iter_crossings(self, inventory, file_format=None):
+        """Build the crossings of an inventory one chunk at a time.
+
+        Args:
+            inventory (string or file object): The path to a CSV, gzip CSV, or Parquet file, or an open CSV file.
+            file_format (string): 'csv' or 'parquet'; None chooses from the file extension.
+
+        Yields:
+            tuple: The key of each crossing and the Hy8RunnerCulvertCrossing, in inventory order.
+        """
+        groups = []  # the key and the mapped rows of each crossing of the chunk
+        for chunk in self.iter_chunks(inventory, file_format):
+            for row in chunk:
+                row = self._map_row(row)
+                key = self._get_key(row)
+                if groups and key is not None and groups[-1][0] == key:
+                    groups[-1][1].append(row)
+                else:
+                    groups.append((key, [row]))
+            # The last crossing may go on in the next chunk
+            last_group = groups.pop()
+            yield from self._build_crossings(groups)
+            groups = [last_group]
+        if groups:
+            yield from self._build_crossings(groups)
+
+    def iter_projects(self, inventory, work_dir, pack_size=1, hy8_exe_path='', config=None, file_format=None):
+        """Build ready-to-run HY-8 projects of up to pack_size crossings from an inventory.
+
+        Args:
+            inventory (string or file object): The path to a CSV, gzip CSV, or Parquet file, or an open CSV file.
+            work_dir (string): The directory of the HY-8 files of the projects.
+            pack_size (int): The most crossings in one project.
+            hy8_exe_path (string): The path to the HY-8 executable.
+            config (Hy8RunnerConfig): The settings of the projects; defaults to Hy8Runner.default_config.
+            file_format (string): 'csv' or 'parquet'; None chooses from the file extension.
+
+        Yields:
+            tuple: The keys of the crossings of each project and the Hy8Runner, whose HY-8 file is
+                inventory_<n>.hy8 in work_dir.
+        """
+        if pack_size < 1:
+            raise ValueError('Pack size must be at least one crossing.')
+        keys = []
+        crossings = []
+        num_projects = 0
+        for key, crossing in self.iter_crossings(inventory, file_format):
+            keys.append(key)
+            crossings.append(crossing)
+            if len(crossings) >= pack_size:
+                yield keys, self._create_project(crossings, work_dir, num_projects, hy8_exe_path, config)
+                num_projects += 1
+                keys = []
+                crossings = []
+        if crossings:
+            yield keys, self._create_project(crossings, work_dir, num_projects, hy8_exe_path, config)
+
+    @staticmethod
+    def _create_project(crossings, work_dir, number, hy8_exe_path, config):
+        """Create the project of a pack of crossings."""
+        hy8_runner = Hy8Runner(hy8_exe_path, os.path.join(work_dir, f'inventory_{number}.hy8'), config)
+        hy8_runner.crossings = crossings
+        return hy8_runner
+
+    def _map_row(self, row):
+        """Return a row by the names of the columns it sets, with the defaults for its missing or empty values."""
+        mapped = dict(self.defaults)
+        if self.column_map is None:
+            items = [(name, value) for name, value in row.items() if name in self._targets]
+        else:
+            items = [(self.column_map[name], value) for name, value in row.items() if name in self.column_map]
+        for target, value in items:
+            if value is not None and not (isinstance(value, str) and value.strip() == ''):
+                mapped[target] = value
+        return mapped
+
+    @staticmethod
+    def _get_key(row):
+        """Return the value that groups the barrel rows of a crossing, or None if each row is its own crossing."""
+        for name in ('crossing_key', 'uuid', 'name'):
+            key = row.get(name)
+            if key is not None:
+                return key
+        return None
+
+    def _build_crossings(self, groups):
+        """Build the crossings of a chunk with the bulk setters of one Hy8Runner.
+
+        Args:
+            groups (list of tuples): The key and the mapped rows of each crossing.
+
+        Yields:
+            tuple: The key and the Hy8RunnerCulvertCrossing of each group.
+        """
+        if not groups:
+            return
+        hy8_runner = Hy8Runner()
+        while len(hy8_runner.crossings) < len(groups):
+            hy8_runner.add_crossing()
+        indices = list(range(len(groups)))
+        first_rows = [rows[0] for _, rows in groups]
+        self._set_columns(hy8_runner, self.crossing_columns, first_rows, indices)
+
+        num_barrels = max([len(rows) for _, rows in groups])
+        for index, (_, rows) in enumerate(groups):
+            for _ in range(len(rows) - 1):
+                hy8_runner.add_culvert_barrel(index)
+        for position in range(num_barrels):
+            barrel_indices = [index for index, (_, rows) in enumerate(groups) if len(rows) > position]
+            barrel_rows = [groups[index][1][position] for index in barrel_indices]
+            self._set_columns(hy8_runner, self.culvert_columns, barrel_rows, barrel_indices, position)
+
+        for index, row in enumerate(first_rows):
+            if 'roadway_stations' in row or 'roadway_elevations' in row:
+                hy8_runner.set_roadway_stations_and_elevations(self._get_values(row.get('roadway_stations', ())),
+                                                               self._get_values(row.get('roadway_elevations', ())),
+                                                               index)
+            elif 'roadway_length' in row and 'roadway_elevation' in row:
+                hy8_runner.set_constant_roadway(float(row['roadway_length']), float(row['roadway_elevation']), index)
+
+        for (key, _), crossing in zip(groups, hy8_runner.crossings):
+            yield key, crossing
+
+    @staticmethod
+    def _set_columns(hy8_runner, names, rows, indices, index_culvert=None):
+        """Set each column that has values in the rows, with one bulk setter call per column."""
+        for name in names:
+            column_indices = []
+            values = []
+            for index, row in zip(indices, rows):
+                value = row.get(name)
+                if value is not None:
+                    column_indices.append(index)
+                    values.append(value)
+            if values:
+                try:
+                    hy8_runner.set_bulk_columns({name: values}, column_indices, index_culvert)
+                except ValueError as error:
+                    raise ValueError(f'Inventory column {name} has a value that is not valid: {error}') from error
+
+    @staticmethod
+    def _get_values(values):
+        """Return the floats of a roadway profile given as a sequence or as a string separated by spaces or ';'."""
+        if isinstance(values, str):
+            values = values.replace(';', ' ').split()
+        return [float(value) for value in values]
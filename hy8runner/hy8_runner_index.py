@@ -0,0 +1,158 @@
+"""HY-8 crossing index that finds the crossings of a runner by name or UUID in constant time."""
+# 1. Standard python modules
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerCrossingIndex']
+
+
+class Hy8RunnerCrossingIndex():
+    """Dictionaries from the UUID and the name of each crossing to the crossing.
+
+    Hy8Runner keeps the index up to date as it adds and deletes crossings, and each indexed crossing tells the
+    index when its name or UUID is set. If the list of crossings is replaced, or its length changes behind the
+    runner's back, the index is rebuilt on the next lookup; call rebuild after any other change made to the list
+    in place. Several crossings may share a name; a name then finds the first of them that was indexed. UUIDs should
+    be unique.
+    """
+
+    def __init__(self):
+        """Initializes the crossing index."""
+        self._by_uuid = {}
+        self._by_name = {}  # name to the list of crossings with that name
+        self._members = {}  # id of each indexed crossing to the crossing
+        self._crossings = None  # the list of crossings the index was built from
+        self._count = 0  # the length the list should have
+
+    def __getstate__(self):
+        """Copy or pickle the index empty; it is rebuilt from the copied crossings on the next lookup."""
+        return {}
+
+    def __setstate__(self, state):
+        """Restore an empty index."""
+        self.__init__()
+
+    def __len__(self):
+        """Return the number of indexed crossings."""
+        return len(self._members)
+
+    def is_current(self, crossings):
+        """Return True if the index was built from (and kept up to date with) a list of crossings.
+
+        Args:
+            crossings (list of Hy8RunnerCulvertCrossing): The crossings.
+
+        Returns:
+            bool: True if the index can be used for the crossings.
+        """
+        return self._crossings is crossings and self._count == len(crossings)
+
+    def rebuild(self, crossings):
+        """Index a list of crossings, replacing what was indexed.
+
+        Args:
+            crossings (list of Hy8RunnerCulvertCrossing): The crossings.
+        """
+        for crossing in self._members.values():
+            if crossing.crossing_index is self:
+                crossing.set_crossing_index(None)
+        self._by_uuid = {}
+        self._by_name = {}
+        self._members = {}
+        self._crossings = crossings
+        self._count = 0
+        for crossing in crossings:
+            self.add(crossing)
+
+    def add(self, crossing):
+        """Index a crossing that was appended to the list.
+
+        Args:
+            crossing (Hy8RunnerCulvertCrossing): The crossing.
+        """
+        self._members[id(crossing)] = crossing
+        self._add_key('name', crossing.name, crossing)
+        self._add_key('uuid', crossing.uuid, crossing)
+        crossing.set_crossing_index(self)
+        self._count += 1
+
+    def remove(self, crossing):
+        """Stop indexing a crossing that was deleted from the list.
+
+        Args:
+            crossing (Hy8RunnerCulvertCrossing): The crossing.
+        """
+        if self._members.pop(id(crossing), None) is None:
+            return
+        self._remove_key('name', crossing.name, crossing)
+        self._remove_key('uuid', crossing.uuid, crossing)
+        if crossing.crossing_index is self:
+            crossing.set_crossing_index(None)
+        self._count -= 1
+
+    def update_key(self, crossing, attribute, old_value, new_value):
+        """Move a crossing to its new name or UUID; called by the crossing when the attribute is set.
+
+        Args:
+            crossing (Hy8RunnerCulvertCrossing): The crossing.
+            attribute (string): 'name' or 'uuid'.
+            old_value: The value before it was set.
+            new_value: The new value.
+        """
+        if id(crossing) not in self._members:
+            return
+        self._remove_key(attribute, old_value, crossing)
+        self._add_key(attribute, new_value, crossing)
+
+    def get(self, key):
+        """Return the crossing with a UUID or, failing that, a name.
+
+        Args:
+            key: The UUID or name.
+
+        Returns:
+            Hy8RunnerCulvertCrossing: The crossing, or None if no crossing has the key.
+        """
+        crossing = self._by_uuid.get(key)
+        if crossing is not None:
+            return crossing
+        crossings = self._by_name.get(key)
+        if crossings:
+            return crossings[0]
+        return None
+
+    def _add_key(self, attribute, value, crossing):
+        """Add a crossing under its name or UUID."""
+        if value is None:
+            return
+        if attribute == 'uuid':
+            self._by_uuid.setdefault(value, crossing)
+        else:
+            self._by_name.setdefault(value, []).append(crossing)
+
+    def _remove_key(self, attribute, value, crossing):
+        """Remove a crossing from under its name or UUID."""
+        if value is None:
+            return
+        if attribute == 'uuid':
+            if self._by_uuid.get(value) is crossing:
+                del self._by_uuid[value]
+            return
+        crossings = self._by_name.get(value)
+        if crossings is None:
+            return
+        for position, named_crossing in enumerate(crossings):
+            if named_crossing is crossing:
+                del crossings[position]
+                break
+        if not crossings:
+            del self._by_name[value]
@@ -0,0 +1,131 @@
+"""HY-8 crossing packer that runs many independent crossings in a few multi-crossing HY-8 projects."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_batch import Hy8BatchRunner
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8CrossingPacker']
+
+
+class Hy8CrossingPacker():
+    """Packs independent crossings into HY-8 projects of pack_size crossings, so HY-8 starts once per project.
+
+    Set shards to the plan of a Hy8ShardPlanner to pack the crossings by predicted runtime instead.
+    Each packed project is run once, and the results of each crossing are taken from its position in the project
+    and returned under the key it was added with. If a packed project is invalid or its run fails, every crossing
+    in it gets None.
+    """
+
+    def __init__(self, work_dir, pack_size=100, hy8_exe_path='', max_workers=None, config=None):
+        """Initializes the crossing packer.
+
+        Args:
+            work_dir (string): The directory for the packed HY-8 files and their results.
+            pack_size (int): The most crossings in one packed project.
+            hy8_exe_path (string): The path to the HY-8 executable.
+            max_workers (int): The most HY-8 processes to run at the same time; defaults to the number of CPUs.
+            config (Hy8RunnerConfig): The settings of the packed projects; defaults to Hy8Runner.default_config.
+        """
+        self.work_dir = work_dir
+        self.pack_size = pack_size
+        self.hy8_exe_path = hy8_exe_path
+        self.max_workers = max_workers
+        self.config = config
+        self.timeout = None  # seconds before the run of a packed project is killed
+        self.retry_policy = None
+
+        self.shards = None  # the crossing indices of each project, from Hy8ShardPlanner; None packs in order
+        self.crossings = []
+        self.keys = []
+        self.job_results = []
+
+    def add_crossing(self, crossing, key=None):
+        """Add a crossing to pack.
+
+        Args:
+            crossing (Hy8RunnerCulvertCrossing): The crossing.
+            key: The key to return the results of the crossing under; defaults to the index of the crossing.
+
+        Returns:
+            The key of the crossing.
+        """
+        if key is None:
+            key = len(self.crossings)
+        self.crossings.append(crossing)
+        self.keys.append(key)
+        return key
+
+    def clear(self):
+        """Remove the crossings, their keys, the planned shards, and the job results, to pack a new set of crossings."""
+        self.shards = None
+        self.crossings = []
+        self.keys = []
+        self.job_results = []
+
+    def get_shards(self):
+        """Return the indices of the crossings of each packed project.
+
+        Returns:
+            list of lists of ints: The planned shards, or runs of pack_size crossings in the order added.
+        """
+        if self.shards is not None:
+            return self.shards
+        if self.pack_size < 1:
+            raise ValueError('Pack size must be at least one crossing.')
+        return [list(range(start, min(start + self.pack_size, len(self.crossings))))
+                for start in range(0, len(self.crossings), self.pack_size)]
+
+    def pack(self):
+        """Pack the crossings into HY-8 projects.
+
+        Returns:
+            list of Hy8Runner: The packed projects, one per shard.
+        """
+        projects = []
+        for shard in self.get_shards():
+            hy8_file = os.path.join(self.work_dir, f'pack_{len(projects)}.hy8')
+            hy8_runner = Hy8Runner(self.hy8_exe_path, hy8_file, self.config)
+            hy8_runner.crossings = [self.crossings[index] for index in shard]
+            projects.append(hy8_runner)
+        return projects
+
+    def run(self):
+        """Run every packed project once and split the results back to the crossings.
+
+        Returns:
+            dict: The key of each crossing and its results (the columns of Hy8RunnerResults.get_crossing), or None if
+                its packed project did not run.
+        """
+        os.makedirs(self.work_dir, exist_ok=True)
+        shards = self.get_shards()
+        projects = self.pack()
+        batch_runner = Hy8BatchRunner(projects, 'OpenRunSave', self.max_workers, timeout=self.timeout,
+                                      retry_policy=self.retry_policy)
+        self.job_results = batch_runner.run()
+
+        crossing_results = {}
+        for shard, hy8_runner, job_result in zip(shards, projects, self.job_results):
+            results = None
+            if job_result.succeeded:
+                try:
+                    results = hy8_runner.read_results()
+                except (OSError, ValueError) as error:
+                    job_result.messages += f'Results could not be read: {error}\n'
+            for position, crossing_index in enumerate(shard):
+                key = self.keys[crossing_index]
+                if results is not None and position < results.num_crossings:
+                    crossing_results[key] = results.get_crossing(position)
+                else:
+                    crossing_results[key] = None
+        return crossing_results
@@ -0,0 +1,302 @@
+"""HY-8 file parser that reads an HY-8 project file back into HY-8 Runner objects."""
+# 1. Standard python modules
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_crossing import Hy8RunnerCulvertCrossing
+from hy8runner.hy8_runner_culvert import Hy8RunnerCulvertBarrel
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerFileParser']
+
+
+def _to_number(token):
+    """Convert a card value to an int if it is written as one, otherwise to a float.
+
+    Args:
+        token (string): The card value.
+
+    Returns:
+        int or float: The value.
+    """
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _unquote(text):
+    """Remove the surrounding quotes from a card value.
+
+    Args:
+        text (string): The card value.
+
+    Returns:
+        string: The value without the quotes.
+    """
+    text = text.strip()
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        return text[1:-1]
+    return text
+
+
+class Hy8RunnerFileParser():
+    """A streaming parser that tokenizes an HY-8 file line by line and builds crossings from the cards.
+
+    Only one crossing is held in memory at a time by iter_crossings, so very large multi-crossing files can be
+    processed in bounded memory. Cards that HY-8 Runner does not model are skipped.
+    """
+
+    culvert_shapes = {1: 'circle', 2: 'box'}
+    culvert_materials = {1: 'concrete', 2: 'corrugated steel'}
+    roadway_surfaces = {1: 'paved', 2: 'gravel', 3: 'user-defined'}
+
+    def __init__(self):
+        """Initializes the HY-8 file parser."""
+        self.version = None
+        self.si_units = False
+        self.exit_loss_option = 0
+        self.project_title = ''
+        self.designer_name = ''
+        self.project_notes = ''
+        self.num_crossings = 0
+
+        self._crossing = None
+        self._culvert = None
+        self._crossing_count = 0
+        self._rating_point = None
+
+        self._project_card_handlers = {
+            'UNITS': self._read_units,
+            'EXITLOSSOPTION': self._read_exit_loss_option,
+            'PROJTITLE': self._read_project_title,
+            'PROJDESIGNER': self._read_designer_name,
+            'NUMCROSSINGS': self._read_num_crossings,
+            'STARTCROSSING': self._read_start_crossing,
+        }
+        self._crossing_card_handlers = {
+            'STARTCROSSNOTES': self._read_crossing_notes,
+            'DISCHARGERANGE': self._read_discharge_range,
+            'DISCHARGEMETHOD': self._read_discharge_method,
+            'DISCHARGEXYUSER_Y': self._read_discharge,
+            'TAILWATERTYPE': self._read_tailwater_type,
+            'CHANNELGEOMETRY': self._read_channel_geometry,
+            'TWRATINGCURVE': self._read_tw_constant,
+            'FLOW': self._read_rating_flow,
+            'ELEVATION': self._read_rating_value,
+            'VELOCITY': self._read_rating_value,
+            'ROADWAYSHAPE': self._read_roadway_shape,
+            'ROADWIDTH': self._read_roadway_width,
+            'SURFACE': self._read_roadway_surface,
+            'ROADWAYSECDATA': self._read_first_roadway_point,
+            'ROADWAYPOINT': self._read_roadway_point,
+            'STARTCULVERT': self._read_start_culvert,
+            'CULVERTSHAPE': self._read_culvert_shape,
+            'CULVERTMATERIAL': self._read_culvert_material,
+            'BARRELDATA': self._read_barrel_data,
+            'NUMBEROFBARRELS': self._read_number_of_barrels,
+            'INVERTDATA': self._read_invert_data,
+            'STARTCULVNOTES': self._read_culvert_notes,
+            'ENDCULVERT': self._read_end_culvert,
+            'CROSSGUID': self._read_crossing_guid,
+        }
+
+    def iter_crossings(self, hy8_file):
+        """Read the crossings from an HY-8 file one at a time.
+
+        The project level values (units, title, etc.) are stored on the parser as they are read.
+
+        Args:
+            hy8_file (string or file object): The path to the HY-8 file or an open text file.
+
+        Yields:
+            Hy8RunnerCulvertCrossing: Each crossing in the file, in file order.
+        """
+        if isinstance(hy8_file, str):
+            with open(hy8_file, 'r') as file:
+                yield from self._iter_crossings(file)
+        else:
+            yield from self._iter_crossings(hy8_file)
+
+    def _iter_crossings(self, lines):
+        """Tokenize the lines and yield each crossing when its ENDCROSSING card is read.
+
+        Args:
+            lines (iterable of strings): The lines of the HY-8 file.
+
+        Yields:
+            Hy8RunnerCulvertCrossing: Each crossing in the file, in file order.
+        """
+        project_handlers = self._project_card_handlers
+        crossing_handlers = self._crossing_card_handlers
+        reading_notes = False
+        for line in lines:
+            if reading_notes:
+                if line.startswith('ENDPROJNOTES'):
+                    reading_notes = False
+                else:
+                    self.project_notes += '\n' + line.rstrip('\r\n')
+                continue
+            tokens = line.split(None, 1)
+            if not tokens:
+                continue
+            card = tokens[0]
+            value = tokens[1] if len(tokens) > 1 else ''
+            if self._crossing is not None:
+                handler = crossing_handlers.get(card)
+                if handler is not None:
+                    handler(value)
+                elif card == 'ENDCROSSING':
+                    crossing = self._crossing
+                    self._crossing = None
+                    yield crossing
+                continue
+            handler = project_handlers.get(card)
+            if handler is not None:
+                handler(value)
+            elif card == 'STARTPROJNOTES':
+                self.project_notes = value.rstrip('\r\n').strip()
+                reading_notes = True
+            elif card.startswith('HY8PROJECTFILE'):
+                self.version = _to_number(card[len('HY8PROJECTFILE'):])
+
+    def read(self, hy8_file, hy8_runner):
+        """Read an HY-8 file into an HY-8 Runner, replacing its crossings.
+
+        Args:
+            hy8_file (string or file object): The path to the HY-8 file or an open text file.
+            hy8_runner (Hy8Runner): The HY-8 Runner that receives the project and crossings.
+
+        Returns:
+            Hy8Runner: The HY-8 Runner.
+        """
+        crossings = list(self.iter_crossings(hy8_file))
+        if crossings:
+            hy8_runner.crossings = crossings
+        if self.version is not None:
+            hy8_runner.version = self.version
+        hy8_runner.si_units = self.si_units
+        hy8_runner.exit_loss_option = self.exit_loss_option
+        hy8_runner.project_title = self.project_title
+        hy8_runner.designer_name = self.designer_name
+        hy8_runner.project_notes = self.project_notes
+        return hy8_runner
+
+    # Project cards
+    def _read_units(self, value):
+        self.si_units = int(value) == 1
+
+    def _read_exit_loss_option(self, value):
+        self.exit_loss_option = int(value)
+
+    def _read_project_title(self, value):
+        self.project_title = value.strip()
+
+    def _read_designer_name(self, value):
+        self.designer_name = value.strip()
+
+    def _read_num_crossings(self, value):
+        self.num_crossings = int(value)
+
+    # Crossing cards
+    def _read_start_crossing(self, value):
+        self._crossing = Hy8RunnerCulvertCrossing(self._crossing_count)
+        self._crossing_count += 1
+        self._crossing.name = _unquote(value)
+        self._crossing.flow.flow_list = []
+        self._crossing.culverts = []
+        self._culvert = None
+        self._rating_point = None
+
+    def _read_crossing_notes(self, value):
+        self._crossing.notes = _unquote(value)
+
+    def _read_discharge_range(self, value):
+        flow = self._crossing.flow
+        flow.flow_min, flow.flow_design, flow.flow_max = [_to_number(token) for token in value.split()[:3]]
+
+    def _read_discharge_method(self, value):
+        flow = self._crossing.flow
+        flow.method = 'min-design-max' if int(value) == 0 else 'user-defined'
+
+    def _read_discharge(self, value):
+        self._crossing.flow.flow_list.append(_to_number(value))
+
+    def _read_tailwater_type(self, value):
+        self._crossing.tw_type = int(value)
+
+    def _read_channel_geometry(self, value):
+        crossing = self._crossing
+        (crossing.tw_bottom_width, crossing.tw_sideslope, crossing.tw_channel_slope, crossing.tw_manning_n,
+         crossing.tw_invert_elevation) = [_to_number(token) for token in value.split()[:5]]
+
+    def _read_tw_constant(self, value):
+        self._crossing.tw_constant_elevation = _to_number(value.split()[0])
+
+    def _read_rating_flow(self, value):
+        self._rating_point = [_to_number(value)]
+        self._crossing.tw_rating_curve.append(self._rating_point)
+
+    def _read_rating_value(self, value):
+        if self._rating_point is not None:
+            self._rating_point.append(_to_number(value))
+
+    def _read_roadway_shape(self, value):
+        self._crossing.roadway_shape = int(value)
+
+    def _read_roadway_width(self, value):
+        self._crossing.roadway_width = _to_number(value)
+
+    def _read_roadway_surface(self, value):
+        self._crossing.roadway_surface = self.roadway_surfaces.get(int(value), 'paved')
+
+    def _read_first_roadway_point(self, value):
+        self._crossing.roadway_stations = []
+        self._crossing.roadway_elevations = []
+        self._read_roadway_point(value)
+
+    def _read_roadway_point(self, value):
+        station, elevation = value.split()[:2]
+        self._crossing.roadway_stations.append(_to_number(station))
+        self._crossing.roadway_elevations.append(_to_number(elevation))
+
+    def _read_crossing_guid(self, value):
+        self._crossing.uuid = value.strip()
+
+    # Culvert cards
+    def _read_start_culvert(self, value):
+        self._culvert = Hy8RunnerCulvertBarrel(len(self._crossing.culverts))
+        self._culvert.name = _unquote(value)
+        self._crossing.culverts.append(self._culvert)
+
+    def _read_culvert_shape(self, value):
+        self._culvert.shape = self.culvert_shapes.get(int(value), 'circle')
+
+    def _read_culvert_material(self, value):
+        self._culvert.material = self.culvert_materials.get(int(value), 'concrete')
+
+    def _read_barrel_data(self, value):
+        tokens = value.split()
+        self._culvert.span = _to_number(tokens[0])
+        self._culvert.rise = _to_number(tokens[1])
+
+    def _read_number_of_barrels(self, value):
+        self._culvert.number_of_barrels = int(value)
+
+    def _read_invert_data(self, value):
+        culvert = self._culvert
+        (culvert.inlet_invert_station, culvert.inlet_invert_elevation, culvert.outlet_invert_station,
+         culvert.outlet_invert_elevation) = [_to_number(token) for token in value.split()[:4]]
+
+    def _read_culvert_notes(self, value):
+        self._culvert.notes = _unquote(value)
+
+    def _read_end_culvert(self, value):
+        self._culvert = None
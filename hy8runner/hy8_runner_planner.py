@@ -0,0 +1,304 @@
+"""HY-8 shard planner that models the HY-8 runtime and splits crossings into projects that finish soonest."""
+# 1. Standard python modules
+import heapq
+import os
+import shutil
+import tempfile
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_environment import Hy8RunnerEnvironment
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerCostModel', 'Hy8ShardPlanner', 'calibrate']
+
+
+class Hy8RunnerCostModel():
+    """A linear model of the seconds one HY-8 run takes.
+
+    seconds = startup + per_crossing * crossings + per_flow * flows, where flows is the total number of flows of all
+    crossings in the project.
+    """
+
+    def __init__(self, startup=0.0, per_crossing=0.0, per_flow=0.0):
+        """Initializes the cost model.
+
+        Args:
+            startup (float): The seconds of every run, whatever the project size.
+            per_crossing (float): The seconds added by each crossing.
+            per_flow (float): The seconds added by each flow of each crossing.
+        """
+        self.startup = startup
+        self.per_crossing = per_crossing
+        self.per_flow = per_flow
+        self.samples = []  # the (crossings, flows, seconds) the model was fit to
+
+    @classmethod
+    def fit(cls, samples):
+        """Fit the model to timed runs with non-negative least squares.
+
+        The active-set method of Lawson and Hanson frees one coefficient at a time while that lowers the error, and
+        steps back to keep every free coefficient above zero, so the result is the least squares fit among the models
+        without negative coefficients.
+
+        Args:
+            samples (list of tuples): The number of crossings, the number of flows, and the seconds of each run.
+
+        Returns:
+            Hy8RunnerCostModel: The fitted model; no coefficient is negative.
+        """
+        rows = [(1.0, float(crossings), float(flows), float(seconds)) for crossings, flows, seconds in samples]
+        gram = [[sum([row[i] * row[j] for row in rows]) for j in range(3)] for i in range(3)]
+        moments = [sum([row[i] * row[3] for row in rows]) for i in range(3)]
+        tolerance = 1e-10 * max([abs(moment) for moment in moments] + [1.0])
+
+        coefficients = [0.0, 0.0, 0.0]
+        free = []
+        for _ in range(3 * 3):  # the iteration limit of Lawson and Hanson
+            # The gradient of the error: a coefficient held at zero is freed if raising it lowers the error
+            gradient = [moments[i] - sum([gram[i][j] * coefficients[j] for j in range(3)]) for i in range(3)]
+            candidates = [index for index in range(3) if index not in free and gradient[index] > tolerance]
+            if not candidates:
+                break
+            free.append(candidates[0])  # the first, so samples that do not vary are all startup
+            solution = cls._solve(gram, moments, free)
+            while any([solution[index] <= 0.0 for index in free]):
+                # Step back toward the solution only as far as every free coefficient stays non-negative
+                step = min([coefficients[index] / (coefficients[index] - solution[index])
+                            if coefficients[index] > solution[index] else 0.0
+                            for index in free if solution[index] <= 0.0])
+                coefficients = [value + step * (target - value) for value, target in zip(coefficients, solution)]
+                free = [index for index in free if coefficients[index] > tolerance]
+                solution = cls._solve(gram, moments, free)
+            coefficients = solution
+
+        cost_model = cls(*coefficients)
+        cost_model.samples = list(samples)
+        return cost_model
+
+    @staticmethod
+    def _solve(gram, moments, free):
+        """Return the least squares coefficients with only the free ones allowed to be nonzero.
+
+        Solves the normal equations of the free coefficients by Gaussian elimination with partial pivoting; a
+        coefficient whose term does not vary in the samples is left zero.
+        """
+        size = len(free)
+        matrix = [[gram[i][j] for j in free] + [moments[i]] for i in free]
+        for column in range(size):
+            pivot = max(range(column, size), key=lambda index: abs(matrix[index][column]))
+            matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+            if abs(matrix[column][column]) < 1e-12:
+                continue  # the samples do not vary in this term; leave it zero
+            for index in range(size):
+                if index != column:
+                    factor = matrix[index][column] / matrix[column][column]
+                    matrix[index] = [a - factor * b for a, b in zip(matrix[index], matrix[column])]
+        coefficients = [0.0, 0.0, 0.0]
+        for column, index in enumerate(free):
+            if abs(matrix[column][column]) >= 1e-12:
+                coefficients[index] = matrix[column][size] / matrix[column][column]
+        return coefficients
+
+    def predict(self, num_crossings, num_flows):
+        """Return the predicted seconds of one run.
+
+        Args:
+            num_crossings (int): The number of crossings in the project.
+            num_flows (int): The total number of flows of the crossings.
+
+        Returns:
+            float: The seconds.
+        """
+        return self.startup + self.per_crossing * num_crossings + self.per_flow * num_flows
+
+    def crossing_cost(self, crossing):
+        """Return the seconds that a crossing adds to a run.
+
+        Args:
+            crossing (Hy8RunnerCulvertCrossing): The crossing.
+
+        Returns:
+            float: The seconds.
+        """
+        return self.per_crossing + self.per_flow * get_num_flows(crossing)
+
+
+class Hy8ShardPlanner():
+    """Splits an inventory of crossings into shards (projects) that a pool of workers finishes soonest.
+
+    Fewer shards pay the startup cost fewer times; more shards keep every worker busy and balance uneven crossings.
+    The planner tries shard counts from one up to a few per worker, balances the crossings of each count over its
+    shards, and keeps the count with the shortest predicted wall time.
+    """
+
+    def __init__(self, cost_model, num_workers=None, max_shard_size=None):
+        """Initializes the shard planner.
+
+        Args:
+            cost_model (Hy8RunnerCostModel): The model of the HY-8 runtime.
+            num_workers (int): The HY-8 processes that run at the same time; defaults to the number of CPUs.
+            max_shard_size (int): The most crossings in one shard; None has no limit.
+        """
+        self.cost_model = cost_model
+        self.num_workers = num_workers if num_workers else (os.cpu_count() or 1)
+        self.max_shard_size = max_shard_size
+        self.shards_per_worker = 4  # the most shards per worker that are tried
+
+    def plan(self, crossings):
+        """Split crossings into shards.
+
+        Args:
+            crossings (list of Hy8RunnerCulvertCrossing): The crossings.
+
+        Returns:
+            list of lists of ints: The indices of the crossings of each shard, in the order the shards should run.
+        """
+        if not crossings:
+            return []
+        costs = [self.cost_model.crossing_cost(crossing) for crossing in crossings]
+        min_shards = 1
+        if self.max_shard_size:
+            min_shards = -(-len(crossings) // self.max_shard_size)
+        max_shards = min(len(crossings), max(self.num_workers * self.shards_per_worker, min_shards))
+
+        best_shards = None
+        best_duration = None
+        for num_shards in range(min_shards, max_shards + 1):
+            shards = self._balance(costs, num_shards)
+            if shards is None:
+                continue
+            duration = self._predict_duration(shards, costs)
+            if best_duration is None or duration < best_duration:
+                best_shards = shards
+                best_duration = duration
+        return best_shards
+
+    def predict_duration(self, crossings, shards):
+        """Return the predicted wall time of running shards on the workers.
+
+        The shards are started in order, each on the first worker that is free, as Hy8BatchRunner does.
+
+        Args:
+            crossings (list of Hy8RunnerCulvertCrossing): The crossings.
+            shards (list of lists of ints): The indices of the crossings of each shard.
+
+        Returns:
+            float: The seconds from the first start to the last finish.
+        """
+        costs = [self.cost_model.crossing_cost(crossing) for crossing in crossings]
+        return self._predict_duration(shards, costs)
+
+    def _balance(self, costs, num_shards):
+        """Assign each crossing, most expensive first, to the shard with the least work.
+
+        Args:
+            costs (list of floats): The seconds each crossing adds to a run.
+            num_shards (int): The number of shards.
+
+        Returns:
+            list of lists of ints: The shards, most expensive first; None if a shard would exceed max_shard_size.
+        """
+        shards = [[] for _ in range(num_shards)]
+        heap = [(0.0, index) for index in range(num_shards)]
+        for crossing_index in sorted(range(len(costs)), key=lambda index: -costs[index]):
+            while True:
+                if not heap:
+                    return None
+                work, shard_index = heapq.heappop(heap)
+                if not self.max_shard_size or len(shards[shard_index]) < self.max_shard_size:
+                    break
+            shards[shard_index].append(crossing_index)
+            heapq.heappush(heap, (work + costs[crossing_index], shard_index))
+        shards = [sorted(shard) for shard in shards if shard]
+        shards.sort(key=lambda shard: -sum([costs[index] for index in shard]))
+        return shards
+
+    def _predict_duration(self, shards, costs):
+        """Return the predicted wall time of running shards, in order, on the workers.
+
+        Args:
+            shards (list of lists of ints): The indices of the crossings of each shard.
+            costs (list of floats): The seconds each crossing adds to a run.
+
+        Returns:
+            float: The seconds.
+        """
+        workers = [0.0] * min(self.num_workers, len(shards))
+        for shard in shards:
+            start = heapq.heappop(workers)
+            heapq.heappush(workers, start + self.cost_model.startup + sum([costs[index] for index in shard]))
+        return max(workers) if workers else 0.0
+
+
+def get_num_flows(crossing):
+    """Return the number of flows that HY-8 computes for a crossing.
+
+    Args:
+        crossing (Hy8RunnerCulvertCrossing): The crossing.
+
+    Returns:
+        int: The number of flows.
+    """
+    crossing.flow.compute_list()
+    return len(crossing.flow.flow_list)
+
+
+def calibrate(hy8_exe_path, work_dir, crossing_counts=(1, 4, 16), flow_counts=(5, 20), repeats=1, config=None):
+    """Time run_open_save on synthetic projects of increasing size and fit a cost model.
+
+    Args:
+        hy8_exe_path (string): The path to the HY-8 executable.
+        work_dir (string): The directory to create a private directory in for the synthetic projects; only the
+            private directory is removed afterwards.
+        crossing_counts (list of ints): The numbers of crossings to time.
+        flow_counts (list of ints): The numbers of flows per crossing to time.
+        repeats (int): The runs of each size.
+        config (Hy8RunnerConfig): The settings of the synthetic projects.
+
+    Returns:
+        Hy8RunnerCostModel: The fitted model, with the timed runs in samples.
+    """
+    samples = []
+    environment = Hy8RunnerEnvironment()
+    os.makedirs(work_dir, exist_ok=True)
+    calibrate_dir = tempfile.mkdtemp(prefix='hy8_calibrate_', dir=work_dir)
+    try:
+        for num_crossings in crossing_counts:
+            for num_flows in flow_counts:
+                hy8_runner = _create_synthetic_project(hy8_exe_path, calibrate_dir, num_crossings, num_flows, config)
+                result, messages = hy8_runner.create_hy8_file(environment=environment)
+                if not result:
+                    raise ValueError(messages)
+                for _ in range(repeats):
+                    run_result = hy8_runner.run_open_save()
+                    if not run_result.succeeded:
+                        raise RuntimeError(f'HY-8 calibration run failed: {run_result.status}')
+                    samples.append((num_crossings, num_crossings * num_flows, run_result.elapsed))
+    finally:
+        shutil.rmtree(calibrate_dir, ignore_errors=True)
+    return Hy8RunnerCostModel.fit(samples)
+
+
+def _create_synthetic_project(hy8_exe_path, work_dir, num_crossings, num_flows, config):
+    """Create a valid project with the requested numbers of crossings and flows per crossing."""
+    hy8_file = os.path.join(work_dir, f'calibrate_{num_crossings}_{num_flows}.hy8')
+    hy8_runner = Hy8Runner(hy8_exe_path, hy8_file, config)
+    for index in range(num_crossings):
+        if index > 0:
+            hy8_runner.add_crossing()
+        hy8_runner.set_discharge_user_list_flow([10.0 * (flow + 1) for flow in range(num_flows)])
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+    return hy8_runner
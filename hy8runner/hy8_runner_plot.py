@@ -0,0 +1,177 @@
+"""HY-8 plot data loader that gives random access to the per-discharge data of a plt file."""
+# 1. Standard python modules
+from array import array
+import mmap
+import re
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerPlotData']
+
+_CARD = re.compile(rb'\s*([A-Z][A-Z_]*)\s*(.*?)\s*$')
+
+
+class Hy8RunnerPlotData():
+    """Lazy access to the plot data in the plt file that HY-8 writes next to the HY-8 file.
+
+    The file is scanned once when it is opened to record the byte range of every crossing and discharge block;
+    nothing else is parsed. A block is read later with a single slice of a memory map of the file.
+
+    Each crossing is enclosed in STARTCROSSING "name" and ENDCROSSING, and each discharge in STARTDISCHARGE <flow>
+    and ENDDISCHARGE. Inside a discharge block, SERIES "name" starts a plot series and every following line of
+    numbers is one point of the series.
+
+    These block and series cards are the ones the stand-in HY-8 of the tests writes; they have not been checked
+    against a plt file written by HY-8 itself, and the scan needs to change to match one once it is captured (see
+    tests/files/hy8_captured_files).
+    """
+
+    def __init__(self, plt_file):
+        """Initializes the plot data and indexes the plt file.
+
+        Args:
+            plt_file (string): The path to the plt file.
+        """
+        self.plt_file = plt_file
+        self.crossing_names = []
+        self.block_crossing = array('l')
+        self.block_discharge = array('d')
+        self.block_start = array('q')
+        self.block_end = array('q')
+        self._blocks = {}  # (crossing index, discharge index) to block index
+
+        self._file = None
+        self._map = None
+        self._build_index()
+
+    def __enter__(self):
+        """Return the plot data for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the plt file at the end of a with statement."""
+        self.close()
+
+    def close(self):
+        """Close the memory map and the plt file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def num_crossings(self):
+        """Return the number of crossings in the plt file."""
+        return len(self.crossing_names)
+
+    def discharges(self, crossing_index):
+        """Return the discharges that have plot data for a crossing.
+
+        Args:
+            crossing_index (int): The index of the crossing.
+
+        Returns:
+            list of floats: The discharges, in file order.
+        """
+        return [discharge for crossing, discharge in zip(self.block_crossing, self.block_discharge)
+                if crossing == crossing_index]
+
+    def read_discharge(self, crossing_index, discharge_index):
+        """Read the plot series of one discharge of a crossing.
+
+        Args:
+            crossing_index (int): The index of the crossing.
+            discharge_index (int): The index of the discharge in the crossing.
+
+        Returns:
+            dict: The series name and a tuple with one array('d') per column of the series.
+        """
+        block = self._blocks.get((crossing_index, discharge_index))
+        if block is None:
+            raise KeyError(f'No plot data for crossing {crossing_index}, discharge {discharge_index}')
+        data = self._read_bytes(self.block_start[block], self.block_end[block])
+
+        series = {}
+        columns = None
+        for line in data.decode().splitlines():
+            tokens = line.split(None, 1)
+            if not tokens:
+                continue
+            if tokens[0] == 'SERIES':
+                name = tokens[1].strip().strip('"') if len(tokens) > 1 else ''
+                columns = None
+                series[name] = ()
+                continue
+            values = line.split()
+            try:
+                values = [float(value) for value in values]
+            except ValueError:
+                continue
+            if not series:
+                series[''] = ()
+                name = ''
+            if columns is None:
+                columns = tuple(array('d') for _ in values)
+                series[name] = columns
+            for column, value in zip(columns, values):
+                column.append(value)
+        return series
+
+    def _build_index(self):
+        """Scan the plt file once and record the byte range of each discharge block."""
+        crossing_index = -1
+        discharge_index = 0
+        block_start = None
+        discharge = None
+        offset = 0
+        with open(self.plt_file, 'rb') as file:
+            for line in file:
+                line_start = offset
+                offset += len(line)
+                match = _CARD.match(line)
+                if match is None:
+                    continue
+                card = match.group(1)
+                if card == b'STARTCROSSING':
+                    crossing_index += 1
+                    discharge_index = 0
+                    self.crossing_names.append(match.group(2).decode().strip('"'))
+                elif card == b'STARTDISCHARGE':
+                    block_start = offset
+                    discharge = float(match.group(2) or 'nan')
+                elif card == b'ENDDISCHARGE' and block_start is not None:
+                    self._blocks[(crossing_index, discharge_index)] = len(self.block_start)
+                    self.block_crossing.append(crossing_index)
+                    self.block_discharge.append(discharge)
+                    self.block_start.append(block_start)
+                    self.block_end.append(line_start)
+                    discharge_index += 1
+                    block_start = None
+
+    def _read_bytes(self, start, end):
+        """Read a byte range of the plt file through a memory map.
+
+        Args:
+            start (int): The first byte.
+            end (int): The byte after the last byte.
+
+        Returns:
+            bytes: The bytes of the range.
+        """
+        if start >= end:
+            return b''
+        if self._map is None:
+            self._file = open(self.plt_file, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[start:end]
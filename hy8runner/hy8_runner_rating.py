@@ -0,0 +1,204 @@
+"""HY-8 rating grid that answers headwater and flow queries from the tables HY-8 builds, without running HY-8."""
+# 1. Standard python modules
+import json
+import os
+
+# 2. Third party modules
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError('Hy8RatingGrid requires NumPy; install it with pip install hy8Runner[rating].') from error
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RatingGrid']
+
+
+class Hy8RatingGrid():
+    """A dense grid of a rating table, queried with vectorized bilinear interpolation.
+
+    The headwater grid (from run_build_flow_tw_table) has flow and tailwater axes and gives the headwater for a
+    (flow, tailwater) pair; the flow grid (from run_build_hw_tw_table) has headwater and tailwater axes and gives the
+    flow for a (headwater, tailwater) pair. values[i, j] is the value at x[i] and y[j], NaN where the table does not
+    cover that point. A grid saved to a directory is loaded memory-mapped, so a large grid is paged in as queries
+    touch it and can be shared by processes.
+
+    This module needs NumPy.
+    """
+
+    axis_names = {'headwater': ('flow', 'tailwater'), 'flow': ('headwater', 'tailwater')}
+
+    def __init__(self, x, y, values, value_name='headwater'):
+        """Initializes the rating grid.
+
+        Args:
+            x (array of floats): The increasing values of the first axis (flow or headwater).
+            y (array of floats): The increasing values of the tailwater axis.
+            values (2D array of floats): The value at each x and y, shape (len(x), len(y)).
+            value_name (string): 'headwater' or 'flow'.
+        """
+        if value_name not in self.axis_names:
+            raise ValueError(f'Unknown rating grid value: {value_name}')
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.values = values if isinstance(values, np.memmap) else np.asarray(values, dtype=np.float64)
+        if self.values.shape != (len(self.x), len(self.y)):
+            raise ValueError(f'Rating grid values have shape {self.values.shape}; the axes need '
+                             f'{(len(self.x), len(self.y))}.')
+        if len(self.x) == 0 or len(self.y) == 0:
+            raise ValueError('A rating grid needs at least one value on each axis.')
+        if np.any(np.diff(self.x) <= 0) or np.any(np.diff(self.y) <= 0):
+            raise ValueError('The axes of a rating grid must be increasing.')
+        self.value_name = value_name
+        self.x_name, self.y_name = self.axis_names[value_name]
+
+    @classmethod
+    def read_table(cls, table_file, value_name='headwater'):
+        """Read a table built by HY-8 into a grid.
+
+        The table has a header line naming its columns (Flow, Tailwater, and Headwater) and one row of numbers per
+        point. The points of each tailwater form a curve; each curve is interpolated onto the values of the first
+        axis of all curves, and is NaN beyond its own range, so tables whose curves have different points still
+        make a dense grid.
+
+        The header and columns are those the stand-in HY-8 of the tests writes; the layout of a table built by HY-8
+        itself with -BuildFlowTwTable or -BuildHwTwTable has not been checked, and this reader needs to change to
+        match it once one is captured (see tests/files/hy8_captured_files).
+
+        Args:
+            table_file (string): The path to the table file.
+            value_name (string): 'headwater' for a grid of headwater by flow and tailwater, or 'flow' for a grid of
+                flow by headwater and tailwater.
+
+        Returns:
+            Hy8RatingGrid: The grid.
+        """
+        if value_name not in cls.axis_names:
+            raise ValueError(f'Unknown rating grid value: {value_name}')
+        with open(table_file, 'r') as file:
+            header = file.readline().replace(',', ' ').lower().split()
+            columns = {}
+            for name in ('flow', 'tailwater', 'headwater'):
+                positions = [position for position, column in enumerate(header) if column.startswith(name)]
+                if not positions:
+                    raise ValueError(f"Table file {table_file} has no '{name}' column.")
+                columns[name] = positions[0]
+            rows = np.loadtxt((line.replace(',', ' ') for line in file), dtype=np.float64, ndmin=2)
+        if rows.size == 0:
+            raise ValueError(f'Table file {table_file} has no rows.')
+        x_name, y_name = cls.axis_names[value_name]
+        return cls.from_points(rows[:, columns[x_name]], rows[:, columns[y_name]], rows[:, columns[value_name]],
+                               value_name)
+
+    @classmethod
+    def from_points(cls, x, y, values, value_name='headwater'):
+        """Create a grid from the points of a table.
+
+        Args:
+            x (array of floats): The first axis value (flow or headwater) of each point.
+            y (array of floats): The tailwater of each point.
+            values (array of floats): The value of each point.
+            value_name (string): 'headwater' or 'flow'.
+
+        Returns:
+            Hy8RatingGrid: The grid.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        grid_x = np.unique(x)
+        grid_y = np.unique(y)
+        grid_values = np.full((len(grid_x), len(grid_y)), np.nan)
+        curve_index = np.searchsorted(grid_y, y)
+        for j in range(len(grid_y)):
+            in_curve = curve_index == j
+            curve_x = x[in_curve]
+            order = np.argsort(curve_x, kind='stable')
+            curve_x = curve_x[order]
+            curve_values = values[in_curve][order]
+            grid_values[:, j] = np.interp(grid_x, curve_x, curve_values, left=np.nan, right=np.nan)
+        return cls(grid_x, grid_y, grid_values, value_name)
+
+    def save(self, directory):
+        """Save the grid to a directory of .npy files that load can memory-map.
+
+        Args:
+            directory (string): The directory; it is created if it does not exist.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'x.npy'), self.x)
+        np.save(os.path.join(directory, 'y.npy'), self.y)
+        values = np.lib.format.open_memmap(os.path.join(directory, 'values.npy'), mode='w+', dtype=np.float64,
+                                           shape=self.values.shape)
+        values[:] = self.values
+        values.flush()
+        del values
+        with open(os.path.join(directory, 'grid.json'), 'w') as file:
+            json.dump({'value_name': self.value_name}, file)
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """Load a saved grid, with its values memory-mapped.
+
+        Args:
+            directory (string): The directory the grid was saved to.
+            mmap_mode (string): The NumPy memory-map mode; None reads the values into memory.
+
+        Returns:
+            Hy8RatingGrid: The grid.
+        """
+        with open(os.path.join(directory, 'grid.json'), 'r') as file:
+            value_name = json.load(file)['value_name']
+        return cls(np.load(os.path.join(directory, 'x.npy')), np.load(os.path.join(directory, 'y.npy')),
+                   np.load(os.path.join(directory, 'values.npy'), mmap_mode=mmap_mode), value_name)
+
+    def interpolate(self, x, y, clamp=False):
+        """Interpolate the grid at many points at once.
+
+        Args:
+            x (float or array of floats): The flows (headwater grid) or headwaters (flow grid).
+            y (float or array of floats): The tailwaters; broadcast against x.
+            clamp (bool): Whether points outside the grid take the value at the nearest edge instead of NaN.
+
+        Returns:
+            array of floats: The interpolated values, NaN where the grid does not cover the point.
+            array of bools: True where the point is outside the axes or touches a cell the table does not cover.
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        grid_x = self.x
+        grid_y = self.y
+        out_of_range = ~((x >= grid_x[0]) & (x <= grid_x[-1]) & (y >= grid_y[0]) & (y <= grid_y[-1]))
+        x = np.clip(x, grid_x[0], grid_x[-1])
+        y = np.clip(y, grid_y[0], grid_y[-1])
+
+        i0, i1, tx = self._locate(grid_x, x)
+        j0, j1, ty = self._locate(grid_y, y)
+        values = self.values
+        result = np.zeros(x.shape)
+        for i, weight_x in ((i0, 1.0 - tx), (i1, tx)):
+            for j, weight_y in ((j0, 1.0 - ty), (j1, ty)):
+                # A corner with no weight adds nothing, so a point on the edge of a covered cell keeps its value
+                weight = weight_x * weight_y
+                result += np.where(weight > 0.0, values[i, j] * weight, 0.0)
+        out_of_range |= np.isnan(result)
+        if not clamp:
+            result = np.where(out_of_range, np.nan, result)
+        return result, out_of_range
+
+    @staticmethod
+    def _locate(axis, points):
+        """Return the cell of each point on an axis and its fraction of the way across the cell."""
+        if len(axis) == 1:
+            zeros = np.zeros(points.shape, dtype=np.intp)
+            return zeros, zeros, np.zeros(points.shape)
+        lower = np.clip(np.searchsorted(axis, points, side='right') - 1, 0, len(axis) - 2)
+        upper = lower + 1
+        fraction = (points - axis[lower]) / (axis[upper] - axis[lower])
+        return lower, upper, fraction
@@ -0,0 +1,237 @@
+"""HY-8 results reader that parses the rst files created by HY-8 into columnar arrays."""
+# 1. Standard python modules
+from array import array
+import glob
+import os
+import re
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerResults', 'Hy8RunnerResultsReader']
+
+_QUOTED_TOKENS = re.compile(r'"([^"]*)"|(\S+)')
+
+
+class Hy8RunnerResults():
+    """Per-crossing, per-flow HY-8 results stored as columns of typed arrays.
+
+    Each row is one flow of one crossing. The rows of a crossing are contiguous, and crossing_offsets holds the
+    first row of each crossing (plus the total row count), so the rows of a crossing are a slice of every column.
+    """
+
+    float_columns = ('flow', 'headwater', 'tailwater', 'outlet_velocity', 'overtopping_flow')
+    columns = ('source', 'crossing') + float_columns + ('control',)
+
+    def __init__(self):
+        """Initializes the HY-8 results table."""
+        self.source = array('l')  # index into sources
+        self.crossing = array('l')  # index of the crossing in its source file
+        self.flow = array('d')
+        self.headwater = array('d')
+        self.tailwater = array('d')
+        self.outlet_velocity = array('d')
+        self.overtopping_flow = array('d')
+        self.control = array('l')  # index into control_types
+
+        self.sources = []
+        self.control_types = []
+        self.crossing_names = []
+        self.crossing_offsets = array('q', [0])
+
+        self._control_codes = {}
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self.flow)
+
+    @property
+    def num_crossings(self):
+        """Return the number of crossings."""
+        return len(self.crossing_names)
+
+    def column(self, name):
+        """Return a column of the table.
+
+        Args:
+            name (string): The column name.
+
+        Returns:
+            array: The column values.
+        """
+        if name not in self.columns:
+            raise KeyError(f'Unknown results column: {name}')
+        return getattr(self, name)
+
+    def control_code(self, control_type):
+        """Return the code for a control type, adding it to the control types if it is new.
+
+        Args:
+            control_type (string): The control type, for example 'Inlet Control'.
+
+        Returns:
+            int: The index of the control type in control_types.
+        """
+        code = self._control_codes.get(control_type)
+        if code is None:
+            code = len(self.control_types)
+            self.control_types.append(control_type)
+            self._control_codes[control_type] = code
+        return code
+
+    def crossing_rows(self, crossing_index):
+        """Return the row range of a crossing.
+
+        Args:
+            crossing_index (int): The index of the crossing in the table.
+
+        Returns:
+            range: The rows of the crossing.
+        """
+        return range(self.crossing_offsets[crossing_index], self.crossing_offsets[crossing_index + 1])
+
+    def get_crossing(self, crossing_index):
+        """Return the columns of a single crossing.
+
+        Args:
+            crossing_index (int): The index of the crossing in the table.
+
+        Returns:
+            dict: The column name and the column values of the crossing; control holds the control type strings.
+        """
+        start = self.crossing_offsets[crossing_index]
+        stop = self.crossing_offsets[crossing_index + 1]
+        values = {name: getattr(self, name)[start:stop] for name in self.float_columns}
+        values['control'] = [self.control_types[code] for code in self.control[start:stop]]
+        return values
+
+    def add_crossing(self, source_index, crossing_index, name, values):
+        """Append the rows of a crossing.
+
+        Args:
+            source_index (int): The index of the source file in sources.
+            crossing_index (int): The index of the crossing in its source file.
+            name (string): The name of the crossing.
+            values (dict): The column name and the list or array of values for each float column and for control,
+                which holds control type strings. Short columns are padded with NaN (or '' for control).
+        """
+        num_rows = max([len(column) for column in values.values()], default=0)
+        for name_column in self.float_columns:
+            column = values.get(name_column, ())
+            target = getattr(self, name_column)
+            target.extend(column)
+            if len(column) < num_rows:
+                target.extend([float('nan')] * (num_rows - len(column)))
+        controls = list(values.get('control', ()))
+        controls.extend([''] * (num_rows - len(controls)))
+        self.control.extend([self.control_code(control) for control in controls])
+        self.source.extend([source_index] * num_rows)
+        self.crossing.extend([crossing_index] * num_rows)
+        self.crossing_names.append(name)
+        self.crossing_offsets.append(self.crossing_offsets[-1] + num_rows)
+
+    def extend(self, other):
+        """Append the rows of another results table.
+
+        Args:
+            other (Hy8RunnerResults): The results to append.
+        """
+        source_offset = len(self.sources)
+        self.sources.extend(other.sources)
+        self.source.extend([source + source_offset for source in other.source])
+        self.crossing.extend(other.crossing)
+        for name in self.float_columns:
+            getattr(self, name).extend(getattr(other, name))
+        codes = [self.control_code(control_type) for control_type in other.control_types]
+        self.control.extend([codes[code] for code in other.control])
+        row_offset = self.crossing_offsets[-1]
+        self.crossing_offsets.extend([offset + row_offset for offset in other.crossing_offsets[1:]])
+        self.crossing_names.extend(other.crossing_names)
+
+
+class Hy8RunnerResultsReader():
+    """A reader for the rst results file that HY-8 writes next to the HY-8 file.
+
+    The rst file is read as cards. Each crossing is enclosed in STARTCROSSING "name" and ENDCROSSING, and each
+    result card holds one or more values, one per flow, in flow order; a card may be repeated to continue the list.
+    The card names are mapped to columns by result_cards.
+
+    This layout and these card names have not been checked against an rst file written by HY-8 itself; they are the
+    ones the stand-in HY-8 of the tests writes. Once a real rst file is captured (see
+    tests/files/hy8_captured_files), fix result_cards and the parser to match it; the packer, sweep, and exporter
+    read their results through this class.
+    """
+
+    result_cards = {
+        'DISCHARGE': 'flow',
+        'HEADWATERELEVATION': 'headwater',
+        'TAILWATERELEVATION': 'tailwater',
+        'CONTROLTYPE': 'control',
+        'OUTLETVELOCITY': 'outlet_velocity',
+        'OVERTOPPINGFLOW': 'overtopping_flow',
+    }
+
+    def read(self, rst_file, results=None):
+        """Read an rst file.
+
+        Args:
+            rst_file (string): The path to the rst file.
+            results (Hy8RunnerResults): The results to append to; a new table is created when None.
+
+        Returns:
+            Hy8RunnerResults: The results.
+        """
+        if results is None:
+            results = Hy8RunnerResults()
+        source_index = len(results.sources)
+        results.sources.append(rst_file)
+        result_cards = self.result_cards
+
+        crossing_index = 0
+        name = None
+        values = None
+        with open(rst_file, 'r') as file:
+            for line in file:
+                tokens = line.split(None, 1)
+                if not tokens:
+                    continue
+                card = tokens[0]
+                column = result_cards.get(card)
+                if column is not None and values is not None:
+                    text = tokens[1] if len(tokens) > 1 else ''
+                    if column == 'control':
+                        values[column].extend([quoted or token for quoted, token in _QUOTED_TOKENS.findall(text)])
+                    else:
+                        values[column].extend(map(float, text.split()))
+                elif card == 'STARTCROSSING':
+                    name = tokens[1].strip().strip('"') if len(tokens) > 1 else ''
+                    values = {column: [] if column == 'control' else array('d')
+                              for column in result_cards.values()}
+                elif card == 'ENDCROSSING' and values is not None:
+                    results.add_crossing(source_index, crossing_index, name, values)
+                    crossing_index += 1
+                    values = None
+        return results
+
+    def read_directory(self, directory, pattern='*.rst'):
+        """Read every rst file in a directory into one concatenated results table.
+
+        Args:
+            directory (string): The directory holding the rst files.
+            pattern (string): The glob pattern of the files to read.
+
+        Returns:
+            Hy8RunnerResults: The results; the source column identifies the file of each row.
+        """
+        results = Hy8RunnerResults()
+        for rst_file in sorted(glob.glob(os.path.join(directory, pattern))):
+            self.read(rst_file, results)
+        return results
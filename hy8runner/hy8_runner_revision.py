@@ -0,0 +1,43 @@
+"""HY-8 Runner revision tracking that lets serialized blocks be reused until their data changes."""
+# 1. Standard python modules
+import itertools
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerRevisioned']
+
+_next_revision = itertools.count(1).__next__
+
+
+class Hy8RunnerRevisioned():
+    """A base class whose revision changes every time one of its attributes is set.
+
+    Revisions are unique across all objects, so a revision seen before always means the same object with the same
+    attribute values. Changes made in place (such as crossing.roadway_stations[0] = 5.0) do not set an attribute;
+    call mark_modified after them.
+    """
+
+    __slots__ = ('_revision',)
+
+    def __setattr__(self, name, value):
+        """Set the attribute and take a new revision."""
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_revision', _next_revision())
+
+    @property
+    def revision(self):
+        """Return the revision of the object."""
+        return self._revision
+
+    def mark_modified(self):
+        """Take a new revision after a change made in place."""
+        object.__setattr__(self, '_revision', _next_revision())
@@ -0,0 +1,186 @@
+"""HY-8 rsql reader that pulls selected result columns out of the rsql results database."""
+# 1. Standard python modules
+from array import array
+import sqlite3
+from urllib.request import pathname2url
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerRsqlReader']
+
+
+def _quote_identifier(name):
+    """Quote a table or column name for use in SQL.
+
+    Args:
+        name (string): The table or column name.
+
+    Returns:
+        string: The quoted name.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _to_column(values):
+    """Store the values of a column in a compact array when they are numeric.
+
+    Args:
+        values (list): The column values.
+
+    Returns:
+        array or list: An array('q') for integers, an array('d') for floats (None becomes NaN), otherwise the list.
+    """
+    if all(type(value) is int for value in values):
+        return array('q', values)
+    try:
+        return array('d', [float('nan') if value is None else value for value in values])
+    except TypeError:
+        return values
+
+
+class Hy8RunnerRsqlReader():
+    """A reader for the rsql SQLite database that HY-8 writes next to the HY-8 file.
+
+    Only the requested columns are read, for the requested crossings and flows. The crossing and flow keys are
+    passed as query parameters through temporary key tables, so any number of keys is one indexed query, and the
+    table and column names are checked against the database schema before they are used.
+
+    The default table and key column names (Results, CrossingIndex, FlowIndex) are those of the stand-in HY-8 of the
+    tests and have not been checked against an rsql file written by HY-8 itself. Pass the real names to the
+    constructor, and correct the defaults, once a real rsql file is captured (see tests/files/hy8_captured_files).
+    """
+
+    def __init__(self, rsql_file, table='Results', crossing_column='CrossingIndex', flow_column='FlowIndex',
+                 read_only=True):
+        """Initializes the rsql reader.
+
+        Args:
+            rsql_file (string): The path to the rsql file.
+            table (string): The results table to read.
+            crossing_column (string): The column that identifies the crossing of a row.
+            flow_column (string): The column that identifies the flow of a row.
+            read_only (bool): Open the database read only; create_index needs it to be False.
+        """
+        self.rsql_file = rsql_file
+        self.table = table
+        self.crossing_column = crossing_column
+        self.flow_column = flow_column
+        self.read_only = read_only
+
+        mode = 'ro' if read_only else 'rw'
+        self.connection = sqlite3.connect(f'file:{pathname2url(rsql_file)}?mode={mode}', uri=True)
+        self._columns = {}
+
+    def __enter__(self):
+        """Return the reader for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the database at the end of a with statement."""
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
+
+    def tables(self):
+        """Return the names of the tables in the database.
+
+        Returns:
+            list of strings: The table names.
+        """
+        rows = self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+        return [row[0] for row in rows]
+
+    def columns(self, table=None):
+        """Return the column names of a table.
+
+        Args:
+            table (string): The table; defaults to the results table.
+
+        Returns:
+            list of strings: The column names.
+        """
+        if table is None:
+            table = self.table
+        if table not in self._columns:
+            rows = self.connection.execute(f'PRAGMA table_info({_quote_identifier(table)})').fetchall()
+            if not rows:
+                raise KeyError(f"Table '{table}' does not exist in {self.rsql_file}")
+            self._columns[table] = [row[1] for row in rows]
+        return self._columns[table]
+
+    def create_index(self):
+        """Create an index on the crossing and flow columns of the results table, if it does not exist."""
+        if self.read_only:
+            raise PermissionError('The rsql file must be opened with read_only=False to create an index.')
+        self._check_columns([self.crossing_column, self.flow_column])
+        index_name = _quote_identifier(f'idx_{self.table}_{self.crossing_column}_{self.flow_column}')
+        self.connection.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {_quote_identifier(self.table)} '
+                                f'({_quote_identifier(self.crossing_column)}, {_quote_identifier(self.flow_column)})')
+        self.connection.commit()
+
+    def read(self, columns, crossings=None, flows=None):
+        """Read the requested columns for the requested crossings and flows.
+
+        Args:
+            columns (list of strings): The columns to read, for example ['Freeboard'].
+            crossings (list): The crossing keys to read; None reads every crossing.
+            flows (list): The flow keys to read; None reads every flow.
+
+        Returns:
+            dict: The crossing column, the flow column, and each requested column, keyed by column name. Numeric
+                columns are compact arrays.
+        """
+        key_columns = [self.crossing_column, self.flow_column]
+        names = key_columns + [column for column in columns if column not in key_columns]
+        self._check_columns(names)
+
+        selected = ', '.join([_quote_identifier(name) for name in names])
+        sql = f'SELECT {selected} FROM {_quote_identifier(self.table)}'
+        conditions = []
+        for column, keys, key_table in ((self.crossing_column, crossings, '_hy8_crossing_keys'),
+                                        (self.flow_column, flows, '_hy8_flow_keys')):
+            if keys is None:
+                continue
+            self._fill_key_table(key_table, keys)
+            conditions.append(f'{_quote_identifier(column)} IN (SELECT key FROM temp.{key_table})')
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += f' ORDER BY {_quote_identifier(self.crossing_column)}, {_quote_identifier(self.flow_column)}'
+
+        rows = self.connection.execute(sql).fetchall()
+        values = list(zip(*rows)) if rows else [() for _ in names]
+        return {name: _to_column(list(column)) for name, column in zip(names, values)}
+
+    def _check_columns(self, names):
+        """Make sure the columns exist in the results table.
+
+        Args:
+            names (list of strings): The column names.
+        """
+        existing = set(self.columns())
+        missing = [name for name in names if name not in existing]
+        if missing:
+            raise KeyError(f"Columns {missing} do not exist in table '{self.table}' of {self.rsql_file}")
+
+    def _fill_key_table(self, key_table, keys):
+        """Fill a temporary table with the keys to select.
+
+        Args:
+            key_table (string): The name of the temporary table.
+            keys (list): The keys.
+        """
+        connection = self.connection
+        connection.execute(f'CREATE TEMP TABLE IF NOT EXISTS {key_table} (key PRIMARY KEY)')
+        connection.execute(f'DELETE FROM temp.{key_table}')
+        connection.executemany(f'INSERT OR IGNORE INTO temp.{key_table} (key) VALUES (?)', [(key,) for key in keys])
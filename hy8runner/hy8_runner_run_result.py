@@ -0,0 +1,163 @@
+"""HY-8 run result and retry policy classes used when HY-8 Runner launches the HY-8 executable."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerRetryPolicy', 'Hy8RunnerRunResult', 'get_changed_files', 'get_output_suffix',
+           'snapshot_output_files']
+
+OUTPUT_EXTENSIONS = ('.hy8', '.rst', '.plt', '.rsql', '.table', '.docx')  # the files HY-8 writes for an HY-8 file
+
+
+class Hy8RunnerRunResult():
+    """The outcome of running the HY-8 executable on an HY-8 file."""
+
+    def __init__(self, command):
+        """Initializes the run result.
+
+        Args:
+            command (list of strings): The command that was run.
+        """
+        self.command = command
+        self.returncode = None
+        self.elapsed = 0.0  # wall time in seconds of all attempts, including retry delays
+        self.stdout = ''
+        self.stderr = ''
+        self.output_files = []
+        self.timed_out = False
+        self.attempts = 0
+        self.error = ''  # set when HY-8 could not be started
+        self.cached = False  # set when the output files were restored from a results cache instead of running HY-8
+
+    @property
+    def succeeded(self):
+        """Return True if HY-8 ran to completion and returned zero."""
+        return self.returncode == 0 and not self.timed_out
+
+    @property
+    def status(self):
+        """Return 'success', 'failed', 'timeout', or 'error'."""
+        if self.error:
+            return 'error'
+        if self.timed_out:
+            return 'timeout'
+        return 'success' if self.returncode == 0 else 'failed'
+
+
+class Hy8RunnerRetryPolicy():
+    """Decides whether a failed HY-8 run is tried again, and how long to wait first."""
+
+    def __init__(self, max_attempts=1, delay=0.0, backoff=2.0, retry_on_timeout=True, retry_returncodes=None):
+        """Initializes the retry policy.
+
+        Args:
+            max_attempts (int): The most times HY-8 is run, including the first run.
+            delay (float): The seconds to wait before the first retry.
+            backoff (float): The factor that the delay grows by after each retry.
+            retry_on_timeout (bool): Retry runs that were stopped by the timeout.
+            retry_returncodes (list of ints): The return codes to retry; None retries every non-zero return code.
+        """
+        self.max_attempts = max_attempts
+        self.delay = delay
+        self.backoff = backoff
+        self.retry_on_timeout = retry_on_timeout
+        self.retry_returncodes = retry_returncodes
+
+    def should_retry(self, run_result):
+        """Return True if the run should be tried again.
+
+        Args:
+            run_result (Hy8RunnerRunResult): The result of the attempts so far.
+
+        Returns:
+            bool: True if there is an attempt left and the failure is one to retry.
+        """
+        if run_result.succeeded or run_result.error or run_result.attempts >= self.max_attempts:
+            return False
+        if run_result.timed_out:
+            return self.retry_on_timeout
+        return self.retry_returncodes is None or run_result.returncode in self.retry_returncodes
+
+    def get_delay(self, attempt):
+        """Return the seconds to wait after a failed attempt.
+
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+
+        Returns:
+            float: The delay.
+        """
+        return self.delay * self.backoff ** (attempt - 1)
+
+
+def get_output_suffix(output_file, hy8_file):
+    """Return what follows the base name of an HY-8 file in the name of one of its output files.
+
+    HY-8 names the output files of job_1.hy8 with its base name and an extension (job_1.rst), and its plot images
+    with the base name and '--' (job_1--Culvert0--WaterProfile0.bmp). Other files that only start with the base
+    name, such as job_10.rst, belong to other HY-8 files.
+
+    Args:
+        output_file (string): The path to the file.
+        hy8_file (string): The path to the HY-8 file, in the same form as output_file.
+
+    Returns:
+        string: The suffix, for example '.rst'; None if the file is not an output file of the HY-8 file.
+    """
+    stem = os.path.splitext(hy8_file)[0]
+    if not os.path.normcase(output_file).startswith(os.path.normcase(stem)):
+        return None
+    suffix = output_file[len(stem):]
+    if suffix.lower() in OUTPUT_EXTENSIONS or suffix.startswith('--'):
+        return suffix
+    return None
+
+
+def snapshot_output_files(hy8_file):
+    """Record the output files next to an HY-8 file (see get_output_suffix).
+
+    Args:
+        hy8_file (string): The path to the HY-8 file.
+
+    Returns:
+        dict: The path of each file and its (modified time, size).
+    """
+    directory = os.path.dirname(hy8_file) or '.'
+    stem = os.path.splitext(os.path.basename(hy8_file))[0]
+    snapshot = {}
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return snapshot
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(stem) and entry.is_file():
+                path = os.path.join(os.path.dirname(hy8_file), entry.name)
+                if os.path.normcase(path) == os.path.normcase(hy8_file) or get_output_suffix(path, hy8_file) is None:
+                    continue
+                stat = entry.stat()
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def get_changed_files(before, after):
+    """Return the files that are new or changed between two snapshots.
+
+    Args:
+        before (dict): The snapshot taken before the run.
+        after (dict): The snapshot taken after the run.
+
+    Returns:
+        list of strings: The sorted paths of the new or changed files.
+    """
+    return sorted([path for path, state in after.items() if before.get(path) != state])
@@ -0,0 +1,292 @@
+"""HY-8 parameter sweep that runs culvert sizing studies over many variants of a crossing."""
+# 1. Standard python modules
+from array import array
+import copy
+import itertools
+import math
+import numbers
+import os
+import random
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_packer import Hy8CrossingPacker
+from hy8runner.hy8_runner_results import Hy8RunnerResults
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerSweep', 'Hy8SweepResults']
+
+
+class Hy8SweepResults():
+    """The results of a parameter sweep, with the parameter values of each variant stored as columns.
+
+    results holds one crossing per completed variant, in design order, and its crossing column holds the design
+    index of the variant. Numeric parameters are stored as array('d'); other parameters (material, shape) as codes
+    into levels, like the control types of Hy8RunnerResults.
+    """
+
+    def __init__(self, parameter_names, categorical_names=()):
+        """Initializes the sweep results.
+
+        Args:
+            parameter_names (list of strings): The names of the swept parameters.
+            categorical_names (list of strings): The parameters whose values are not numbers.
+        """
+        self.parameter_names = list(parameter_names)
+        self.results = Hy8RunnerResults()
+        self.design_index = array('q')  # the design index of each completed variant
+        self.parameters = {name: array('l') if name in categorical_names else array('d') for name in parameter_names}
+        self.levels = {name: [] for name in categorical_names}
+        self.failed = array('q')  # the design indices of the variants that did not run
+
+        self._level_codes = {name: {} for name in categorical_names}
+
+    def __len__(self):
+        """Return the number of completed variants."""
+        return len(self.design_index)
+
+    def add_variant(self, design_index, values, crossing_values):
+        """Append the parameter values and results of a completed variant.
+
+        Args:
+            design_index (int): The index of the variant in the design.
+            values (tuple): The parameter values, in the order of parameter_names.
+            crossing_values (dict): The results columns of the variant, as given by Hy8RunnerResults.get_crossing.
+        """
+        for name, value in zip(self.parameter_names, values):
+            codes = self._level_codes.get(name)
+            if codes is not None:
+                code = codes.get(value)
+                if code is None:
+                    code = len(self.levels[name])
+                    self.levels[name].append(value)
+                    codes[value] = code
+                value = code
+            self.parameters[name].append(value)
+        self.design_index.append(design_index)
+        self.results.add_crossing(0, design_index, f'Variant {design_index}', crossing_values)
+
+    def get_value(self, name, position):
+        """Return the value of a parameter for a completed variant.
+
+        Args:
+            name (string): The parameter name.
+            position (int): The position of the variant in the results.
+
+        Returns:
+            The parameter value.
+        """
+        value = self.parameters[name][position]
+        if name in self.levels:
+            return self.levels[name][value]
+        return value
+
+    def find(self, **values):
+        """Return the positions of the completed variants with the given parameter values.
+
+        Args:
+            values (dict): The parameter name and value to match, for example span=5.0.
+
+        Returns:
+            list of ints: The positions, in design order.
+        """
+        for name in values:
+            if name not in self.parameters:
+                raise KeyError(f'Unknown sweep parameter: {name}')
+        return [position for position in range(len(self))
+                if all([self.get_value(name, position) == value for name, value in values.items()])]
+
+    def get_variant(self, position):
+        """Return the parameter values and the results of a completed variant.
+
+        Args:
+            position (int): The position of the variant in the results.
+
+        Returns:
+            dict: The parameter values and the results columns of the variant.
+        """
+        variant = {name: self.get_value(name, position) for name in self.parameter_names}
+        variant.update(self.results.get_crossing(position))
+        return variant
+
+    def column(self, name):
+        """Return a column of the tidy table, with one row per flow of each completed variant.
+
+        Args:
+            name (string): A parameter name, 'design_index', or a column of Hy8RunnerResults.
+
+        Returns:
+            array or list: The column values; parameter values are repeated for each flow of the variant.
+        """
+        if name in self.parameters or name == 'design_index':
+            offsets = self.results.crossing_offsets
+            repeats = [offsets[position + 1] - offsets[position] for position in range(len(self))]
+            if name == 'design_index':
+                values = self.design_index
+            else:
+                values = self.parameters[name]
+            if name in self.levels:
+                levels = self.levels[name]
+                return [levels[code] for code, count in zip(values, repeats) for _ in range(count)]
+            column = array(values.typecode)
+            for value, count in zip(values, repeats):
+                column.extend(array(values.typecode, [value]) * count)
+            return column
+        return self.results.column(name)
+
+
+class Hy8RunnerSweep():
+    """Generates the variants of a crossing over parameter ranges and runs them packed into multi-crossing projects.
+
+    The design (a Cartesian product or a Latin hypercube sample) is produced lazily, one tuple of parameter values at
+    a time, and variants are built, run, and reduced to result columns one chunk at a time, so the variants are never
+    all held in memory as crossings.
+
+    With the 'cartesian' design, each parameter is a sequence of values. With the 'latin-hypercube' design, a
+    (low, high) tuple is sampled continuously (as integers if both bounds are integers) and a list is sampled as
+    discrete levels.
+    """
+
+    culvert_parameters = ('shape', 'material', 'span', 'rise', 'number_of_barrels', 'inlet_invert_elevation',
+                          'inlet_invert_station', 'outlet_invert_elevation', 'outlet_invert_station')
+    designs = ('cartesian', 'latin-hypercube')
+
+    def __init__(self, base_crossing, parameters, design='cartesian', num_samples=None, seed=None, culvert_index=0):
+        """Initializes the parameter sweep.
+
+        Args:
+            base_crossing (Hy8RunnerCulvertCrossing): The crossing that every variant copies.
+            parameters (dict): The culvert parameter names and their values or ranges.
+            design (string): 'cartesian' or 'latin-hypercube'.
+            num_samples (int): The number of Latin hypercube samples.
+            seed (int): The seed of the Latin hypercube sample; a random seed is chosen (and kept) when None.
+            culvert_index (int): The index of the culvert barrel that the parameters change.
+        """
+        for name in parameters:
+            if name not in self.culvert_parameters:
+                raise ValueError(f'Unknown culvert parameter: {name}')
+        if design not in self.designs:
+            raise ValueError(f'Unknown sweep design: {design}')
+        if design == 'latin-hypercube' and not num_samples:
+            raise ValueError('A Latin hypercube design needs a number of samples.')
+
+        self.base_crossing = base_crossing
+        self.parameter_names = list(parameters)
+        self.parameter_values = [parameters[name] for name in self.parameter_names]
+        self.design = design
+        self.num_samples = num_samples
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.culvert_index = culvert_index
+
+    def __len__(self):
+        """Return the number of variants in the design."""
+        if self.design == 'latin-hypercube':
+            return self.num_samples
+        return math.prod([len(values) for values in self.parameter_values])
+
+    @property
+    def categorical_names(self):
+        """Return the parameters whose values are not numbers."""
+        return [name for name, values in zip(self.parameter_names, self.parameter_values)
+                if not all([isinstance(value, numbers.Number) and not isinstance(value, bool) for value in values])]
+
+    def iter_designs(self):
+        """Generate the parameter values of each variant.
+
+        Yields:
+            tuple: The parameter values, in the order of parameter_names.
+        """
+        if self.design == 'cartesian':
+            yield from itertools.product(*self.parameter_values)
+            return
+
+        rng = random.Random(self.seed)
+        strata = []
+        for _ in self.parameter_values:
+            permutation = array('q', range(self.num_samples))
+            rng.shuffle(permutation)
+            strata.append(permutation)
+        for sample in range(self.num_samples):
+            values = []
+            for values_or_range, permutation in zip(self.parameter_values, strata):
+                fraction = (permutation[sample] + rng.random()) / self.num_samples
+                values.append(self._get_sample_value(values_or_range, fraction))
+            yield tuple(values)
+
+    def iter_crossings(self):
+        """Generate the crossing of each variant.
+
+        Yields:
+            int: The design index of the variant.
+            tuple: The parameter values of the variant.
+            Hy8RunnerCulvertCrossing: A copy of the base crossing with the parameter values set.
+        """
+        for design_index, values in enumerate(self.iter_designs()):
+            crossing = copy.deepcopy(self.base_crossing)
+            crossing.name = f'Variant {design_index}'
+            culvert = crossing.culverts[self.culvert_index]
+            for name, value in zip(self.parameter_names, values):
+                setattr(culvert, name, value)
+            yield design_index, values, crossing
+
+    def run(self, work_dir, hy8_exe_path='', pack_size=100, max_workers=None, config=None, chunk_size=None):
+        """Run every variant and collect the results.
+
+        Args:
+            work_dir (string): The directory for the packed HY-8 files and their results.
+            hy8_exe_path (string): The path to the HY-8 executable.
+            pack_size (int): The most variants in one packed project.
+            max_workers (int): The most HY-8 processes to run at the same time; defaults to the number of CPUs.
+            config (Hy8RunnerConfig): The settings of the packed projects.
+            chunk_size (int): The variants built and run at a time; defaults to four packs per worker.
+
+        Returns:
+            Hy8SweepResults: The parameter values and results of each completed variant.
+        """
+        packer = Hy8CrossingPacker(work_dir, pack_size, hy8_exe_path, max_workers, config)
+        if not chunk_size:
+            chunk_size = pack_size * 4 * (max_workers or os.cpu_count() or 1)
+        sweep_results = Hy8SweepResults(self.parameter_names, self.categorical_names)
+        sweep_results.results.sources.append(work_dir)
+
+        variants = self.iter_crossings()
+        while True:
+            chunk = list(itertools.islice(variants, chunk_size))
+            if not chunk:
+                break
+            packer.clear()
+            for design_index, _, crossing in chunk:
+                packer.add_crossing(crossing, design_index)
+            crossing_results = packer.run()
+            for design_index, values, _ in chunk:
+                crossing_values = crossing_results.get(design_index)
+                if crossing_values is None:
+                    sweep_results.failed.append(design_index)
+                else:
+                    sweep_results.add_variant(design_index, values, crossing_values)
+        return sweep_results
+
+    @staticmethod
+    def _get_sample_value(values_or_range, fraction):
+        """Return the value at a fraction of a range or a list of levels.
+
+        Args:
+            values_or_range (tuple or list): A (low, high) range or a list of levels.
+            fraction (float): The position in the range, from 0 to 1.
+
+        Returns:
+            The value.
+        """
+        if isinstance(values_or_range, tuple) and len(values_or_range) == 2:
+            low, high = values_or_range
+            if isinstance(low, int) and isinstance(high, int):
+                return min(low + int(fraction * (high - low + 1)), high)
+            return low + fraction * (high - low)
+        return values_or_range[min(int(fraction * len(values_or_range)), len(values_or_range) - 1)]
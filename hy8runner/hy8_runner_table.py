@@ -0,0 +1,383 @@
+"""HY-8 crossing table that holds an inventory of crossings as columns and writes HY-8 files from them."""
+# 1. Standard python modules
+from array import array
+import datetime
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_config import Hy8RunnerConfig
+from hy8runner.hy8_runner_crossing import get_crossing_string, Hy8RunnerCulvertCrossing
+from hy8runner.hy8_runner_culvert import get_culvert_string, Hy8RunnerCulvertBarrel
+from hy8runner.hy8_runner_flow import get_flow_range
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8CrossingTable']
+
+
+class Hy8CrossingTable():
+    """An inventory of crossings stored as a struct of arrays, with one column per field.
+
+    Each crossing is one row of the crossing columns, and each culvert barrel one row of the culvert columns.
+    Ragged data (the flows, the roadway stations and elevations, the tailwater rating curve, and the culverts of a
+    crossing) is stored as one long column with an offsets array, so the values of crossing i are
+    column[offsets[name][i]:offsets[name][i + 1]]. Text columns (shape, material, flow method, roadway surface) are
+    stored as codes into levels, like the control types of Hy8RunnerResults.
+
+    The columns are named after the attributes of Hy8RunnerCulvertCrossing, Hy8RunnerFlow, and
+    Hy8RunnerCulvertBarrel; the flow method is flow_method and the culvert name and notes are culvert_name and
+    culvert_notes. Numbers are stored as floats, with a flag for each value that was given as an int, so a crossing
+    given 25 is written as 25 by the table too, not as 25.0.
+    """
+
+    crossing_float_columns = ('flow_min', 'flow_design', 'flow_max', 'flow_increment', 'tw_bottom_width',
+                              'tw_sideslope', 'tw_channel_slope', 'tw_manning_n', 'tw_constant_elevation',
+                              'tw_invert_elevation', 'roadway_width')
+    crossing_int_columns = ('tw_type', 'roadway_shape')
+    crossing_code_columns = ('flow_method', 'roadway_surface')
+    crossing_text_columns = ('name', 'notes', 'uuid')
+    culvert_float_columns = ('span', 'rise', 'inlet_invert_elevation', 'inlet_invert_station',
+                             'outlet_invert_elevation', 'outlet_invert_station')
+    culvert_int_columns = ('number_of_barrels',)
+    culvert_code_columns = ('shape', 'material')
+    culvert_text_columns = ('culvert_name', 'culvert_notes')
+    ragged_columns = {'flows': 'flows', 'roadway_stations': 'roadway_stations',
+                      'roadway_elevations': 'roadway_elevations', 'rating_flow': 'tw_rating_curve',
+                      'rating_elevation': 'tw_rating_curve', 'rating_velocity': 'tw_rating_curve'}
+    rating_columns = ('rating_flow', 'rating_elevation', 'rating_velocity')
+    default_levels = {'flow_method': ('min-design-max', 'user-defined', 'min-max-increment'),
+                      'roadway_surface': ('paved', 'gravel', 'user-defined'),
+                      'shape': ('circle', 'box'),
+                      'material': ('concrete', 'corrugated steel')}
+
+    def __init__(self):
+        """Initializes the crossing table."""
+        for name in self.crossing_float_columns + self.culvert_float_columns + tuple(self.ragged_columns):
+            setattr(self, name, array('d'))
+        for name in self.crossing_int_columns + self.culvert_int_columns + self.crossing_code_columns + \
+                self.culvert_code_columns:
+            setattr(self, name, array('l'))
+        for name in self.crossing_text_columns + self.culvert_text_columns:
+            setattr(self, name, [])
+
+        # The first row of each crossing in a ragged column or the culvert columns, plus the total row count
+        self.offsets = {name: array('q', [0]) for name in ('flows', 'roadway_stations', 'roadway_elevations',
+                                                           'tw_rating_curve', 'culverts')}
+        # Whether each value of a float column was given as an int
+        self.integer_values = {name: array('b') for name in self.crossing_float_columns + self.culvert_float_columns +
+                               self.rating_columns}
+        self.levels = {name: list(levels) for name, levels in self.default_levels.items()}
+        self._level_codes = {name: {level: code for code, level in enumerate(levels)}
+                             for name, levels in self.levels.items()}
+
+    def __len__(self):
+        """Return the number of crossings."""
+        return len(self.name)
+
+    @property
+    def num_culverts(self):
+        """Return the number of culvert barrels of all crossings."""
+        return len(self.span)
+
+    @classmethod
+    def from_crossings(cls, crossings):
+        """Create a table from crossing objects.
+
+        Args:
+            crossings (list of Hy8RunnerCulvertCrossing): The crossings, for example Hy8Runner.crossings.
+
+        Returns:
+            Hy8CrossingTable: The table.
+        """
+        table = cls()
+        for crossing in crossings:
+            table.add_crossing(crossing)
+        return table
+
+    def column(self, name):
+        """Return a column of the table.
+
+        Args:
+            name (string): The column name.
+
+        Returns:
+            array or list: The column values; code columns hold indices into levels[name].
+        """
+        if name not in self.crossing_float_columns + self.crossing_int_columns + self.crossing_code_columns + \
+                self.crossing_text_columns + self.culvert_float_columns + self.culvert_int_columns + \
+                self.culvert_code_columns + self.culvert_text_columns + tuple(self.ragged_columns):
+            raise KeyError(f'Unknown crossing table column: {name}')
+        return getattr(self, name)
+
+    def level_code(self, name, level):
+        """Return the code for a level of a code column, adding it to the levels if it is new.
+
+        Args:
+            name (string): The code column, for example 'material'.
+            level (string): The level, for example 'concrete'.
+
+        Returns:
+            int: The index of the level in levels[name].
+        """
+        codes = self._level_codes[name]
+        code = codes.get(level)
+        if code is None:
+            code = len(self.levels[name])
+            self.levels[name].append(level)
+            codes[level] = code
+        return code
+
+    def get_value(self, name, row):
+        """Return a value of a float column as it was given to the table.
+
+        Args:
+            name (string): A crossing or culvert float column, or a rating curve column.
+            row (int): The row of the value.
+
+        Returns:
+            float or int: The value; an int if it was given as an int.
+        """
+        value = getattr(self, name)[row]
+        return int(value) if self.integer_values[name][row] else value
+
+    def _append_number(self, name, value):
+        """Append a value to a float column, flagging it if it is an int.
+
+        Args:
+            name (string): A crossing or culvert float column, or a rating curve column.
+            value (float or int): The value.
+        """
+        getattr(self, name).append(value)
+        self.integer_values[name].append(type(value) is int)
+
+    def get_slice(self, name, crossing_index):
+        """Return the values of a ragged column, or the culvert rows, for one crossing.
+
+        Args:
+            name (string): A ragged column, or 'culverts' for the culvert rows.
+            crossing_index (int): The index of the crossing.
+
+        Returns:
+            slice: The rows of the crossing.
+        """
+        offsets = self.offsets[self.ragged_columns.get(name, name)]
+        return slice(offsets[crossing_index], offsets[crossing_index + 1])
+
+    def get_flows(self, crossing_index):
+        """Return the flows that are written for a crossing.
+
+        The flows of the min-design-max and min-max-increment methods are computed from the flow columns, as
+        Hy8RunnerFlow.compute_list does; user-defined flows are taken from the flows column.
+
+        Args:
+            crossing_index (int): The index of the crossing.
+
+        Returns:
+            list or array of floats: The flows.
+        """
+        method = self.levels['flow_method'][self.flow_method[crossing_index]]
+        if method == 'min-design-max':
+            return [self.flow_min[crossing_index], self.flow_design[crossing_index], self.flow_max[crossing_index]]
+        if method == 'min-max-increment':
+            return get_flow_range(self.flow_min[crossing_index], self.flow_max[crossing_index],
+                                  self.flow_increment[crossing_index])
+        return self.flows[self.get_slice('flows', crossing_index)]
+
+    def add_crossing(self, crossing):
+        """Append a crossing object, and its culvert barrels, as rows of the table.
+
+        Args:
+            crossing (Hy8RunnerCulvertCrossing): The crossing.
+
+        Returns:
+            int: The index of the crossing in the table.
+        """
+        flow = crossing.flow
+        self.name.append(crossing.name)
+        self.notes.append(crossing.notes)
+        self.uuid.append(crossing.uuid)
+        self.flow_method.append(self.level_code('flow_method', flow.method))
+        self.roadway_surface.append(self.level_code('roadway_surface', crossing.roadway_surface))
+        for name in ('flow_min', 'flow_design', 'flow_max', 'flow_increment'):
+            self._append_number(name, getattr(flow, name))
+        for name in self.crossing_float_columns[4:]:
+            self._append_number(name, getattr(crossing, name))
+        for name in self.crossing_int_columns:
+            getattr(self, name).append(getattr(crossing, name))
+
+        self.flows.extend(flow.flow_list)
+        self.roadway_stations.extend(crossing.roadway_stations)
+        self.roadway_elevations.extend(crossing.roadway_elevations)
+        for point in crossing.tw_rating_curve:
+            for name, value in zip(self.rating_columns, point):
+                self._append_number(name, value)
+
+        for culvert in crossing.culverts:
+            self.culvert_name.append(culvert.name)
+            self.culvert_notes.append(culvert.notes)
+            self.shape.append(self.level_code('shape', culvert.shape))
+            self.material.append(self.level_code('material', culvert.material))
+            for name in self.culvert_float_columns:
+                self._append_number(name, getattr(culvert, name))
+            for name in self.culvert_int_columns:
+                getattr(self, name).append(getattr(culvert, name))
+
+        self.offsets['flows'].append(len(self.flows))
+        self.offsets['roadway_stations'].append(len(self.roadway_stations))
+        self.offsets['roadway_elevations'].append(len(self.roadway_elevations))
+        self.offsets['tw_rating_curve'].append(len(self.rating_flow))
+        self.offsets['culverts'].append(len(self.span))
+        return len(self) - 1
+
+    def get_crossing(self, crossing_index):
+        """Create the crossing object of a row of the table.
+
+        Args:
+            crossing_index (int): The index of the crossing.
+
+        Returns:
+            Hy8RunnerCulvertCrossing: The crossing, with its culvert barrels.
+        """
+        crossing = Hy8RunnerCulvertCrossing(crossing_index)
+        crossing.name = self.name[crossing_index]
+        crossing.notes = self.notes[crossing_index]
+        crossing.uuid = self.uuid[crossing_index]
+        crossing.roadway_surface = self.levels['roadway_surface'][self.roadway_surface[crossing_index]]
+        flow = crossing.flow
+        flow.method = self.levels['flow_method'][self.flow_method[crossing_index]]
+        for name in ('flow_min', 'flow_design', 'flow_max', 'flow_increment'):
+            setattr(flow, name, self.get_value(name, crossing_index))
+        for name in self.crossing_float_columns[4:]:
+            setattr(crossing, name, self.get_value(name, crossing_index))
+        for name in self.crossing_int_columns:
+            setattr(crossing, name, getattr(self, name)[crossing_index])
+
+        flow.flow_list = self.flows[self.get_slice('flows', crossing_index)]
+        crossing.roadway_stations = self.roadway_stations[self.get_slice('roadway_stations', crossing_index)]
+        crossing.roadway_elevations = self.roadway_elevations[self.get_slice('roadway_elevations', crossing_index)]
+        crossing.tw_rating_curve = [list(point) for point in self._get_rating_curve(crossing_index)]
+
+        rows = self.get_slice('culverts', crossing_index)
+        crossing.culverts = []
+        for culvert_index in range(rows.start, rows.stop):
+            culvert = Hy8RunnerCulvertBarrel(len(crossing.culverts))
+            culvert.name = self.culvert_name[culvert_index]
+            culvert.notes = self.culvert_notes[culvert_index]
+            culvert.shape = self.levels['shape'][self.shape[culvert_index]]
+            culvert.material = self.levels['material'][self.material[culvert_index]]
+            for name in self.culvert_float_columns:
+                setattr(culvert, name, self.get_value(name, culvert_index))
+            for name in self.culvert_int_columns:
+                setattr(culvert, name, getattr(self, name)[culvert_index])
+            crossing.culverts.append(culvert)
+        return crossing
+
+    def to_crossings(self):
+        """Create the crossing objects of every row of the table.
+
+        Returns:
+            list of Hy8RunnerCulvertCrossing: The crossings, which can be assigned to Hy8Runner.crossings.
+        """
+        return [self.get_crossing(crossing_index) for crossing_index in range(len(self))]
+
+    def iter_hy8_strings(self, config=None, project_title='', designer_name='', project_notes='', project_date=None):
+        """Generate the text of an HY-8 file straight from the columns, one crossing block at a time.
+
+        The text is the same as Hy8Runner.to_hy8_string gives for the same crossings, but no crossing or culvert
+        object is created, and only one crossing block is held in memory at a time.
+
+        Args:
+            config (Hy8RunnerConfig): The version and unit settings; defaults to Hy8RunnerConfig().
+            project_title (string): The project title.
+            designer_name (string): The project designer.
+            project_notes (string): The project notes.
+            project_date (float): The value for the PROJDATE card; defaults to the current time in hours.
+
+        Yields:
+            string: The project header, each crossing block, and the end of the project.
+        """
+        if config is None:
+            config = Hy8RunnerConfig()
+        if project_date is None:
+            project_date = datetime.datetime.now().timestamp() / 3600
+        units = 1 if config.si_units else 0
+        yield (f'HY8PROJECTFILE{config.version}\n'
+               f'UNITS  {units}\n'
+               f'EXITLOSSOPTION  {config.exit_loss_option}\n'
+               f'PROJTITLE  {project_title}\n'
+               f'PROJDESIGNER  {designer_name}\n'
+               f'STARTPROJNOTES  {project_notes}\nENDPROJNOTES\n'
+               f'PROJDATE  {project_date}\n'
+               f'NUMCROSSINGS  {len(self)}\n')
+
+        for index in range(len(self)):
+            yield self._get_crossing_string(index)
+        yield 'ENDPROJECTFILE\n'
+
+    def to_hy8_string(self, config=None, project_title='', designer_name='', project_notes='', project_date=None):
+        """Serialize the table to the text of an HY-8 file.
+
+        Args:
+            config (Hy8RunnerConfig): The version and unit settings; defaults to Hy8RunnerConfig().
+            project_title (string): The project title.
+            designer_name (string): The project designer.
+            project_notes (string): The project notes.
+            project_date (float): The value for the PROJDATE card; defaults to the current time in hours.
+
+        Returns:
+            string: The contents of the HY-8 file.
+        """
+        return ''.join(self.iter_hy8_strings(config, project_title, designer_name, project_notes, project_date))
+
+    def write_hy8_file(self, hy8_file, config=None, project_title='', designer_name='', project_notes='',
+                       project_date=None):
+        """Stream the table to an HY-8 file, one crossing block at a time.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file.
+            config (Hy8RunnerConfig): The version and unit settings; defaults to Hy8RunnerConfig().
+            project_title (string): The project title.
+            designer_name (string): The project designer.
+            project_notes (string): The project notes.
+            project_date (float): The value for the PROJDATE card; defaults to the current time in hours.
+        """
+        with open(hy8_file, 'w') as file:
+            for text in self.iter_hy8_strings(config, project_title, designer_name, project_notes, project_date):
+                file.write(text)
+
+    def _get_rating_curve(self, crossing_index):
+        """Return the tailwater rating curve of a crossing as (flow, elevation, velocity) points."""
+        rows = self.get_slice('tw_rating_curve', crossing_index)
+        return [tuple([self.get_value(name, row) for name in self.rating_columns])
+                for row in range(rows.start, rows.stop)]
+
+    def _get_culvert_string(self, row):
+        """Build the culvert block of a culvert row with get_culvert_string, as Hy8RunnerCulvertBarrel does."""
+        value = self.get_value
+        return get_culvert_string(self.culvert_name[row], self.culvert_notes[row],
+                                  self.levels['shape'][self.shape[row]], self.levels['material'][self.material[row]],
+                                  value('span', row), value('rise', row),
+                                  self.number_of_barrels[row], value('inlet_invert_station', row),
+                                  value('inlet_invert_elevation', row), value('outlet_invert_station', row),
+                                  value('outlet_invert_elevation', row))
+
+    def _get_crossing_string(self, index):
+        """Build the crossing block of a row with get_crossing_string, as Hy8RunnerCulvertCrossing does."""
+        value = self.get_value
+        rows = self.get_slice('culverts', index)
+        return get_crossing_string(
+            self.name[index], self.notes[index], self.levels['flow_method'][self.flow_method[index]],
+            value('flow_min', index), value('flow_design', index), value('flow_max', index), self.get_flows(index),
+            self.tw_type[index], value('tw_bottom_width', index), value('tw_sideslope', index),
+            value('tw_channel_slope', index), value('tw_manning_n', index), value('tw_constant_elevation', index),
+            value('tw_invert_elevation', index), self._get_rating_curve(index), self.roadway_shape[index],
+            value('roadway_width', index), self.levels['roadway_surface'][self.roadway_surface[index]],
+            self.roadway_stations[self.get_slice('roadway_stations', index)],
+            self.roadway_elevations[self.get_slice('roadway_elevations', index)],
+            [self._get_culvert_string(row) for row in range(rows.start, rows.stop)], self.uuid[index])
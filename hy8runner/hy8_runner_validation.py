@@ -0,0 +1,272 @@
+"""HY-8 validation engine that checks a whole inventory of crossings column by column."""
+# 1. Standard python modules
+from array import array
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_table import Hy8CrossingTable
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerValidationResult', 'Hy8RunnerValidator']
+
+
+class Hy8RunnerValidationResult():
+    """The errors found by Hy8RunnerValidator, stored as columns with one row per error.
+
+    Each error has the index of its crossing, the row of its culvert barrel in the crossing table (-1 for an error
+    of the crossing itself), and a code into Hy8RunnerValidator.checks, which gives the error name, the field it
+    concerns, and its message. valid holds 1 for each crossing without errors and 0 otherwise. Messages are only
+    built when get_messages is called.
+    """
+
+    def __init__(self, table):
+        """Initializes the validation result.
+
+        Args:
+            table (Hy8CrossingTable): The crossings that were validated.
+        """
+        self.table = table
+        self.crossing = array('l')
+        self.culvert = array('l')  # the culvert row in the table, or -1
+        self.code = array('l')  # index into Hy8RunnerValidator.checks
+        self.valid = array('b', [1]) * len(table)
+        self.complete = True  # False if fail-fast validation stopped at the first error
+
+    def __len__(self):
+        """Return the number of errors."""
+        return len(self.code)
+
+    @property
+    def is_valid(self):
+        """Return True if no crossing has an error."""
+        return len(self.code) == 0
+
+    def add_errors(self, code, crossings, culverts=None):
+        """Append an error for each of the crossings (or culvert barrels) that failed a check.
+
+        Args:
+            code (int): The index of the check in Hy8RunnerValidator.checks.
+            crossings (list of ints): The crossing of each error.
+            culverts (list of ints): The culvert row of each error; None for errors of the crossings themselves.
+        """
+        self.crossing.extend(crossings)
+        if culverts is None:
+            self.culvert.extend([-1] * len(crossings))
+        else:
+            self.culvert.extend(culverts)
+        self.code.extend([code] * len(crossings))
+        for crossing_index in crossings:
+            self.valid[crossing_index] = 0
+
+    def get_errors(self, crossing_index=None):
+        """Return the errors, ordered by crossing, then by culvert barrel, then in the order of the checks.
+
+        Args:
+            crossing_index (int): Return only the errors of this crossing; None returns all of them.
+
+        Returns:
+            list of tuples: The crossing index, the culvert index in the crossing (-1 for the crossing itself), the
+                error name, and the field name of each error.
+        """
+        culvert_offsets = self.table.offsets['culverts']
+        errors = []
+        for row in self._get_sorted_rows(crossing_index):
+            crossing = self.crossing[row]
+            culvert = self.culvert[row]
+            if culvert >= 0:
+                culvert -= culvert_offsets[crossing]
+            name, field, _ = Hy8RunnerValidator.checks[self.code[row]]
+            errors.append((crossing, culvert, name, field))
+        return errors
+
+    def get_messages(self, crossing_index=None):
+        """Render the errors as text, in the format of Hy8Runner.validate_crossings_data.
+
+        Args:
+            crossing_index (int): Render only the errors of this crossing; None renders all of them.
+
+        Returns:
+            string: One line per error.
+        """
+        lines = []
+        for row in self._get_sorted_rows(crossing_index):
+            crossing = self.crossing[row]
+            culvert = self.culvert[row]
+            line = f'Crossing: {self.table.name[crossing]} with index: {crossing} '
+            if culvert >= 0:
+                line += f'Culvert barrel: {self.table.culvert_name[culvert]}\t'
+            lines.append(f'{line}{Hy8RunnerValidator.checks[self.code[row]][2]}\n')
+        return ''.join(lines)
+
+    def _get_sorted_rows(self, crossing_index):
+        """Return the error rows in message order, optionally for one crossing only."""
+        rows = range(len(self.code))
+        if crossing_index is not None:
+            rows = [row for row in rows if self.crossing[row] == crossing_index]
+        return sorted(rows, key=lambda row: (self.crossing[row], self.culvert[row] >= 0, self.culvert[row],
+                                             self.code[row]))
+
+
+class Hy8RunnerValidator():
+    """Checks every crossing of an inventory at once, one check (one column comparison) at a time.
+
+    Each check runs over whole columns of a Hy8CrossingTable instead of walking the crossing objects, and records
+    its failures as rows of a Hy8RunnerValidationResult. With fail_fast, validation stops after the first check
+    that fails and records only its first error.
+    """
+
+    # The name, the field, and the message of each check, in the order the messages are reported
+    checks = (
+        ('flow_min_not_below_design', 'flow_min', 'Minimum flow must be less than or equal to design flow.'),
+        ('flow_design_not_below_max', 'flow_design', 'Design flow must be less than or equal to maximum flow.'),
+        ('flow_min_not_below_max', 'flow_min', 'Minimum flow must be less than maximum flow.'),
+        ('flow_min_negative', 'flow_min', 'Minimum flow must be zero or greater.'),
+        ('flow_increment_not_positive', 'flow_increment', 'Flow increment must be greater than zero.'),
+        ('flow_list_too_short', 'flows', 'User-defined flow list must have at least two values.'),
+        ('flow_list_not_increasing', 'flows', 'Flow list values must increase in value.'),
+        ('flow_method_unknown', 'flow_method',
+         'Flow method must be min-design-max, user-defined, or min-max-increment.'),
+        ('tw_bottom_width_positive', 'tw_bottom_width', 'Enter a tailwater bottom width.'),
+        ('tw_channel_slope_positive', 'tw_channel_slope', 'Enter a tailwater channel slope.'),
+        ('tw_manning_n_positive', 'tw_manning_n', "Enter a tailwater channel Manning's n value."),
+        ('tw_invert_elevation_positive', 'tw_invert_elevation', 'Enter a tailwater invert elevation.'),
+        ('tw_rating_curve_empty', 'tw_rating_curve', 'Enter a tailwater Rating curve.'),
+        ('tw_constant_below_invert', 'tw_constant_elevation',
+         'Tailwater constant elevation must be greater than tailwater invert elevation.'),
+        ('roadway_width_not_positive', 'roadway_width', 'Roadway width must be greater than zero.'),
+        ('roadway_too_few_stations', 'roadway_stations',
+         'Roadway stations & elevations must have at least two values.'),
+        ('roadway_length_mismatch', 'roadway_elevations',
+         'Roadway stations and elevations must have the same number of values.'),
+        ('no_culverts', 'culverts', 'Crossing must have at least one culvert barrel.'),
+        ('span_not_positive', 'span', 'span of the culvert must be specified.'),
+        ('box_rise_not_positive', 'rise', 'rise of the box culvert must be specified.'),
+        ('number_of_barrels_not_positive', 'number_of_barrels', 'Number of barrels must be greater than zero.'),
+    )
+    codes = {name: code for code, (name, _, _) in enumerate(checks)}
+
+    def __init__(self, fail_fast=False):
+        """Initializes the validator.
+
+        Args:
+            fail_fast (bool): Stop at the first error instead of collecting all of them.
+        """
+        self.fail_fast = fail_fast
+
+    def validate(self, crossings):
+        """Check every crossing.
+
+        Args:
+            crossings (Hy8CrossingTable or list of Hy8RunnerCulvertCrossing): The crossings.
+
+        Returns:
+            Hy8RunnerValidationResult: The errors and the mask of valid crossings.
+        """
+        table = crossings if isinstance(crossings, Hy8CrossingTable) else Hy8CrossingTable.from_crossings(crossings)
+        result = Hy8RunnerValidationResult(table)
+        for name, failed_crossings, failed_culverts in self._iter_checks(table):
+            if not failed_crossings:
+                continue
+            if self.fail_fast:
+                result.add_errors(self.codes[name], failed_crossings[:1],
+                                  failed_culverts[:1] if failed_culverts is not None else None)
+                result.complete = False
+                break
+            result.add_errors(self.codes[name], failed_crossings, failed_culverts)
+        return result
+
+    @staticmethod
+    def _select(mask):
+        """Return the indices where mask is true."""
+        return [index for index, failed in enumerate(mask) if failed]
+
+    def _iter_checks(self, table):
+        """Run each check over the columns of the table.
+
+        Yields:
+            string: The name of the check.
+            list of ints: The crossing of each failure.
+            list of ints: The culvert row of each failure, or None for checks of the crossings.
+        """
+        select = self._select
+        num_crossings = len(table)
+        flow_levels = table.levels['flow_method']
+        methods = table.flow_method
+        min_design_max = flow_levels.index('min-design-max')
+        user_defined = flow_levels.index('user-defined')
+        min_max_increment = flow_levels.index('min-max-increment')
+        flow_min = table.flow_min
+        flow_design = table.flow_design
+        flow_max = table.flow_max
+
+        mask = [method == min_design_max and low >= design
+                for method, low, design in zip(methods, flow_min, flow_design)]
+        yield 'flow_min_not_below_design', select(mask), None
+        mask = [method == min_design_max and design >= high
+                for method, design, high in zip(methods, flow_design, flow_max)]
+        yield 'flow_design_not_below_max', select(mask), None
+        mask = [method == min_max_increment and low >= high for method, low, high in zip(methods, flow_min, flow_max)]
+        yield 'flow_min_not_below_max', select(mask), None
+        mask = [method in (min_design_max, min_max_increment) and low < 0.0 for method, low in zip(methods, flow_min)]
+        yield 'flow_min_negative', select(mask), None
+        mask = [method == min_max_increment and increment <= 0.0
+                for method, increment in zip(methods, table.flow_increment)]
+        yield 'flow_increment_not_positive', select(mask), None
+
+        flows = table.flows
+        flow_offsets = table.offsets['flows']
+        flow_counts = [flow_offsets[index + 1] - flow_offsets[index] for index in range(num_crossings)]
+        yield 'flow_list_too_short', select([method == user_defined and count < 2
+                                             for method, count in zip(methods, flow_counts)]), None
+        failed = [index for index in select([method == user_defined and count >= 2
+                                             for method, count in zip(methods, flow_counts)])
+                  if any([flows[row] >= flows[row + 1]
+                          for row in range(flow_offsets[index], flow_offsets[index + 1] - 1)])]
+        yield 'flow_list_not_increasing', failed, None
+        yield 'flow_method_unknown', select([method not in (min_design_max, user_defined, min_max_increment)
+                                             for method in methods]), None
+
+        # The same rules as the original per-crossing checks: a rectangular tailwater channel fails on a value above
+        # zero, and the other channel shapes are not checked
+        tw_types = table.tw_type
+        for name in ('tw_bottom_width', 'tw_channel_slope', 'tw_manning_n', 'tw_invert_elevation'):
+            mask = [tw_type == 1 and value > 0.0 for tw_type, value in zip(tw_types, getattr(table, name))]
+            yield f'{name}_positive', select(mask), None
+        rating_offsets = table.offsets['tw_rating_curve']
+        mask = [tw_type == 5 and rating_offsets[index] == rating_offsets[index + 1]
+                for index, tw_type in enumerate(tw_types)]
+        yield 'tw_rating_curve_empty', select(mask), None
+        mask = [tw_type == 6 and constant < invert
+                for tw_type, constant, invert in zip(tw_types, table.tw_constant_elevation, table.tw_invert_elevation)]
+        yield 'tw_constant_below_invert', select(mask), None
+
+        yield 'roadway_width_not_positive', select([width <= 0 for width in table.roadway_width]), None
+        station_offsets = table.offsets['roadway_stations']
+        elevation_offsets = table.offsets['roadway_elevations']
+        station_counts = [station_offsets[index + 1] - station_offsets[index] for index in range(num_crossings)]
+        elevation_counts = [elevation_offsets[index + 1] - elevation_offsets[index] for index in range(num_crossings)]
+        yield 'roadway_too_few_stations', select([count < 2 for count in station_counts]), None
+        mask = [stations != elevations for stations, elevations in zip(station_counts, elevation_counts)]
+        yield 'roadway_length_mismatch', select(mask), None
+        culvert_offsets = table.offsets['culverts']
+        yield 'no_culverts', select([culvert_offsets[index] == culvert_offsets[index + 1]
+                                     for index in range(num_crossings)]), None
+
+        # The crossing of each culvert row, to report the culvert checks by crossing
+        culvert_crossings = array('l')
+        for index in range(num_crossings):
+            culvert_crossings.extend([index] * (culvert_offsets[index + 1] - culvert_offsets[index]))
+        box = table.levels['shape'].index('box')
+        for name, rows in (
+                ('span_not_positive', select([span <= 0.0 for span in table.span])),
+                ('box_rise_not_positive', select([shape == box and rise <= 0.0
+                                                  for shape, rise in zip(table.shape, table.rise)])),
+                ('number_of_barrels_not_positive', select([count <= 0 for count in table.number_of_barrels]))):
+            yield name, [culvert_crossings[row] for row in rows], rows
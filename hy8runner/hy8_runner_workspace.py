@@ -0,0 +1,112 @@
+"""HY-8 Runner workspace that lets one HY-8 run work in its own scratch directory."""
+# 1. Standard python modules
+import os
+import shutil
+import tempfile
+import uuid
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['Hy8RunnerWorkspace']
+
+
+class Hy8RunnerWorkspace():
+    """A scratch directory where a copy of an HY-8 file is run, so parallel runs never write to the same files.
+
+    HY-8 writes its output files next to the HY-8 file it runs. The workspace copies the HY-8 file into a new
+    directory under scratch_dir (a tmpfs or RAM disk, for example), and after the run moves the requested output
+    files back next to the original HY-8 file. Each file is moved to a temporary name in the destination directory
+    first and then renamed, so a reader never sees a partly written file.
+    """
+
+    def __init__(self, hy8_file, scratch_dir=None, artifacts=None):
+        """Initializes the workspace.
+
+        Args:
+            hy8_file (string): The path to the HY-8 file; the output files are moved back next to it.
+            scratch_dir (string): The directory to create the workspace in; None uses the system temporary directory.
+            artifacts (list of strings): The endings of the output files to move back ('.rst', '.rsql', '.bmp', for
+                example); None moves back every output file.
+        """
+        self.hy8_file = hy8_file
+        self.scratch_dir = scratch_dir
+        self.artifacts = artifacts
+        self.directory = None
+        self.run_hy8_file = None  # the copy of the HY-8 file that HY-8 runs
+
+    def __enter__(self):
+        """Create the workspace for use in a with statement."""
+        self.create()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Remove the workspace at the end of a with statement."""
+        self.cleanup()
+
+    def create(self):
+        """Create the scratch directory and copy the HY-8 file into it.
+
+        Returns:
+            string: The path to the copy of the HY-8 file.
+        """
+        if self.scratch_dir:
+            os.makedirs(self.scratch_dir, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix='hy8_', dir=self.scratch_dir or None)
+        self.run_hy8_file = os.path.join(self.directory, os.path.basename(self.hy8_file))
+        try:
+            shutil.copyfile(self.hy8_file, self.run_hy8_file)
+        except OSError:
+            self.cleanup()
+            raise
+        return self.run_hy8_file
+
+    def is_artifact(self, output_file):
+        """Return True if an output file is one to move back.
+
+        Args:
+            output_file (string): The path or name of the output file.
+
+        Returns:
+            bool: True if the file is requested.
+        """
+        if self.artifacts is None:
+            return True
+        return output_file.lower().endswith(tuple([artifact.lower() for artifact in self.artifacts]))
+
+    def collect(self, output_files):
+        """Move the requested output files of the run next to the original HY-8 file.
+
+        Args:
+            output_files (list of strings): The files that the run wrote in the workspace.
+
+        Returns:
+            list of strings: The sorted paths of the moved files.
+        """
+        run_stem = os.path.splitext(self.run_hy8_file)[0]
+        stem = os.path.splitext(self.hy8_file)[0]
+        moved_files = []
+        for output_file in output_files:
+            if not output_file.startswith(run_stem) or not self.is_artifact(output_file):
+                continue
+            destination = stem + output_file[len(run_stem):]
+            temp_file = os.path.join(os.path.dirname(destination),
+                                     f'.{os.path.basename(destination)}.{uuid.uuid4().hex}.tmp')
+            shutil.move(output_file, temp_file)
+            os.replace(temp_file, destination)
+            moved_files.append(destination)
+        return sorted(moved_files)
+
+    def cleanup(self):
+        """Remove the scratch directory and everything left in it."""
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
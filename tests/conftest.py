@@ -0,0 +1,23 @@
+"""Shared pytest fixtures for the HY-8 Runner tests."""
+# 1. Standard python modules
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from tests.hy8_stand_in import launch_stand_ins
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+@pytest.fixture(autouse=True)
+def stand_in_hy8():
+    """Start the stand-in HY-8 executables of the tests with the Python interpreter, on every platform."""
+    with launch_stand_ins():
+        yield
@@ -0,0 +1,46 @@
+"""Finds the output captured from a real HY-8 run, so the readers can be tested against HY-8 itself."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner_parser import Hy8RunnerFileParser
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+CAPTURED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'files', 'hy8_captured_files')
+CAPTURED_HY8_FILE = os.path.join(CAPTURED_DIR, 'captured.hy8')
+
+
+def get_captured_file(extension):
+    """Return the path to a file HY-8 wrote for captured.hy8, skipping the test if it has not been captured.
+
+    See tests/files/hy8_captured_files/README.md for how the files are captured.
+
+    Args:
+        extension (string): The extension of the file, for example '.rst'.
+
+    Returns:
+        string: The path to the captured file.
+    """
+    captured_file = os.path.join(CAPTURED_DIR, 'captured' + extension)
+    if not os.path.isfile(captured_file):
+        pytest.skip(f'No HY-8 output has been captured in {captured_file}')
+    return captured_file
+
+
+def get_captured_crossings():
+    """Return the crossings of the project that the captured output was run from.
+
+    Returns:
+        list of Hy8RunnerCulvertCrossing: The crossings of captured.hy8.
+    """
+    return list(Hy8RunnerFileParser().iter_crossings(CAPTURED_HY8_FILE))
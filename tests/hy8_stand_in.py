@@ -0,0 +1,188 @@
+"""Creates a stand-in for the HY-8 executable so runs can be tested and benchmarked without HY-8."""
+# 1. Standard python modules
+import asyncio
+import contextlib
+import os
+import subprocess
+import sys
+import threading
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+__all__ = ['create_stand_in_hy8', 'launch_stand_ins']
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_stand_in_files = set()  # the normalized paths of the stand-ins written by create_stand_in_hy8
+_stand_in_lock = threading.Lock()
+
+STAND_IN_SCRIPT = '''"""Stand-in for the HY-8 executable."""
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, {package_dir!r})
+from hy8runner.hy8_runner_parser import Hy8RunnerFileParser  # noqa: E402
+
+RETURNCODE = {returncode!r}
+STARTUP = {startup!r}
+FLOW_TIME = {flow_time!r}
+FAIL_COUNT = {fail_count!r}
+
+directory = os.path.dirname(os.path.abspath(__file__))
+action = sys.argv[1] if len(sys.argv) > 2 else ''
+hy8_file = sys.argv[-1]
+stem = os.path.splitext(hy8_file)[0]
+print(f'HY-8 stand-in {{action}} {{hy8_file}}')
+
+counter_file = os.path.join(directory, 'failures.txt')
+if FAIL_COUNT:
+    failures = 0
+    if os.path.exists(counter_file):
+        with open(counter_file) as file:
+            failures = int(file.read() or 0)
+    if failures < FAIL_COUNT:
+        with open(counter_file, 'w') as file:
+            file.write(str(failures + 1))
+        print('transient failure', file=sys.stderr)
+        sys.exit(1)
+
+time.sleep(STARTUP)
+if RETURNCODE != 0:
+    print('stand-in failure', file=sys.stderr)
+    sys.exit(RETURNCODE)
+
+crossings = list(Hy8RunnerFileParser().iter_crossings(hy8_file))
+time.sleep(FLOW_TIME * sum([len(crossing.flow.flow_list) for crossing in crossings]))
+
+if action in ('-OpenRunSave', '-OpenRunSavePlots'):
+    rows = []
+    with open(stem + '.rst', 'w') as rst, open(stem + '.plt', 'w') as plt:
+        rst.write('HY8RESULTSFILE\\n')
+        plt.write('HY8PLOTFILE\\n')
+        for crossing_index, crossing in enumerate(crossings):
+            flows = crossing.flow.flow_list
+            culvert = crossing.culverts[0]
+            crest = min(crossing.roadway_elevations) if crossing.roadway_elevations else 0.0
+            headwaters = [culvert.inlet_invert_elevation + culvert.span * 0.01 * flow for flow in flows]
+            rst.write(f'STARTCROSSING "{{crossing.name}}"\\n')
+            rst.write('DISCHARGE ' + ' '.join([str(flow) for flow in flows]) + '\\n')
+            rst.write('HEADWATERELEVATION ' + ' '.join([str(hw) for hw in headwaters]) + '\\n')
+            rst.write('TAILWATERELEVATION ' + ' '.join([str(crossing.tw_constant_elevation)] * len(flows)) + '\\n')
+            rst.write('CONTROLTYPE ' + ' '.join(['"Inlet Control"'] * len(flows)) + '\\n')
+            rst.write('OUTLETVELOCITY ' + ' '.join([str(flow / 10.0) for flow in flows]) + '\\n')
+            rst.write('OVERTOPPINGFLOW ' + ' '.join([str(max(hw - crest, 0.0)) for hw in headwaters]) + '\\n')
+            rst.write('ENDCROSSING\\n')
+            plt.write(f'STARTCROSSING "{{crossing.name}}"\\n')
+            for flow, headwater in zip(flows, headwaters):
+                plt.write(f'STARTDISCHARGE {{flow}}\\nSERIES "Water Surface"\\n')
+                plt.write(f'{{culvert.inlet_invert_station}} {{headwater}}\\n')
+                plt.write(f'{{culvert.outlet_invert_station}} {{crossing.tw_constant_elevation}}\\n')
+                plt.write('ENDDISCHARGE\\n')
+            plt.write('ENDCROSSING\\n')
+            rows.extend([(crossing_index, flow_index, flow, crest - headwater)
+                         for flow_index, (flow, headwater) in enumerate(zip(flows, headwaters))])
+    if os.path.exists(stem + '.rsql'):
+        os.remove(stem + '.rsql')
+    connection = sqlite3.connect(stem + '.rsql')
+    connection.execute('CREATE TABLE Results (CrossingIndex INTEGER, FlowIndex INTEGER, Flow REAL, Freeboard REAL)')
+    connection.executemany('INSERT INTO Results VALUES (?, ?, ?, ?)', rows)
+    connection.commit()
+    connection.close()
+    if action == '-OpenRunSavePlots':
+        for flow_index in range(len(crossings[0].flow.flow_list) if crossings else 0):
+            with open(f'{{stem}}--Culvert0--WaterProfile{{flow_index}}.bmp', 'wb') as bmp:
+                bmp.write(b'BM')
+elif action == '-BuildFullReport':
+    with open(stem + '.docx', 'wb') as docx:
+        docx.write(b'PK')
+elif action in ('-BuildHwTwTable', '-BuildFlowTwTable'):
+    with open(stem + '.table', 'w') as table:
+        table.write('Flow Tailwater Headwater\\n')
+        for flow in range(0, 101, 50):
+            for tailwater in (98.0, 99.0):
+                table.write(f'{{float(flow)}} {{tailwater}} {{100.0 + 0.02 * flow + 0.5 * (tailwater - 98.0)}}\\n')
+'''
+
+
+def create_stand_in_hy8(directory, returncode=0, startup=0.0, flow_time=0.0, fail_count=0,
+                        basename='HY864.exe'):
+    """Write a Python script that stands in for HY-8, to be run while launch_stand_ins is active.
+
+    The stand-in reads the HY-8 file and writes rst, plt, and rsql files (or a report or table) in the formats that
+    the HY-8 Runner readers assume; the readers are checked against real HY-8 output separately. launch_stand_ins
+    starts the script with the Python interpreter, so it runs on Windows as well as on other platforms.
+
+    Args:
+        directory (string): The directory for the stand-in executable.
+        returncode (int): The return code of every run.
+        startup (float): The seconds each run sleeps before doing any work.
+        flow_time (float): The seconds each run sleeps per flow in the project.
+        fail_count (int): The number of runs that fail with return code 1 before runs succeed.
+        basename (string): The file name of the executable.
+
+    Returns:
+        string: The path to the stand-in executable.
+    """
+    os.makedirs(directory, exist_ok=True)
+    hy8_exe = os.path.join(directory, basename)
+    with open(hy8_exe, 'w') as file:
+        file.write(STAND_IN_SCRIPT.format(package_dir=PACKAGE_DIR, returncode=returncode, startup=startup,
+                                          flow_time=flow_time, fail_count=fail_count))
+    counter_file = os.path.join(directory, 'failures.txt')
+    if os.path.exists(counter_file):
+        os.remove(counter_file)
+    with _stand_in_lock:
+        _stand_in_files.add(os.path.normcase(os.path.abspath(hy8_exe)))
+    return hy8_exe
+
+
+def get_launch_command(command):
+    """Return the command that starts a process, with the Python interpreter first if it runs a stand-in.
+
+    Args:
+        command (list of strings): The executable, the command line arguments, and the HY-8 file.
+
+    Returns:
+        list of strings: The command to start.
+    """
+    command = list(command)
+    if command and os.path.normcase(os.path.abspath(command[0])) in _stand_in_files:
+        return [sys.executable] + command
+    return command
+
+
+@contextlib.contextmanager
+def launch_stand_ins():
+    """Start the stand-ins written by create_stand_in_hy8 with the Python interpreter while the context is active.
+
+    subprocess.run and asyncio.create_subprocess_exec, which the HY-8 Runner starts HY-8 with, are wrapped for the
+    duration; other commands are started unchanged.
+    """
+    run = subprocess.run
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    def run_stand_in(command, *args, **kwargs):
+        return run(get_launch_command(command), *args, **kwargs)
+
+    async def create_stand_in_process(*command, **kwargs):
+        return await create_subprocess_exec(*get_launch_command(command), **kwargs)
+
+    subprocess.run = run_stand_in
+    asyncio.create_subprocess_exec = create_stand_in_process
+    try:
+        yield
+    finally:
+        subprocess.run = run
+        asyncio.create_subprocess_exec = create_subprocess_exec
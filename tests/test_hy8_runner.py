@@ -1,13 +1,20 @@
 """Performs testing for hy8 runner class."""
 # 1. Standard python modules
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import os
+import time
 
 # 2. Third party modules
+import pytest
 
 # 3. Aquaveo modules
 
 # 4. Local modules
 from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_config import Hy8RunnerConfig
+from tests.hy8_stand_in import create_stand_in_hy8
 
 __copyright__ = "(C) Copyright Aquaveo 2024"
 __license__ = "All rights reserved"
@@ -45,6 +52,45 @@ class TestHy8Runner:
         hy8_runner.set_hy8_exe_path('/tests/files/HY8/')
         assert hy8_runner.hy8_exe_path == '/tests/files/HY8/'
 
+    def test_config(self):
+        """Keep the executable, version, and units of each runner separate."""
+        en_runner = Hy8Runner('/tests/files/HY8_80/')
+        si_runner = Hy8Runner('/tests/files/HY8_81/', config=Hy8RunnerConfig(version=81.0, si_units=True))
+        assert en_runner.hy8_exe_path == '/tests/files/HY8_80/'
+        assert si_runner.hy8_exe_path == '/tests/files/HY8_81/'
+        assert Hy8Runner.hy8_exe_path == ''
+        assert Hy8Runner().config is Hy8Runner.default_config
+
+        en_runner.exit_loss_option = 1
+        assert en_runner.config.exit_loss_option == 1
+        assert Hy8Runner.default_config.exit_loss_option == 0
+        assert si_runner.exit_loss_option == 0
+
+        def get_header(hy8_runner):
+            return hy8_runner.to_hy8_string(project_date=0).splitlines()[:3]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            headers = list(executor.map(get_header, [en_runner, si_runner] * 50))
+        assert headers[0] == ['HY8PROJECTFILE80.0', 'UNITS  0', 'EXITLOSSOPTION  1']
+        assert headers[1] == ['HY8PROJECTFILE81.0', 'UNITS  1', 'EXITLOSSOPTION  0']
+        assert headers == [headers[0], headers[1]] * 50
+
+    def test_set_config_on_class(self):
+        """Setting a config field on the class replaces the default config instead of the field."""
+        default_config = Hy8Runner.default_config
+        try:
+            Hy8Runner.si_units = True
+            Hy8Runner.version = 81.0
+            hy8_runner = Hy8Runner()
+            assert Hy8Runner.si_units is True
+            assert hy8_runner.si_units is True
+            assert hy8_runner.config.si_units is True
+            assert hy8_runner.version == hy8_runner.config.version == 81.0
+            assert Hy8Runner.default_config.replace(si_units=False, version=80.0) == default_config
+        finally:
+            Hy8Runner.default_config = default_config
+        assert Hy8Runner().si_units is False
+
     def test_set_hy8_file(self):
         """Set the path to the HY-8 file."""
         hy8_runner = Hy8Runner()
@@ -229,6 +275,58 @@ class TestHy8Runner:
         hy8_runner.set_culvert_barrel_number_of_barrels(2)
         assert hy8_runner.crossings[0].culverts[0].number_of_barrels == 2
 
+    def test_bulk_setters(self):
+        """Populate many crossings from columns and match the project built with the per-crossing setters."""
+        num_crossings = 4
+        spans = [5.0 + index for index in range(num_crossings)]
+        loop_runner = Hy8Runner()
+        for index in range(num_crossings):
+            if index > 0:
+                loop_runner.add_crossing()
+            loop_runner.set_discharge_min_max_inc_flow(0.0, 200.0, 50.0)
+            loop_runner.set_tw_constant(98.0, 100.0)
+            loop_runner.set_roadway_width(25.0)
+            loop_runner.set_culvert_barrel_span_and_rise(spans[index], 4.0)
+            loop_runner.set_culvert_barrel_material('corrugated steel')
+            loop_runner.set_culvert_barrel_site_data(0.0, 100.0, 40.0, 98.0)
+
+        bulk_runner = Hy8Runner()
+        bulk_runner.set_bulk_discharge_min_max_inc_flow([0] * num_crossings, [200] * num_crossings,
+                                                        [50] * num_crossings)
+        bulk_runner.set_bulk_tw_constant([98] * num_crossings, [100] * num_crossings)
+        bulk_runner.set_bulk_roadway_width((25,) * num_crossings)
+        bulk_runner.set_bulk_culvert_barrel_span_and_rise(spans, [4] * num_crossings)
+        bulk_runner.set_bulk_culvert_barrel_material(['corrugated steel'] * num_crossings)
+        bulk_runner.set_bulk_culvert_barrel_site_data([0] * num_crossings, [100] * num_crossings,
+                                                      [40] * num_crossings, [98] * num_crossings)
+        assert len(bulk_runner.crossings) == num_crossings
+        assert bulk_runner.to_hy8_string(project_date=1.5) == loop_runner.to_hy8_string(project_date=1.5)
+
+        bulk_runner.set_bulk_columns({'name': ['North', 'South'], 'roadway_width': [30, 35]}, indices=[3, 1])
+        bulk_runner.set_bulk_roadway_width([40], indices=['South'])
+        assert [crossing.name for crossing in bulk_runner.crossings] == ['Crossing 1', 'South', 'Crossing 3', 'North']
+        assert [crossing.roadway_width for crossing in bulk_runner.crossings] == [25.0, 40.0, 25.0, 30.0]
+        bulk_runner.to_hy8_string(project_date=1.5)
+        assert bulk_runner.blocks_rendered == 2
+
+        bulk_runner.add_culvert_barrel(0)
+        bulk_runner.set_bulk_culvert_barrel_span_and_rise([9], [3], indices=[0], index_culvert=0)
+        assert [culvert.span for culvert in bulk_runner.crossings[0].culverts] == [9.0, 0.0]
+
+    def test_bulk_setters_check_columns(self):
+        """Reject columns of different lengths or unknown names before changing any crossing."""
+        hy8_runner = Hy8Runner()
+        with pytest.raises(ValueError):
+            hy8_runner.set_bulk_culvert_barrel_span_and_rise([5, 6, 7], [4, 4])
+        with pytest.raises(ValueError):
+            hy8_runner.set_bulk_roadway_width([25, 'wide'])
+        with pytest.raises(KeyError):
+            hy8_runner.set_bulk_columns({'span': [5], 'width': [10]})
+        with pytest.raises(TypeError):
+            hy8_runner.set_bulk_columns({'material': 'concrete'})
+        assert len(hy8_runner.crossings) == 1
+        assert hy8_runner.crossings[0].culverts[0].span == 0.0
+
     def test_validate_crossings_data(self):
         """Validate the data for all culvert crossings."""
         hy8_file = os.path.join(TestHy8Runner.hy8_dir, 'test_run_build_full_report.hy8')
@@ -363,6 +461,66 @@ class TestHy8Runner:
         hy8_runner.create_hy8_file()
         assert os.path.exists(hy8_file)
 
+    def test_to_hy8_string(self):
+        """Serialize the HY-8 project in memory."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.add_crossing()
+
+        hy8_text = hy8_runner.to_hy8_string(project_date=1.5)
+        lines = hy8_text.splitlines(keepends=True)
+        assert lines[0] == 'HY8PROJECTFILE80.0\n'
+        assert lines[1] == 'UNITS  0\n'
+        assert lines[7] == 'PROJDATE  1.5\n'
+        assert lines[8] == 'NUMCROSSINGS  2\n'
+        assert lines[9] == 'STARTCROSSING   "Crossing 1"\n'
+        assert lines[-1] == 'ENDPROJECTFILE\n'
+        assert 2 == hy8_text.count('ENDCROSSING\n')
+        assert 'ROADWAYSECDATA 0.0 110.0\nROADWAYPOINT 100.0 112.0\nROADWAYPOINT 200.0 111.0\n' in hy8_text
+        assert hy8_text == hy8_runner.to_hy8_string(project_date=1.5)
+        assert hy8_runner.to_hy8_bytes(project_date=1.5) == hy8_text.encode('utf-8')
+
+    def test_to_hy8_string_block_cache(self):
+        """Render again only the crossing blocks that changed."""
+        hy8_runner = Hy8Runner()
+        for index in range(5):
+            if index > 0:
+                hy8_runner.add_crossing()
+            hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+            hy8_runner.set_tw_constant(98, 100)
+            hy8_runner.set_roadway_width(25)
+            hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+            hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+
+        hy8_runner.to_hy8_string(project_date=1.5)
+        assert hy8_runner.blocks_rendered == 5
+        hy8_runner.to_hy8_string(project_date=1.5)
+        assert hy8_runner.blocks_rendered == 0
+
+        hy8_runner.set_culvert_barrel_span_and_rise(6, 4, index_crossing=2)
+        hy8_runner.set_roadway_width(30, index=3)
+        hy8_text = hy8_runner.to_hy8_string(project_date=1.5)
+        assert hy8_runner.blocks_rendered == 2
+        assert hy8_text.count('BARRELDATA  6 4') == 1
+
+        hy8_runner.crossings[0].flow.flow_max = 250
+        hy8_runner.add_culvert_barrel(1)
+        hy8_runner.crossings[4].roadway_stations[0] = -10.0
+        hy8_runner.crossings[4].mark_modified()
+        hy8_runner.delete_crossing(3)
+        hy8_text = hy8_runner.to_hy8_string(project_date=1.5)
+        assert hy8_runner.blocks_rendered == 3
+        assert hy8_text.count('STARTCROSSING') == 4
+
+        fresh_runner = Hy8Runner()
+        fresh_runner.crossings = copy.deepcopy(hy8_runner.crossings)
+        assert fresh_runner.to_hy8_string(project_date=1.5) == hy8_text
+
     # def test_run_hy8(self):
     #     """Run the HY-8 file and return the results as a string."""
     #     hy8_file = os.path.join(TestHy8Runner.hy8_dir, 'test_run_hy8.hy8')
@@ -417,6 +575,42 @@ class TestHy8Runner:
         assert results is False
         assert messages == 'HY-8 file must be specified.\n'
 
+    def test_run_open_save_async(self):
+        """Run HY-8 from an event loop, with the shared semaphore limiting the concurrent runs."""
+        hy8_exe_dir = os.path.join(TestHy8Runner.hy8_dir, 'test_run_open_save_async_exe')
+        create_stand_in_hy8(hy8_exe_dir, startup=0.3)
+        hy8_runners = []
+        for index in range(4):
+            hy8_file = os.path.join(TestHy8Runner.hy8_dir, f'test_run_open_save_async_{index}.hy8')
+            hy8_runner = Hy8Runner(hy8_exe_dir, hy8_file)
+            hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+            hy8_runner.set_tw_constant(98, 100)
+            hy8_runner.set_roadway_width(25)
+            hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+            hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+            hy8_runner.set_culvert_barrel_site_data(0, 100, 100, 98)
+            hy8_runner.create_hy8_file()
+            hy8_runners.append(hy8_runner)
+
+        async def run_all():
+            return await asyncio.gather(*[hy8_runner.run_open_save_async() for hy8_runner in hy8_runners])
+
+        async_run_limit = Hy8Runner.async_run_limit
+        Hy8Runner.async_run_limit = 2
+        try:
+            start = time.perf_counter()
+            run_results = asyncio.run(run_all())
+            elapsed = time.perf_counter() - start
+        finally:
+            Hy8Runner.async_run_limit = async_run_limit
+
+        assert [run_result.returncode for run_result in run_results] == [0, 0, 0, 0]
+        assert elapsed >= 2 * 0.3
+        assert elapsed < 4 * 0.3
+        assert all([run_result.elapsed < 2 * 0.3 for run_result in run_results])  # without the wait for a slot
+        for hy8_runner in hy8_runners:
+            assert os.path.exists(hy8_runner.get_output_file('.rst'))
+
     def test_run_build_full_report(self):
         """Validate the data for all culvert crossings."""
         hy8_file = os.path.join(TestHy8Runner.hy8_dir, 'test_run_build_full_report.hy8')
@@ -0,0 +1,144 @@
+"""Performs testing for hy8 batch runner class."""
+# 1. Standard python modules
+import asyncio
+import os
+import time
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_batch import Hy8BatchRunner
+from tests.hy8_stand_in import create_stand_in_hy8
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8BatchRunner:
+    """A class that will test running many HY-8 projects with a stand-in HY-8 executable."""
+
+    test_dir = os.path.dirname(__file__)
+    batch_dir = os.path.join(test_dir, 'files', 'hy8_batch_files')
+
+    def create_hy8_runner(self, hy8_exe_dir, basename):
+        """Create a valid HY-8 Runner."""
+        hy8_runner = Hy8Runner(hy8_exe_dir, os.path.join(self.batch_dir, basename))
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        return hy8_runner
+
+    def test_run(self):
+        """Run several projects concurrently and report status, return code and timing."""
+        hy8_exe_dir = os.path.join(self.batch_dir, 'test_run_exe')
+        create_stand_in_hy8(hy8_exe_dir, startup=0.5)
+        projects = [self.create_hy8_runner(hy8_exe_dir, f'test_run_{index}.hy8') for index in range(4)]
+
+        start = time.perf_counter()
+        job_results = Hy8BatchRunner(projects, 'OpenRunSave', max_workers=4).run()
+        elapsed = time.perf_counter() - start
+
+        assert 4 == len(job_results)
+        assert elapsed < 4 * 0.5
+        for index, job_result in enumerate(job_results):
+            assert job_result.succeeded
+            assert job_result.returncode == 0
+            assert job_result.elapsed >= 0.5
+            assert job_result.hy8_file == projects[index].hy8_file
+            assert os.path.exists(projects[index].get_output_file('.rst'))
+
+    def test_run_paths(self):
+        """Run existing HY-8 files given by path."""
+        hy8_exe_dir = os.path.join(self.batch_dir, 'test_run_paths_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_paths.hy8')
+        hy8_runner.create_hy8_file()
+        docx_file = hy8_runner.get_output_file('.docx')
+        if os.path.exists(docx_file):
+            os.remove(docx_file)
+
+        batch_runner = Hy8BatchRunner(action='BuildFullReport', max_workers=2, hy8_exe_path=hy8_exe_dir)
+        batch_runner.add_project(hy8_runner.hy8_file)
+        job_results = batch_runner.run()
+        assert job_results[0].status == 'success'
+        assert os.path.exists(docx_file)
+
+    def test_run_failures(self):
+        """Report failed, invalid, and missing executable jobs."""
+        hy8_exe_dir = os.path.join(self.batch_dir, 'test_run_failures_exe')
+        create_stand_in_hy8(hy8_exe_dir, returncode=3)
+        failed_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_failures.hy8')
+        invalid_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_failures_invalid.hy8')
+        invalid_runner.set_roadway_width(0)
+        missing_exe_path = os.path.join(self.batch_dir, 'test_run_failures.hy8')
+
+        batch_runner = Hy8BatchRunner([failed_runner, invalid_runner, missing_exe_path], 'OpenRunSave',
+                                      hy8_exe_path=os.path.join(self.batch_dir, 'missing'))
+        job_results = batch_runner.run()
+        assert job_results[0].status == 'failed'
+        assert job_results[0].returncode == 3
+        assert job_results[1].status == 'invalid'
+        assert 'Roadway width must be greater than zero' in job_results[1].messages
+        assert job_results[2].status == 'error'
+        assert job_results[2].returncode is None
+
+    def test_run_exceptions(self):
+        """Record an exception of one project or of the job callback in its job result and run the rest."""
+        hy8_exe_dir = os.path.join(self.batch_dir, 'test_run_exceptions_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        projects = [self.create_hy8_runner(hy8_exe_dir, f'test_run_exceptions_{index}.hy8') for index in range(3)]
+
+        def create_hy8_file(environment=None):
+            raise ValueError('bad project')
+
+        def job_callback(hy8_runner, job_result):
+            if hy8_runner is projects[2]:
+                raise KeyError('bad callback')
+
+        projects[0].create_hy8_file = create_hy8_file
+        batch_runner = Hy8BatchRunner(projects, 'OpenRunSave', max_workers=2)
+        batch_runner.job_callback = job_callback
+        for job_results in (batch_runner.run(), asyncio.run(batch_runner.run_async())):
+            assert [job_result.status for job_result in job_results] == ['error', 'success', 'error']
+            assert job_results[0].messages == 'ValueError: bad project'
+            assert job_results[2].returncode == 0
+            assert job_results[2].messages == "KeyError: 'bad callback'"
+
+    def test_unknown_action(self):
+        """Reject an unknown action."""
+        with pytest.raises(ValueError):
+            Hy8BatchRunner(action='RunEverything').get_commandline_arguments()
+        assert Hy8BatchRunner(action=['-OpenRunSave']).get_commandline_arguments() == ['-OpenRunSave']
+
+    def test_run_async(self):
+        """Run several projects from an event loop with a bounded number of processes."""
+        hy8_exe_dir = os.path.join(self.batch_dir, 'test_run_async_exe')
+        create_stand_in_hy8(hy8_exe_dir, startup=0.4)
+        projects = [self.create_hy8_runner(hy8_exe_dir, f'test_run_async_{index}.hy8') for index in range(4)]
+        projects[3].set_roadway_width(0)
+
+        start = time.perf_counter()
+        job_results = asyncio.run(Hy8BatchRunner(projects, 'OpenRunSave', max_workers=3).run_async())
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 3 * 0.4
+        assert [job_result.status for job_result in job_results] == ['success', 'success', 'success', 'invalid']
+        assert os.path.exists(projects[2].get_output_file('.plt'))
+
+        # With one worker the jobs run one after another; the time a job waits for the worker is not its run time
+        start = time.perf_counter()
+        job_results = asyncio.run(Hy8BatchRunner(projects[:3], 'OpenRunSave', max_workers=1).run_async())
+        assert time.perf_counter() - start >= 3 * 0.4
+        for job_result in job_results:
+            assert 0.4 <= job_result.elapsed < 2 * 0.4
+            assert 0.4 <= job_result.run_result.elapsed < 2 * 0.4
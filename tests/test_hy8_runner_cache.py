@@ -0,0 +1,192 @@
+"""Performs testing for hy8 runner results cache class."""
+# 1. Standard python modules
+import asyncio
+import os
+import shutil
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_cache import Hy8RunnerResultsCache
+from tests.hy8_stand_in import create_stand_in_hy8
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerResultsCache:
+    """A class that will test reusing the output files of identical HY-8 runs."""
+
+    test_dir = os.path.dirname(__file__)
+    cache_test_dir = os.path.join(test_dir, 'files', 'hy8_cache_files')
+
+    def create_hy8_runner(self, hy8_exe_dir, basename, results_cache, span=5):
+        """Create and write a valid HY-8 Runner."""
+        hy8_runner = Hy8Runner(hy8_exe_dir, os.path.join(self.cache_test_dir, basename))
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(span, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.results_cache = results_cache
+        hy8_runner.create_hy8_file()
+        return hy8_runner
+
+    def create_cache(self, name, max_size=1024 ** 3):
+        """Create an empty results cache."""
+        cache_dir = os.path.join(self.cache_test_dir, name)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return Hy8RunnerResultsCache(cache_dir, max_size)
+
+    def test_hit_and_miss(self):
+        """Restore the output files of an identical run without launching HY-8."""
+        hy8_exe_dir = os.path.join(self.cache_test_dir, 'test_hit_and_miss_exe')
+        create_stand_in_hy8(hy8_exe_dir, returncode=0)
+        results_cache = self.create_cache('test_hit_and_miss_cache')
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_hit_and_miss.hy8', results_cache)
+
+        run_result = hy8_runner.run_open_save()
+        assert not run_result.cached
+        assert results_cache.misses == 1
+        with open(hy8_runner.get_output_file('.rst')) as file:
+            rst_text = file.read()
+
+        for output_file in run_result.output_files:
+            os.remove(output_file)
+        hy8_runner.create_hy8_file()  # a new PROJDATE does not change the key
+        create_stand_in_hy8(hy8_exe_dir, returncode=0)  # the same executable contents keep the key
+        run_result = hy8_runner.run_open_save()
+        assert run_result.cached
+        assert run_result.succeeded
+        assert run_result.attempts == 0
+        assert results_cache.hits == 1
+        assert [os.path.splitext(output_file)[1] for output_file in run_result.output_files] == \
+            ['.plt', '.rsql', '.rst']
+        with open(hy8_runner.get_output_file('.rst')) as file:
+            assert file.read() == rst_text
+
+        run_result = asyncio.run(hy8_runner.run_open_save_async())
+        assert run_result.cached
+        assert results_cache.hits == 2
+
+    def test_key(self):
+        """Change the key when the project, the arguments, or the executable change."""
+        hy8_exe_dir = os.path.join(self.cache_test_dir, 'test_key_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        results_cache = self.create_cache('test_key_cache')
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_key.hy8', results_cache)
+        command = hy8_runner.get_hy8_command(['-OpenRunSave'])
+        key = results_cache.get_key(hy8_runner.hy8_file, command)
+
+        hy8_runner.create_hy8_file()
+        assert results_cache.get_key(hy8_runner.hy8_file, command) == key
+        assert results_cache.get_key(hy8_runner.hy8_file, hy8_runner.get_hy8_command(['-OpenRunSavePlots'])) != key
+
+        other_runner = self.create_hy8_runner(hy8_exe_dir, 'test_key_other.hy8', results_cache, span=6)
+        assert results_cache.get_key(other_runner.hy8_file, other_runner.get_hy8_command(['-OpenRunSave'])) != key
+
+        create_stand_in_hy8(hy8_exe_dir, returncode=2)
+        assert results_cache.get_key(hy8_runner.hy8_file, command) != key
+
+    def test_failed_runs_not_stored(self):
+        """Only store the output files of successful runs."""
+        hy8_exe_dir = os.path.join(self.cache_test_dir, 'test_failed_exe')
+        create_stand_in_hy8(hy8_exe_dir, returncode=3)
+        results_cache = self.create_cache('test_failed_cache')
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_failed.hy8', results_cache)
+        assert hy8_runner.run_open_save().status == 'failed'
+        assert hy8_runner.run_open_save().status == 'failed'
+        assert results_cache.hits == 0
+        assert results_cache.misses == 2
+        assert results_cache.size == 0
+
+    def test_projects_sharing_a_name_prefix(self):
+        """Store and restore only the output files of job_1, not those of job_10 in the same directory."""
+        results_cache = self.create_cache('test_prefix_cache')
+        stems = [os.path.join(self.cache_test_dir, f'test_prefix_job_{number}') for number in (1, 10)]
+        for stem in stems:
+            for extension in ('.hy8', '.rst'):
+                with open(stem + extension, 'w') as file:
+                    file.write(f'{os.path.basename(stem)}{extension}\n')
+
+        results_cache.store('job_1', stems[0] + '.hy8', [stems[0] + '.rst', stems[1] + '.hy8', stems[1] + '.rst'])
+        with open(os.path.join(results_cache.cache_dir, 'job_1', results_cache.manifest_name)) as file:
+            assert file.read() == '.rst\n'
+        assert results_cache.restore('job_1', stems[0] + '.hy8') == [stems[0] + '.rst']
+        for extension in ('.hy8', '.rst'):
+            with open(stems[1] + extension) as file:
+                assert file.read() == f'test_prefix_job_10{extension}\n'
+
+    def test_restore_incomplete_entry(self):
+        """Count an entry that is missing a file as a miss and leave the output files as they were."""
+        results_cache = self.create_cache('test_incomplete_cache')
+        stem = os.path.join(self.cache_test_dir, 'test_incomplete')
+        for extension in ('.plt', '.rst'):
+            with open(stem + extension, 'w') as file:
+                file.write('cached\n')
+        results_cache.store('incomplete', stem + '.hy8', [stem + '.plt', stem + '.rst'])
+        os.remove(os.path.join(results_cache.cache_dir, 'incomplete', '1'))
+        for extension in ('.plt', '.rst'):
+            with open(stem + extension, 'w') as file:
+                file.write('current\n')
+
+        assert results_cache.restore('incomplete', stem + '.hy8') is None
+        assert results_cache.misses == 1
+        for extension in ('.plt', '.rst'):
+            with open(stem + extension) as file:
+                assert file.read() == 'current\n'
+        assert [name for name in os.listdir(self.cache_test_dir) if name.endswith('.tmp')] == []
+
+    def test_running_size(self):
+        """Keep the size of the cache as a running total, scanning the entries only to evict them."""
+        results_cache = self.create_cache('test_running_size_cache')
+        stem = os.path.join(self.cache_test_dir, 'test_running_size')
+        with open(stem + '.rst', 'w') as file:
+            file.write('x' * 100)
+        results_cache.store('first', stem + '.hy8', [stem + '.rst'])
+        entry_size = results_cache.size
+
+        scans = []
+        scan_entries = results_cache._scan_entries
+        results_cache._scan_entries = lambda: scans.append(1) or scan_entries()
+        results_cache.store('second', stem + '.hy8', [stem + '.rst'])
+        results_cache.store('third', stem + '.hy8', [stem + '.rst'])
+        assert scans == []
+        assert results_cache.size == 3 * entry_size
+
+        results_cache.max_size = 3 * entry_size
+        results_cache.store('fourth', stem + '.hy8', [stem + '.rst'])
+        assert scans == [1]
+        assert results_cache.evictions == 1
+        assert results_cache.size == 3 * entry_size
+        results_cache.clear()
+        assert results_cache.size == 0
+
+    def test_evict(self):
+        """Remove the least recently used entries when the cache is too large."""
+        hy8_exe_dir = os.path.join(self.cache_test_dir, 'test_evict_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        results_cache = self.create_cache('test_evict_cache')
+        hy8_runners = [self.create_hy8_runner(hy8_exe_dir, f'test_evict_{span}.hy8', results_cache, span=span)
+                       for span in (3, 4, 5)]
+        for hy8_runner in hy8_runners:
+            hy8_runner.run_open_save()
+        entry_size = results_cache.size // 3
+        assert results_cache.size > 0
+
+        hy8_runners[0].run_open_save()  # the first entry is now the most recently used
+        results_cache.max_size = 2 * entry_size + entry_size // 2
+        results_cache.evict()
+        assert results_cache.evictions == 1
+        assert hy8_runners[0].run_open_save().cached
+        assert not hy8_runners[1].run_open_save().cached
+
+        results_cache.clear()
+        assert results_cache.size == 0
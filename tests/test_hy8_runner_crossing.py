@@ -1,5 +1,7 @@
 """Performs testing for hy8 runner class."""
 # 1. Standard python modules
+import copy
+import pickle
 
 # 2. Third party modules
 
@@ -87,3 +89,48 @@ class TestHy8RunnerCrossing:
             assert lines[33] == 'ENDCULVNOTES\n'
             assert lines[34] == 'ENDCULVERT\n'
             assert lines[35] == 'ENDCROSSING\n'
+
+    def test_to_hy8_string(self):
+        """Build the crossing block in memory."""
+        hy8_runner_crossing = Hy8RunnerCulvertCrossing(0)
+        hy8_runner_crossing.tw_rating_curve = [[0, 98.0, 0], [100, 100.0, 3]]
+        hy8_runner_crossing.roadway_stations = [0.0, 50.0]
+        hy8_runner_crossing.roadway_elevations = [110.0, 111.0]
+        hy8_runner_crossing.uuid = '38fb71e5-255b-451c-b616-2e219d9f82ad'
+
+        hy8_text = hy8_runner_crossing.to_hy8_string()
+        assert 'RATINGCURVE\nNUMPOINTS 2\n\tFLOW 0\n\tELEVATION 98.0\n\tVELOCITY 0\n' in hy8_text
+        assert 'NUMSTATIONS 2\nROADWAYSECDATA 0.0 110.0\nROADWAYPOINT 50.0 111.0\n' in hy8_text
+        assert 'CROSSGUID            38fb71e5-255b-451c-b616-2e219d9f82ad\nENDCROSSING\n' in hy8_text
+        assert hy8_text.count('STARTCULVERT') == 1
+
+    def test_compact_storage(self):
+        """Store the roadway profile and flows as arrays of floats in slots."""
+        hy8_runner_crossing = Hy8RunnerCulvertCrossing(0)
+        hy8_runner_crossing.roadway_stations = [0, 50, 100]
+        hy8_runner_crossing.roadway_elevations = (110, 111, 110.5)
+        hy8_runner_crossing.flow.flow_list = [10, 20]
+
+        assert hy8_runner_crossing.roadway_stations.typecode == 'd'
+        assert hy8_runner_crossing.roadway_stations == [0.0, 50.0, 100.0]
+        assert hy8_runner_crossing.roadway_elevations == [110.0, 111.0, 110.5]
+        assert hy8_runner_crossing.flow.flow_list == [10.0, 20.0]
+        assert not hasattr(hy8_runner_crossing, '__dict__')
+        assert not hasattr(hy8_runner_crossing.flow, '__dict__')
+        assert not hasattr(hy8_runner_crossing.culverts[0], '__dict__')
+
+        hy8_runner_crossing.roadway_stations.append(150)
+        assert hy8_runner_crossing.roadway_stations[-1] == 150.0
+
+        crossing_copy = copy.deepcopy(hy8_runner_crossing)
+        crossing_copy.roadway_stations[0] = -10.0
+        assert type(crossing_copy.roadway_stations) is type(hy8_runner_crossing.roadway_stations)
+        assert hy8_runner_crossing.roadway_stations[0] == 0.0
+        assert pickle.loads(pickle.dumps(hy8_runner_crossing)).roadway_elevations == [110.0, 111.0, 110.5]
+
+    def test_guid(self):
+        """Set the crossing GUID through guid or uuid."""
+        hy8_runner_crossing = Hy8RunnerCulvertCrossing(0)
+        hy8_runner_crossing.guid = '38fb71e5-255b-451c-b616-2e219d9f82ad'
+        assert hy8_runner_crossing.uuid == '38fb71e5-255b-451c-b616-2e219d9f82ad'
+        assert 'CROSSGUID            38fb71e5-255b-451c-b616-2e219d9f82ad\n' in hy8_runner_crossing.to_hy8_string()
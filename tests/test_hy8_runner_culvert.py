@@ -61,3 +61,15 @@ class TestHy8RunnerCulvert:
             assert lines[9] == 'STARTCULVNOTES ""\n'
             assert lines[10] == 'ENDCULVNOTES\n'
             assert lines[11] == 'ENDCULVERT\n'
+
+    def test_to_hy8_string(self):
+        """Build the culvert block in memory."""
+        hy8_runner_culvert = Hy8RunnerCulvertBarrel(0)
+        hy8_runner_culvert.material = 'corrugated steel'
+        hy8_runner_culvert.span = 4.0
+
+        hy8_text = hy8_runner_culvert.to_hy8_string()
+        assert hy8_text.startswith('STARTCULVERT    "Culvert 1"\nCULVERTSHAPE    1\nCULVERTMATERIAL 2\n')
+        assert 'BARRELDATA  4.0 0.0 0.024 0.024\n' in hy8_text
+        assert 'BARRELSPACING 6.0\n' in hy8_text
+        assert hy8_text.endswith('ENDCULVERT\n')
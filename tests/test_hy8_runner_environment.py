@@ -0,0 +1,96 @@
+"""Performs testing for hy8 environment checks class."""
+# 1. Standard python modules
+import os
+import shutil
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_environment import Hy8RunnerEnvironment
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerEnvironment:
+    """A class that will test the environment checks and side-effect-free validation."""
+
+    test_dir = os.path.dirname(__file__)
+    environment_dir = os.path.join(test_dir, 'files', 'hy8_environment_files')
+
+    def create_exe(self, name, contents=b'MZ'):
+        """Create a file standing in for the HY-8 executable."""
+        exe_dir = os.path.join(self.environment_dir, name)
+        os.makedirs(exe_dir, exist_ok=True)
+        with open(os.path.join(exe_dir, 'HY864.exe'), 'wb') as file:
+            file.write(contents)
+        return exe_dir
+
+    def create_runner(self, exe_dir, hy8_file):
+        """Create a runner with one valid crossing."""
+        hy8_runner = Hy8Runner(exe_dir, hy8_file)
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 100, 98)
+        return hy8_runner
+
+    def test_check_executable(self):
+        """Check the executable once per path until cleared."""
+        exe_dir = self.create_exe('cached')
+        hy8_exe = os.path.join(exe_dir, 'HY864.exe')
+        environment = Hy8RunnerEnvironment()
+        assert environment.check_executable(hy8_exe) == (True, None)
+
+        os.remove(hy8_exe)
+        assert environment.check_executable(hy8_exe) == (True, None)
+        environment.clear()
+        assert environment.check_executable(hy8_exe) == (False, None)
+
+    def test_get_executable_version(self):
+        """Read the file version from the version resource of the executable."""
+        contents = b'MZ' + b'\0' * 30 + 'FileVersion\0'.encode('utf-16-le') + '8.0.1.0\0'.encode('utf-16-le')
+        exe_dir = self.create_exe('version', contents)
+        hy8_exe = os.path.join(exe_dir, 'HY864.exe')
+        assert Hy8RunnerEnvironment.get_executable_version(hy8_exe) == '8.0.1.0'
+        assert Hy8RunnerEnvironment().check_executable(hy8_exe) == (True, '8.0.1.0')
+
+    def test_validate_without_side_effects(self):
+        """Validate without truncating the HY-8 file or creating its directory."""
+        exe_dir = self.create_exe('validate')
+        hy8_file = os.path.join(self.environment_dir, 'validate.hy8')
+        with open(hy8_file, 'w') as file:
+            file.write('previous output')
+        hy8_runner = self.create_runner(exe_dir, hy8_file)
+
+        assert hy8_runner.validate_crossings_data() == (True, '')
+        with open(hy8_file) as file:
+            assert file.read() == 'previous output'
+
+        assert hy8_runner.validate_crossings_data(overwrite=False) == \
+            (False, f'HY-8 file already exists: {hy8_file}\n')
+
+        new_dir = os.path.join(self.environment_dir, 'new_dir')
+        shutil.rmtree(new_dir, ignore_errors=True)
+        hy8_runner.set_hy8_file(os.path.join(new_dir, 'validate.hy8'))
+        assert hy8_runner.validate_crossings_data() == (True, '')
+        assert not os.path.exists(new_dir)
+
+        result, _ = hy8_runner.create_hy8_file()
+        assert result is True
+        assert os.path.exists(hy8_runner.hy8_file)
+
+    def test_validate_model(self):
+        """Validate the crossings without the executable or the HY-8 file."""
+        hy8_runner = self.create_runner('', '')
+        assert hy8_runner.validate_model().is_valid
+        assert hy8_runner.check_environment() == \
+            (False, f'HY-8 executable does not exist: {os.path.join("", "HY864.exe")}\nHY-8 file must be specified.\n')
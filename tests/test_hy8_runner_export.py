@@ -0,0 +1,140 @@
+"""Performs testing for hy8 results exporter class."""
+# 1. Standard python modules
+import csv
+import gzip
+import math
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_batch import Hy8BatchRunner
+from hy8runner.hy8_runner_export import Hy8RunnerResultsExporter
+from hy8runner.hy8_runner_results import Hy8RunnerResults
+from tests.hy8_stand_in import create_stand_in_hy8
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerResultsExporter:
+    """A class that will test exporting results a chunk at a time."""
+
+    test_dir = os.path.dirname(__file__)
+    export_dir = os.path.join(test_dir, 'files', 'hy8_export_files')
+
+    def create_results(self):
+        """Create the results of two crossings with three and two flows."""
+        results = Hy8RunnerResults()
+        results.sources.append('project.rst')
+        results.add_crossing(0, 0, 'Crossing 1', {'flow': [0, 100, 200], 'headwater': [100, 105, 111],
+                                                  'tailwater': [98, 99, 100], 'outlet_velocity': [0, 5, 8],
+                                                  'overtopping_flow': [0, 0, 12],
+                                                  'control': ['Inlet Control', 'Inlet Control', 'Outlet Control']})
+        results.add_crossing(0, 1, 'Crossing 2', {'flow': [0, 50], 'headwater': [90, 95], 'tailwater': [88, 89],
+                                                  'outlet_velocity': [0, 3], 'overtopping_flow': [0, 0],
+                                                  'control': ['Inlet Control', 'Inlet Control']})
+        return results
+
+    def create_crossings(self):
+        """Create the crossings of the results; only the first has a roadway."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.add_crossing()
+        return hy8_runner.crossings
+
+    def read_csv(self, csv_file):
+        """Read the rows of an exported CSV file."""
+        opener = gzip.open if csv_file.endswith('.gz') else open
+        with opener(csv_file, 'rt', newline='') as file:
+            return list(csv.reader(file))
+
+    def test_csv_chunks(self):
+        """Write gzip CSV rows every chunk, with the freeboard from the crossings."""
+        os.makedirs(self.export_dir, exist_ok=True)
+        csv_file = os.path.join(self.export_dir, 'results.csv.gz')
+        with Hy8RunnerResultsExporter(csv_file, chunk_rows=2) as exporter:
+            assert exporter.add_results(self.create_results(), self.create_crossings()) == 5
+            assert exporter.rows_written == 4
+            assert exporter.chunks_written == 2
+            assert len(exporter) == 5
+            exporter.add_results(self.create_results())
+        assert exporter.rows_written == 10
+        assert exporter.chunks_written == 5
+
+        rows = self.read_csv(csv_file)
+        assert rows[0] == list(Hy8RunnerResultsExporter.columns)
+        assert len(rows) == 11
+        assert rows[1] == ['project.rst', '0', 'Crossing 1', '0.0', '100.0', '98.0', 'Inlet Control', '0.0', '0.0',
+                           '10.0']
+        assert rows[3][2] == 'Crossing 1' and float(rows[3][9]) == -1.0
+        assert rows[4][1:3] == ['1', 'Crossing 2'] and math.isnan(float(rows[4][9]))
+        assert math.isnan(float(rows[6][9]))
+
+    def test_empty_and_closed(self):
+        """Write only the header when there are no rows, and refuse rows after closing."""
+        os.makedirs(self.export_dir, exist_ok=True)
+        csv_file = os.path.join(self.export_dir, 'empty.csv')
+        exporter = Hy8RunnerResultsExporter(csv_file)
+        exporter.close()
+        exporter.close()
+        assert self.read_csv(csv_file) == [list(Hy8RunnerResultsExporter.columns)]
+        with pytest.raises(ValueError):
+            exporter.add_results(self.create_results())
+        with pytest.raises(ValueError):
+            Hy8RunnerResultsExporter(os.path.join(self.export_dir, 'results.txt'))
+
+    @pytest.mark.parametrize('file_name', ['results.parquet', 'results.arrow'])
+    def test_arrow_formats(self, file_name):
+        """Write a row group or record batch per chunk to Parquet and Arrow files."""
+        pa = pytest.importorskip('pyarrow')
+        os.makedirs(self.export_dir, exist_ok=True)
+        output_file = os.path.join(self.export_dir, file_name)
+        with Hy8RunnerResultsExporter(output_file, chunk_rows=2) as exporter:
+            exporter.add_results(self.create_results(), self.create_crossings())
+        if file_name.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            assert pq.ParquetFile(output_file).num_row_groups == 3
+            table = pq.read_table(output_file)
+        else:
+            with pa.ipc.open_file(output_file) as reader:
+                assert reader.num_record_batches == 3
+                table = reader.read_all()
+        assert table.column_names == list(Hy8RunnerResultsExporter.columns)
+        assert table.column('headwater').to_pylist() == [100.0, 105.0, 111.0, 90.0, 95.0]
+        assert table.column('freeboard').to_pylist()[:3] == [10.0, 5.0, -1.0]
+
+    def test_batch_job_callback(self):
+        """Append the results of each job as the batch finishes it."""
+        hy8_exe_dir = os.path.join(self.export_dir, 'test_batch_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        projects = []
+        for index in range(3):
+            hy8_runner = Hy8Runner(hy8_exe_dir, os.path.join(self.export_dir, f'batch_{index}.hy8'))
+            hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+            hy8_runner.set_tw_constant(98, 100)
+            hy8_runner.set_roadway_width(25)
+            hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+            hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+            hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+            projects.append(hy8_runner)
+        projects[2].set_roadway_width(0)
+
+        csv_file = os.path.join(self.export_dir, 'batch.csv')
+        with Hy8RunnerResultsExporter(csv_file, chunk_rows=4) as exporter:
+            batch_runner = Hy8BatchRunner(projects, max_workers=2)
+            batch_runner.job_callback = exporter.add_job
+            job_results = batch_runner.run()
+            assert exporter.rows_written == 8
+        assert [job_result.status for job_result in job_results] == ['success', 'success', 'invalid']
+        rows = self.read_csv(csv_file)
+        assert len(rows) == 11
+        assert sorted({row[0] for row in rows[1:]}) == sorted([projects[0].get_output_file('.rst'),
+                                                               projects[1].get_output_file('.rst')])
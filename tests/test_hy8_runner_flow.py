@@ -58,6 +58,51 @@ class TestHy8RunnerFlow:
         hy8_runner_flow.compute_list()
         assert hy8_runner_flow.flow_list == [0.0, 200.0]
 
+    def test_compute_list_endpoint(self):
+        """Keep the maximum flow when the increment is not exact in floating point."""
+        hy8_runner_flow = Hy8RunnerFlow()
+        hy8_runner_flow.method = 'min-max-increment'
+        hy8_runner_flow.flow_min = 0.0
+        hy8_runner_flow.flow_max = 1.0
+        hy8_runner_flow.flow_increment = 0.1
+        hy8_runner_flow.compute_list()
+        assert len(hy8_runner_flow.flow_list) == 11
+        assert hy8_runner_flow.flow_list[3] == 0.1 * 3
+        assert hy8_runner_flow.flow_list[-1] == 1.0
+
+        hy8_runner_flow.flow_min = 10.0
+        hy8_runner_flow.flow_max = 10.25
+        hy8_runner_flow.compute_list()
+        assert hy8_runner_flow.flow_list == [10.0, 10.1, 10.2]
+
+        hy8_runner_flow.flow_increment = 0.0
+        hy8_runner_flow.compute_list()
+        assert hy8_runner_flow.flow_list == []
+
+    def test_compute_list_cached(self):
+        """Reuse the computed list until a flow value changes."""
+        hy8_runner_flow = Hy8RunnerFlow()
+        hy8_runner_flow.method = 'min-max-increment'
+        hy8_runner_flow.flow_max = 200.0
+        hy8_runner_flow.flow_increment = 50.0
+        hy8_runner_flow.compute_list()
+        flow_list = hy8_runner_flow.flow_list
+        hy8_runner_flow.compute_list()
+        assert hy8_runner_flow.flow_list is flow_list
+
+        hy8_runner_flow.flow_max = 100.0
+        hy8_runner_flow.compute_list()
+        assert hy8_runner_flow.flow_list == [0.0, 50.0, 100.0]
+
+        hy8_runner_flow.flow_list = [1.0]
+        hy8_runner_flow.compute_list()
+        assert hy8_runner_flow.flow_list == [0.0, 50.0, 100.0]
+
+        hy8_runner_flow.method = 'user-defined'
+        hy8_runner_flow.flow_list = [5.0, 10.0]
+        hy8_runner_flow.compute_list()
+        assert hy8_runner_flow.flow_list == [5.0, 10.0]
+
     def test_validate_flows(self):
         """Validate the data."""
         hy8_runner_flow = Hy8RunnerFlow()
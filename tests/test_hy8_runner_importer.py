@@ -0,0 +1,141 @@
+"""Performs testing for hy8 inventory importer class."""
+# 1. Standard python modules
+import csv
+import gzip
+import io
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_importer import Hy8InventoryImporter
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8InventoryImporter:
+    """A class that will test importing crossings from an inventory."""
+
+    test_dir = os.path.dirname(__file__)
+    importer_dir = os.path.join(test_dir, 'files', 'hy8_importer_files')
+    column_map = {'STRUCTURE_ID': 'crossing_key', 'STRUCTURE_NAME': 'name', 'Q_MAX': 'flow_max',
+                  'TW_ELEV': 'tw_constant_elevation', 'TW_INVERT': 'tw_invert_elevation', 'ROAD_WIDTH': 'roadway_width',
+                  'ROAD_LENGTH': 'roadway_length', 'ROAD_ELEV': 'roadway_elevation', 'BARREL': 'culvert_name',
+                  'SHAPE': 'shape', 'SPAN': 'span', 'RISE': 'rise', 'MATERIAL': 'material',
+                  'INLET_ELEV': 'inlet_invert_elevation', 'OUTLET_STATION': 'outlet_invert_station',
+                  'OUTLET_ELEV': 'outlet_invert_elevation', 'BARRELS': 'number_of_barrels'}
+    defaults = {'flow_method': 'min-max-increment', 'flow_increment': 50, 'tw_type': 6}
+
+    def get_rows(self):
+        """Return an inventory of three crossings, the second with two barrels."""
+        header = ['STRUCTURE_ID', 'STRUCTURE_NAME', 'Q_MAX', 'TW_ELEV', 'TW_INVERT', 'ROAD_WIDTH', 'ROAD_LENGTH',
+                  'ROAD_ELEV', 'BARREL', 'SHAPE', 'SPAN', 'RISE', 'MATERIAL', 'INLET_ELEV', 'OUTLET_STATION',
+                  'OUTLET_ELEV', 'BARRELS', 'OWNER']
+        return [header,
+                ['S-1', 'Elm Creek', '200', '100', '98', '25', '200', '110', 'Pipe', 'circle', '5', '', 'concrete',
+                 '100', '40', '98', '1', 'county'],
+                ['S-2', 'Oak Creek', '300', '101', '99', '30', '150', '112', 'Left', 'box', '6', '4', '', '101', '50',
+                 '99', '2', 'state'],
+                ['S-2', '', '', '', '', '', '', '', 'Right', 'circle', '3', '', 'corrugated steel', '101.5', '50',
+                 '99.5', '', 'state'],
+                ['S-3', 'Ash Creek', '150', '99', '97', '20', '100', '108', 'Pipe', 'circle', '4', '', 'concrete',
+                 '99', '30', '97', '1', 'city']]
+
+    def write_csv(self, file_name, compress=False):
+        """Write the inventory to a CSV file."""
+        os.makedirs(self.importer_dir, exist_ok=True)
+        inventory = os.path.join(self.importer_dir, file_name)
+        with (gzip.open(inventory, 'wt', newline='') if compress else open(inventory, 'w', newline='')) as file:
+            csv.writer(file).writerows(self.get_rows())
+        return inventory
+
+    def check_crossings(self, keyed_crossings):
+        """Check the crossings built from the inventory."""
+        keys = [key for key, _ in keyed_crossings]
+        crossings = [crossing for _, crossing in keyed_crossings]
+        assert keys == ['S-1', 'S-2', 'S-3']
+        assert [crossing.name for crossing in crossings] == ['Elm Creek', 'Oak Creek', 'Ash Creek']
+        assert crossings[1].flow.method == 'min-max-increment'
+        assert crossings[1].flow.flow_max == 300.0
+        assert crossings[1].tw_type == 6
+        assert crossings[1].tw_constant_elevation == 101.0
+        assert crossings[1].roadway_shape == 1
+        assert crossings[1].roadway_stations == [0.0, 150.0]
+        assert crossings[1].roadway_elevations == [112.0, 112.0]
+
+        culverts = crossings[1].culverts
+        assert [culvert.name for culvert in culverts] == ['Left', 'Right']
+        assert [culvert.shape for culvert in culverts] == ['box', 'circle']
+        assert [culvert.span for culvert in culverts] == [6.0, 3.0]
+        assert [culvert.rise for culvert in culverts] == [4.0, 0.0]
+        assert [culvert.material for culvert in culverts] == ['concrete', 'corrugated steel']
+        assert [culvert.number_of_barrels for culvert in culverts] == [2, 1]
+        assert culverts[1].inlet_invert_elevation == 101.5
+        assert len(crossings[0].culverts) == 1 and len(crossings[2].culverts) == 1
+
+        hy8_runner = Hy8Runner()
+        hy8_runner.crossings = crossings
+        assert hy8_runner.validate_model().is_valid
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 10])
+    def test_iter_crossings(self, chunk_size):
+        """Build crossings and barrels from a CSV inventory, whatever the chunk size."""
+        inventory = self.write_csv('inventory.csv')
+        importer = Hy8InventoryImporter(self.column_map, chunk_size, self.defaults)
+        assert [len(chunk) for chunk in importer.iter_chunks(inventory)][0] == min(chunk_size, 4)
+        self.check_crossings(list(importer.iter_crossings(inventory)))
+
+    def test_gzip_and_open_file(self):
+        """Read a gzip compressed inventory and an open CSV file."""
+        importer = Hy8InventoryImporter(self.column_map, 2, self.defaults)
+        self.check_crossings(list(importer.iter_crossings(self.write_csv('inventory.csv.gz', compress=True))))
+
+        text = io.StringIO()
+        csv.writer(text).writerows(self.get_rows())
+        text.seek(0)
+        self.check_crossings(list(importer.iter_crossings(text)))
+
+    def test_iter_projects(self):
+        """Pack the crossings into projects that write HY-8 files."""
+        inventory = self.write_csv('inventory.csv')
+        importer = Hy8InventoryImporter(self.column_map, 2, self.defaults)
+        projects = list(importer.iter_projects(inventory, self.importer_dir, pack_size=2))
+        assert [keys for keys, _ in projects] == [['S-1', 'S-2'], ['S-3']]
+        _, hy8_runner = projects[0]
+        assert hy8_runner.hy8_file == os.path.join(self.importer_dir, 'inventory_0.hy8')
+        hy8_text = hy8_runner.to_hy8_string(project_date=1.5)
+        assert hy8_text.count('STARTCROSSING') == 2
+        assert hy8_text.count('STARTCULVERT') == 3
+
+    def test_invalid_inventory(self):
+        """Report unknown column targets and values that are not numbers."""
+        with pytest.raises(KeyError):
+            Hy8InventoryImporter({'SPAN': 'diameter'})
+        rows = self.get_rows()
+        rows[1][10] = 'five'
+        text = io.StringIO()
+        csv.writer(text).writerows(rows)
+        text.seek(0)
+        importer = Hy8InventoryImporter(self.column_map)
+        with pytest.raises(ValueError, match='span'):
+            list(importer.iter_crossings(text))
+
+    def test_parquet(self):
+        """Read a Parquet inventory in record batches."""
+        pa = pytest.importorskip('pyarrow')
+        pq = pytest.importorskip('pyarrow.parquet')
+        rows = self.get_rows()
+        columns = {name: [row[position] for row in rows[1:]] for position, name in enumerate(rows[0])}
+        os.makedirs(self.importer_dir, exist_ok=True)
+        inventory = os.path.join(self.importer_dir, 'inventory.parquet')
+        pq.write_table(pa.table(columns), inventory)
+        importer = Hy8InventoryImporter(self.column_map, 2, self.defaults)
+        self.check_crossings(list(importer.iter_crossings(inventory)))
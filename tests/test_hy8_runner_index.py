@@ -0,0 +1,129 @@
+"""Performs testing for hy8 crossing index class."""
+# 1. Standard python modules
+import copy
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_crossing import Hy8RunnerCulvertCrossing
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerCrossingIndex:
+    """A class that will test finding crossings by name and UUID."""
+
+    def create_project(self, num_crossings):
+        """Create a project of crossings named and identified by their index."""
+        hy8_runner = Hy8Runner()
+        for index in range(num_crossings):
+            if index > 0:
+                hy8_runner.add_crossing()
+            hy8_runner.set_culvert_crossing_name(f'Crossing {index}', index)
+            hy8_runner.crossings[index].uuid = f'uuid-{index}'
+        return hy8_runner
+
+    def test_get_crossing(self):
+        """Find crossings by index, name, and UUID."""
+        hy8_runner = self.create_project(5)
+        assert hy8_runner.get_crossing(2) is hy8_runner.crossings[2]
+        assert hy8_runner.get_crossing('Crossing 3') is hy8_runner.crossings[3]
+        assert hy8_runner.get_crossing('uuid-4') is hy8_runner.crossings[4]
+        with pytest.raises(KeyError):
+            hy8_runner.get_crossing('Crossing 9')
+
+    def test_numpy_index(self):
+        """Address crossings and barrels by NumPy integers, such as the rows of a DataFrame."""
+        np = pytest.importorskip('numpy')
+        hy8_runner = self.create_project(3)
+        assert hy8_runner.get_crossing(np.int64(1)) is hy8_runner.crossings[1]
+        hy8_runner.set_roadway_width(30, np.int64(2))
+        assert hy8_runner.crossings[2].roadway_width == 30.0
+        hy8_runner.set_culvert_barrel_span_and_rise(6, 5, np.int64(0), np.int32(0))
+        assert hy8_runner.get_culvert_barrel(0, np.int64(0)).span == 6.0
+        hy8_runner.set_roadway_width(40, np.int64(9))
+        assert hy8_runner.crossings[-1].roadway_width == 40.0
+
+        hy8_runner.delete_crossing(np.int64(0))
+        assert [crossing.name for crossing in hy8_runner.crossings] == ['Crossing 1', 'Crossing 2']
+
+    def test_add_delete_rename(self):
+        """Keep the index up to date as crossings are added, deleted, and renamed."""
+        hy8_runner = self.create_project(3)
+        assert hy8_runner.get_crossing('Crossing 1') is hy8_runner.crossings[1]
+
+        index = hy8_runner.add_crossing()
+        hy8_runner.set_culvert_crossing_name('New', index)
+        assert hy8_runner.get_crossing('New') is hy8_runner.crossings[3]
+
+        hy8_runner.delete_crossing('Crossing 1')
+        assert [crossing.name for crossing in hy8_runner.crossings] == ['Crossing 0', 'Crossing 2', 'New']
+        with pytest.raises(KeyError):
+            hy8_runner.get_crossing('uuid-1')
+
+        hy8_runner.crossings[0].name = 'Renamed'
+        hy8_runner.crossings[0].uuid = 'uuid-renamed'
+        assert hy8_runner.get_crossing('Renamed') is hy8_runner.crossings[0]
+        assert hy8_runner.get_crossing('uuid-renamed') is hy8_runner.crossings[0]
+        with pytest.raises(KeyError):
+            hy8_runner.get_crossing('Crossing 0')
+
+    def test_replaced_crossings(self):
+        """Rebuild the index when the list of crossings is replaced or changed in place."""
+        hy8_runner = self.create_project(2)
+        assert hy8_runner.get_crossing('Crossing 1') is hy8_runner.crossings[1]
+
+        crossing = Hy8RunnerCulvertCrossing(0)
+        crossing.name = 'Other'
+        hy8_runner.crossings = [crossing]
+        assert hy8_runner.get_crossing('Other') is crossing
+
+        replacement = Hy8RunnerCulvertCrossing(1)
+        replacement.name = 'Replacement'
+        hy8_runner.crossings[0] = replacement
+        hy8_runner.reindex()
+        assert hy8_runner.get_crossing('Replacement') is replacement
+        with pytest.raises(KeyError):
+            hy8_runner.get_crossing('Other')
+
+        # The replaced crossing no longer tells the index about its name
+        crossing.name = 'Replacement 2'
+        with pytest.raises(KeyError):
+            hy8_runner.get_crossing('Replacement 2')
+
+    def test_setters_by_key(self):
+        """Address the setters by the name or UUID of the crossing and the name of the barrel."""
+        hy8_runner = self.create_project(3)
+        hy8_runner.set_roadway_width(30, 'Crossing 1')
+        assert hy8_runner.crossings[1].roadway_width == 30.0
+
+        hy8_runner.set_culvert_barrel_name('Left', 'uuid-2', 0)
+        hy8_runner.add_culvert_barrel('uuid-2')
+        hy8_runner.set_culvert_barrel_name('Right', 'uuid-2', 1)
+        hy8_runner.set_culvert_barrel_span_and_rise(6, 5, 'uuid-2', 'Left')
+        assert hy8_runner.get_culvert_barrel('Crossing 2', 'Left').span == 6.0
+        assert hy8_runner.get_culvert_barrel('Crossing 2', 1) is hy8_runner.crossings[2].culverts[1]
+
+        hy8_runner.delete_culvert_barrel('Crossing 2', 'Left')
+        assert [culvert.name for culvert in hy8_runner.crossings[2].culverts] == ['Right']
+        with pytest.raises(KeyError):
+            hy8_runner.get_culvert_barrel('Crossing 2', 'Left')
+
+    def test_copied_runner(self):
+        """Index the crossings of a copied runner apart from the original."""
+        hy8_runner = self.create_project(2)
+        assert hy8_runner.get_crossing('Crossing 1') is hy8_runner.crossings[1]
+        copied = copy.deepcopy(hy8_runner)
+        copied.crossings[1].name = 'Copied'
+        assert copied.get_crossing('Copied') is copied.crossings[1]
+        assert hy8_runner.get_crossing('Crossing 1') is hy8_runner.crossings[1]
+        with pytest.raises(KeyError):
+            hy8_runner.get_crossing('Copied')
@@ -0,0 +1,82 @@
+"""Performs testing for hy8 crossing packer class."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_packer import Hy8CrossingPacker
+from tests.hy8_stand_in import create_stand_in_hy8
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8CrossingPacker:
+    """A class that will test packing crossings into HY-8 projects with a stand-in HY-8 executable."""
+
+    test_dir = os.path.dirname(__file__)
+    packer_dir = os.path.join(test_dir, 'files', 'hy8_packer_files')
+
+    def create_crossing(self, span):
+        """Create a valid crossing with a culvert of the given span."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(span, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        return hy8_runner.crossings[0]
+
+    def test_pack(self):
+        """Split the crossings into projects of pack size crossings."""
+        packer = Hy8CrossingPacker(os.path.join(self.packer_dir, 'test_pack'), pack_size=3)
+        crossings = [self.create_crossing(span) for span in range(1, 8)]
+        for crossing in crossings:
+            packer.add_crossing(crossing)
+        projects = packer.pack()
+        assert [len(project.crossings) for project in projects] == [3, 3, 1]
+        assert projects[1].crossings[0] is crossings[3]
+        assert projects[2].hy8_file.endswith('pack_2.hy8')
+
+        packer.shards = [[0, 1]]
+        packer.clear()
+        assert packer.crossings == [] and packer.keys == [] and packer.shards is None
+        assert packer.pack() == []
+        assert packer.add_crossing(crossings[0]) == 0
+
+        packer.pack_size = 0
+        with pytest.raises(ValueError):
+            packer.pack()
+
+    def test_run(self):
+        """Run the packed projects and return the results of each crossing under its key."""
+        hy8_exe_dir = os.path.join(self.packer_dir, 'test_run_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        packer = Hy8CrossingPacker(os.path.join(self.packer_dir, 'test_run'), pack_size=3,
+                                   hy8_exe_path=hy8_exe_dir, max_workers=2)
+        spans = [1, 2, 3, 4, 5, 6, 7]
+        for span in spans:
+            packer.add_crossing(self.create_crossing(span), key=f'culvert-{span}')
+        crossing = self.create_crossing(8)
+        crossing.roadway_width = 0
+        packer.add_crossing(crossing, key='invalid')
+
+        crossing_results = packer.run()
+        assert len(packer.job_results) == 3
+        assert [job_result.status for job_result in packer.job_results] == ['success', 'success', 'invalid']
+        for span in spans[:6]:
+            values = crossing_results[f'culvert-{span}']
+            assert list(values['flow']) == [0.0, 50.0, 100.0, 150.0, 200.0]
+            assert list(values['headwater']) == pytest.approx([100.0 + span * 0.01 * flow
+                                                               for flow in values['flow']])
+        assert crossing_results['culvert-7'] is None
+        assert crossing_results['invalid'] is None
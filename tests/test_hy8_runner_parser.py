@@ -0,0 +1,119 @@
+"""Performs testing for hy8 runner file parser class."""
+# 1. Standard python modules
+import io
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_parser import Hy8RunnerFileParser
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerFileParser:
+    """A class that will test reading HY-8 files back into HY-8 Runner objects."""
+
+    test_dir = os.path.dirname(__file__)
+    hy8_dir = os.path.join(test_dir, 'files', 'hy8_test_files')
+
+    def create_hy8_runner(self):
+        """Create an HY-8 Runner with two crossings."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.project_title = 'Parser Project'
+        hy8_runner.designer_name = 'Designer'
+        hy8_runner.project_notes = 'First line\nSecond line'
+        hy8_runner.set_culvert_crossing_name('Main Street')
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_surface('gravel')
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_shape('box')
+        hy8_runner.set_culvert_barrel_span_and_rise(6, 5)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.set_culvert_barrel_number_of_barrels(2)
+        hy8_runner.add_culvert_barrel()
+        hy8_runner.set_culvert_barrel_name('Relief')
+        hy8_runner.set_culvert_barrel_material('corrugated steel')
+        hy8_runner.set_culvert_barrel_span_and_rise(3)
+        hy8_runner.set_culvert_barrel_site_data(10, 101, 50, 99)
+
+        hy8_runner.add_crossing()
+        hy8_runner.set_culvert_crossing_name('Oak Avenue')
+        hy8_runner.set_discharge_min_design_max_flow(10, 150, 300)
+        hy8_runner.set_tw_rating_curve(95, [[0, 95, 0], [100, 97, 3], [200, 99, 5]])
+        hy8_runner.set_roadway_width(30)
+        hy8_runner.set_constant_roadway(100, 105.5)
+        hy8_runner.set_culvert_barrel_span_and_rise(4)
+        hy8_runner.set_culvert_barrel_site_data(0, 96, 30, 95)
+        hy8_runner.crossings[1].uuid = '38fb71e5-255b-451c-b616-2e219d9f82ad'
+        return hy8_runner
+
+    def test_iter_crossings(self):
+        """Read the crossings of a multi-crossing file one at a time."""
+        hy8_runner = self.create_hy8_runner()
+        parser = Hy8RunnerFileParser()
+        crossings = parser.iter_crossings(io.StringIO(hy8_runner.to_hy8_string(project_date=1.0)))
+
+        crossing = next(crossings)
+        assert crossing.name == 'Main Street'
+        assert crossing.flow.method == 'user-defined'
+        assert crossing.flow.flow_list == [0.0, 50.0, 100.0, 150.0, 200.0]
+        assert crossing.tw_type == 6
+        assert crossing.tw_constant_elevation == 100
+        assert crossing.roadway_surface == 'gravel'
+        assert crossing.roadway_stations == [0, 100, 200]
+        assert crossing.roadway_elevations == [110, 112, 111]
+        assert 2 == len(crossing.culverts)
+        assert crossing.culverts[0].shape == 'box'
+        assert crossing.culverts[0].span == 6
+        assert crossing.culverts[0].rise == 5
+        assert crossing.culverts[0].number_of_barrels == 2
+        assert crossing.culverts[1].name == 'Relief'
+        assert crossing.culverts[1].material == 'corrugated steel'
+        assert crossing.culverts[1].outlet_invert_elevation == 99
+
+        crossing = next(crossings)
+        assert crossing.name == 'Oak Avenue'
+        assert crossing.flow.method == 'min-design-max'
+        assert crossing.flow.flow_design == 150
+        assert crossing.tw_type == 5
+        assert crossing.tw_rating_curve == [[0, 95, 0], [100, 97, 3], [200, 99, 5]]
+        assert crossing.uuid == '38fb71e5-255b-451c-b616-2e219d9f82ad'
+        assert next(crossings, None) is None
+
+        assert parser.num_crossings == 2
+        assert parser.project_title == 'Parser Project'
+        assert parser.project_notes == 'First line\nSecond line'
+
+    def test_round_trip(self):
+        """Write an HY-8 file, read it back, and write it again."""
+        hy8_runner = self.create_hy8_runner()
+        hy8_runner.si_units = True
+        hy8_text = hy8_runner.to_hy8_string(project_date=1.0)
+
+        read_runner = Hy8RunnerFileParser().read(io.StringIO(hy8_text), Hy8Runner())
+        assert read_runner.si_units is True
+        assert hy8_text == read_runner.to_hy8_string(project_date=1.0)
+
+    def test_from_hy8_file(self):
+        """Create an HY-8 Runner from an HY-8 file on disk."""
+        os.makedirs(self.hy8_dir, exist_ok=True)
+        hy8_file = os.path.join(self.hy8_dir, 'test_from_hy8_file.hy8')
+        hy8_runner = self.create_hy8_runner()
+        with open(hy8_file, 'w') as file:
+            file.write(hy8_runner.to_hy8_string())
+
+        read_runner = Hy8Runner.from_hy8_file(hy8_file)
+        assert read_runner.hy8_file == hy8_file
+        assert 2 == len(read_runner.crossings)
+        assert read_runner.designer_name == 'Designer'
+        assert read_runner.crossings[1].roadway_elevations == [105.5, 105.5]
@@ -0,0 +1,120 @@
+"""Performs testing for hy8 shard planner and cost model classes."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_packer import Hy8CrossingPacker
+from hy8runner.hy8_runner_planner import calibrate, Hy8RunnerCostModel, Hy8ShardPlanner
+from tests.hy8_stand_in import create_stand_in_hy8
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8ShardPlanner:
+    """A class that will test the HY-8 runtime model and the shard planner."""
+
+    test_dir = os.path.dirname(__file__)
+    planner_dir = os.path.join(test_dir, 'files', 'hy8_planner_files')
+
+    def create_crossings(self, flow_counts):
+        """Create valid crossings with the given numbers of flows."""
+        hy8_runner = Hy8Runner()
+        for index, num_flows in enumerate(flow_counts):
+            if index > 0:
+                hy8_runner.add_crossing()
+            hy8_runner.set_discharge_user_list_flow([10.0 * (flow + 1) for flow in range(num_flows)])
+            hy8_runner.set_tw_constant(98, 100)
+            hy8_runner.set_roadway_width(25)
+            hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+            hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+            hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        return hy8_runner.crossings
+
+    def test_fit(self):
+        """Recover the coefficients of timed runs."""
+        samples = [(crossings, flows, 0.5 + 0.02 * crossings + 0.003 * flows)
+                   for crossings in (1, 4, 16) for flows in (5 * crossings, 20 * crossings)]
+        cost_model = Hy8RunnerCostModel.fit(samples)
+        assert cost_model.startup == pytest.approx(0.5)
+        assert cost_model.per_crossing == pytest.approx(0.02)
+        assert cost_model.per_flow == pytest.approx(0.003)
+        assert cost_model.predict(10, 100) == pytest.approx(1.0)
+        assert cost_model.samples == samples
+
+        cost_model = Hy8RunnerCostModel.fit([(1, 5, 1.0), (1, 5, 1.2)])
+        assert cost_model.startup == pytest.approx(1.1, rel=0.1)
+        assert cost_model.per_crossing >= 0.0
+        assert cost_model.per_flow >= 0.0
+
+    def test_fit_non_negative(self):
+        """Refit the other coefficients when the least squares fit has a negative one."""
+        samples = [(crossings, flows, 0.5 + 0.01 * flows - 0.004 * crossings + noise)
+                   for crossings, flows, noise in ((1, 10, 0.01), (2, 15, -0.01), (4, 30, 0.0), (8, 45, 0.02),
+                                                   (16, 100, -0.02), (3, 50, 0.01))]
+        cost_model = Hy8RunnerCostModel.fit(samples)
+        assert cost_model.per_crossing == 0.0
+
+        # The same fit as leaving the crossings out of the model, not the least squares fit with per_crossing clamped
+        refit = Hy8RunnerCostModel.fit([(0, flows, seconds) for _, flows, seconds in samples])
+        assert cost_model.startup == pytest.approx(refit.startup)
+        assert cost_model.per_flow == pytest.approx(refit.per_flow)
+        assert cost_model.startup == pytest.approx(0.514)
+        assert cost_model.per_flow == pytest.approx(0.00916)
+
+    def test_plan(self):
+        """Use one shard per worker when startup dominates and balance uneven crossings."""
+        crossings = self.create_crossings([10] * 40)
+        planner = Hy8ShardPlanner(Hy8RunnerCostModel(startup=1.0, per_flow=0.01), num_workers=4)
+        shards = planner.plan(crossings)
+        assert len(shards) == 4
+        assert sorted([index for shard in shards for index in shard]) == list(range(40))
+        assert planner.predict_duration(crossings, shards) == pytest.approx(2.0)
+
+        planner.num_workers = 1
+        assert planner.plan(crossings) == [list(range(40))]
+
+        crossings = self.create_crossings([100, 10, 10, 10, 10, 10, 10, 10, 10, 10])
+        planner = Hy8ShardPlanner(Hy8RunnerCostModel(startup=0.1, per_flow=0.01), num_workers=2)
+        shards = planner.plan(crossings)
+        assert shards[0] == [0]
+        assert planner.predict_duration(crossings, shards) == pytest.approx(1.1)
+
+        planner.max_shard_size = 3
+        shards = planner.plan(crossings)
+        assert max([len(shard) for shard in shards]) <= 3
+        assert sorted([index for shard in shards for index in shard]) == list(range(10))
+        assert planner.plan([]) == []
+
+    def test_calibrate(self):
+        """Fit a cost model to timed runs of a stand-in HY-8 and run the planned shards."""
+        hy8_exe_dir = os.path.join(self.planner_dir, 'test_calibrate_exe')
+        create_stand_in_hy8(hy8_exe_dir, flow_time=0.01)
+        work_dir = os.path.join(self.planner_dir, 'test_calibrate')
+        os.makedirs(work_dir, exist_ok=True)
+        project_file = os.path.join(work_dir, 'project.hy8')
+        with open(project_file, 'w') as file:
+            file.write('HY8PROJECTFILE80.0\n')
+        cost_model = calibrate(hy8_exe_dir, work_dir, crossing_counts=(1, 4), flow_counts=(5, 20))
+        assert len(cost_model.samples) == 4
+        assert cost_model.per_flow == pytest.approx(0.01, abs=0.005)
+        assert os.listdir(work_dir) == ['project.hy8']  # only the files of calibrate are removed
+
+        crossings = self.create_crossings([5] * 6)
+        packer = Hy8CrossingPacker(os.path.join(self.planner_dir, 'test_calibrate_pack'), hy8_exe_path=hy8_exe_dir,
+                                   max_workers=2)
+        for crossing in crossings:
+            packer.add_crossing(crossing)
+        packer.shards = Hy8ShardPlanner(cost_model, num_workers=2).plan(crossings)
+        crossing_results = packer.run()
+        assert len(packer.job_results) == len(packer.shards)
+        assert all([values is not None for values in crossing_results.values()])
@@ -0,0 +1,104 @@
+"""Performs testing for hy8 runner plot data class."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_plot import Hy8RunnerPlotData
+from tests.hy8_captured import get_captured_crossings, get_captured_file
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+PLT_TEXT = '''HY8PLOTFILE
+STARTCROSSING "Crossing 1"
+STARTDISCHARGE 0.0
+SERIES "Water Surface"
+0.0 100.0
+40.0 98.0
+ENDDISCHARGE
+STARTDISCHARGE 100.0
+SERIES "Water Surface"
+0.0 103.5
+40.0 100.5
+SERIES "Culvert Invert"
+0.0 100.0 1.0
+40.0 98.0 1.0
+ENDDISCHARGE
+ENDCROSSING
+STARTCROSSING "Crossing 2"
+STARTDISCHARGE 25.5
+SERIES "Water Surface"
+0.0 90.0
+ENDDISCHARGE
+ENDCROSSING
+'''
+
+
+class TestHy8RunnerPlotData:
+    """A class that will test random access to plt plot data."""
+
+    test_dir = os.path.dirname(__file__)
+    results_dir = os.path.join(test_dir, 'files', 'hy8_results_files')
+
+    def write_plt_file(self, basename):
+        """Write a plt file for the tests."""
+        os.makedirs(self.results_dir, exist_ok=True)
+        plt_file = os.path.join(self.results_dir, basename)
+        with open(plt_file, 'w') as file:
+            file.write(PLT_TEXT)
+        return plt_file
+
+    def test_index(self):
+        """Index the crossings and discharges of a plt file."""
+        plt_file = self.write_plt_file('test_index.plt')
+        with Hy8RunnerPlotData(plt_file) as plot_data:
+            assert plot_data.crossing_names == ['Crossing 1', 'Crossing 2']
+            assert plot_data.discharges(0) == [0.0, 100.0]
+            assert plot_data.discharges(1) == [25.5]
+            assert list(plot_data.block_crossing) == [0, 0, 1]
+
+    def test_read_discharge(self):
+        """Read the series of a single discharge."""
+        plt_file = self.write_plt_file('test_read_discharge.plt')
+        with Hy8RunnerPlotData(plt_file) as plot_data:
+            series = plot_data.read_discharge(0, 1)
+            assert list(series) == ['Water Surface', 'Culvert Invert']
+            stations, elevations = series['Water Surface']
+            assert list(stations) == [0.0, 40.0]
+            assert list(elevations) == [103.5, 100.5]
+            assert 3 == len(series['Culvert Invert'])
+
+            series = plot_data.read_discharge(1, 0)
+            assert list(series['Water Surface'][1]) == [90.0]
+
+            with pytest.raises(KeyError):
+                plot_data.read_discharge(1, 1)
+
+    def test_hy8_runner_read_plot_data(self):
+        """Open the plt file next to the HY-8 file of an HY-8 Runner."""
+        self.write_plt_file('test_hy8_runner_read_plot_data.plt')
+        hy8_runner = Hy8Runner(hy8_file=os.path.join(self.results_dir, 'test_hy8_runner_read_plot_data.hy8'))
+        with hy8_runner.read_plot_data() as plot_data:
+            assert 2 == plot_data.num_crossings
+            assert list(plot_data.read_discharge(0, 0)['Water Surface'][0]) == [0.0, 40.0]
+
+    def test_read_captured(self):
+        """Index the plt file of a real HY-8 run: one discharge block per flow, each with a plot series."""
+        crossings = get_captured_crossings()
+        with Hy8RunnerPlotData(get_captured_file('.plt')) as plot_data:
+            assert plot_data.crossing_names == [crossing.name for crossing in crossings]
+            for index, crossing in enumerate(crossings):
+                assert plot_data.discharges(index) == crossing.flow.flow_list
+                for discharge_index in range(len(crossing.flow.flow_list)):
+                    series = plot_data.read_discharge(index, discharge_index)
+                    assert series and '' not in series
+                    assert all([len(columns) >= 2 and len(columns[0]) > 0 for columns in series.values()])
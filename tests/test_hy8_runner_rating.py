@@ -0,0 +1,119 @@
+"""Performs testing for hy8 rating grid class."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+
+np = pytest.importorskip('numpy')
+from hy8runner.hy8_runner_rating import Hy8RatingGrid  # noqa: E402
+from tests.hy8_stand_in import create_stand_in_hy8  # noqa: E402
+from tests.hy8_captured import get_captured_crossings, get_captured_file  # noqa: E402
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RatingGrid:
+    """A class that will test querying rating tables without running HY-8."""
+
+    test_dir = os.path.dirname(__file__)
+    rating_dir = os.path.join(test_dir, 'files', 'hy8_rating_files')
+
+    def write_table(self, file_name):
+        """Write a flow-tailwater table whose headwater is 100 + 0.02 * flow + 0.5 * (tailwater - 98)."""
+        os.makedirs(self.rating_dir, exist_ok=True)
+        table_file = os.path.join(self.rating_dir, file_name)
+        with open(table_file, 'w') as file:
+            file.write('Flow Tailwater Headwater\n')
+            for flow in range(0, 101, 50):
+                for tailwater in (98.0, 99.0, 100.0):
+                    file.write(f'{float(flow)} {tailwater} {100.0 + 0.02 * flow + 0.5 * (tailwater - 98.0)}\n')
+        return table_file
+
+    def test_headwater_grid(self):
+        """Interpolate headwater by flow and tailwater, flagging points off the grid."""
+        grid = Hy8RatingGrid.read_table(self.write_table('flow_tw.table'))
+        assert list(grid.x) == [0.0, 50.0, 100.0]
+        assert list(grid.y) == [98.0, 99.0, 100.0]
+
+        headwater, out_of_range = grid.interpolate([25.0, 100.0, 75.0, 120.0, 10.0], [98.5, 100.0, 99.25, 99.0, 97.0])
+        assert headwater[:3] == pytest.approx([100.75, 103.0, 102.125])
+        assert np.isnan(headwater[3]) and np.isnan(headwater[4])
+        assert list(out_of_range) == [False, False, False, True, True]
+
+        headwater, out_of_range = grid.interpolate(np.array([120.0]), 99.0, clamp=True)
+        assert headwater[0] == pytest.approx(102.5)
+        assert out_of_range[0]
+
+    def test_flow_grid(self):
+        """Interpolate flow by headwater and tailwater from curves with different points."""
+        grid = Hy8RatingGrid.read_table(self.write_table('hw_tw.table'), 'flow')
+        flow, out_of_range = grid.interpolate([101.0, 101.5, 100.0, 103.0], [98.0, 98.5, 99.0, 100.0])
+        assert flow[:2] == pytest.approx([50.0, 62.5])
+        assert list(out_of_range) == [False, False, True, False]
+        assert flow[3] == pytest.approx(100.0)
+
+    def test_memory_mapped(self):
+        """Save a grid and query it memory-mapped."""
+        grid = Hy8RatingGrid.read_table(self.write_table('saved.table'))
+        grid.save(os.path.join(self.rating_dir, 'saved_grid'))
+        loaded = Hy8RatingGrid.load(os.path.join(self.rating_dir, 'saved_grid'))
+        assert isinstance(loaded.values, np.memmap)
+        assert loaded.value_name == 'headwater'
+
+        random = np.random.default_rng(0)
+        flows = random.uniform(-10.0, 110.0, 1000)
+        tailwaters = random.uniform(97.5, 100.5, 1000)
+        headwater, out_of_range = loaded.interpolate(flows, tailwaters)
+        expected = 100.0 + 0.02 * flows + 0.5 * (tailwaters - 98.0)
+        inside = (flows >= 0.0) & (flows <= 100.0) & (tailwaters >= 98.0) & (tailwaters <= 100.0)
+        assert np.array_equal(out_of_range, ~inside)
+        assert headwater[inside] == pytest.approx(expected[inside])
+
+    def test_invalid_grid(self):
+        """Reject grids whose values do not match their axes."""
+        with pytest.raises(ValueError):
+            Hy8RatingGrid([0.0, 1.0], [98.0], [[1.0, 2.0]])
+        with pytest.raises(ValueError):
+            Hy8RatingGrid([1.0, 0.0], [98.0], [[1.0], [2.0]])
+        with pytest.raises(ValueError):
+            Hy8RatingGrid([0.0], [98.0], [[1.0]], 'velocity')
+
+    def test_read_rating_grid(self):
+        """Read the table built by HY-8 through the runner."""
+        hy8_exe_dir = os.path.join(self.rating_dir, 'test_read_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        hy8_runner = Hy8Runner(hy8_exe_dir, os.path.join(self.rating_dir, 'test_read_rating_grid.hy8'))
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.create_hy8_file()
+        assert hy8_runner.run_build_flow_tw_table().succeeded
+
+        headwater, out_of_range = hy8_runner.read_rating_grid().interpolate(75.0, 98.5)
+        assert headwater == pytest.approx(101.75)
+        assert not out_of_range
+
+    def test_read_captured(self):
+        """Read the flow-tailwater table of a real HY-8 run into a headwater grid that covers the project flows."""
+        crossing = get_captured_crossings()[0]
+        grid = Hy8RatingGrid.read_table(get_captured_file('.table'))
+        assert grid.value_name == 'headwater'
+        assert grid.x[0] <= min(crossing.flow.flow_list)
+        assert grid.x[-1] >= max(crossing.flow.flow_list)
+        assert len(grid.y) > 1
+        inlet_invert = crossing.culverts[0].inlet_invert_elevation
+        assert not np.all(np.isnan(grid.values))
+        assert np.all(np.isnan(grid.values) | (grid.values >= inlet_invert))
@@ -0,0 +1,122 @@
+"""Performs testing for hy8 runner results reader class."""
+# 1. Standard python modules
+import math
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_results import Hy8RunnerResultsReader
+from tests.hy8_captured import get_captured_crossings, get_captured_file
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+RST_TEXT = '''HY8RESULTSFILE
+STARTCROSSING "Crossing 1"
+DISCHARGE 0.0 100.0 200.0
+HEADWATERELEVATION 100.0 103.5 106.25
+TAILWATERELEVATION 98.0 100.0 100.0
+CONTROLTYPE "N/A" "Inlet Control" "Outlet Control"
+OUTLETVELOCITY 0.0 5.5 7.25
+OVERTOPPINGFLOW 0.0 0.0 12.5
+ENDCROSSING
+STARTCROSSING "Crossing 2"
+DISCHARGE 10.0
+DISCHARGE 20.0
+HEADWATERELEVATION 90.5
+HEADWATERELEVATION 91.5
+CONTROLTYPE "Inlet Control"
+CONTROLTYPE "Inlet Control"
+ENDCROSSING
+'''
+
+
+class TestHy8RunnerResultsReader:
+    """A class that will test reading HY-8 rst results into columns."""
+
+    test_dir = os.path.dirname(__file__)
+    results_dir = os.path.join(test_dir, 'files', 'hy8_results_files')
+
+    def write_rst_file(self, basename):
+        """Write an rst file for the tests."""
+        os.makedirs(self.results_dir, exist_ok=True)
+        rst_file = os.path.join(self.results_dir, basename)
+        with open(rst_file, 'w') as file:
+            file.write(RST_TEXT)
+        return rst_file
+
+    def test_read(self):
+        """Read an rst file into columns."""
+        rst_file = self.write_rst_file('test_read.rst')
+        results = Hy8RunnerResultsReader().read(rst_file)
+
+        assert 5 == len(results)
+        assert 2 == results.num_crossings
+        assert results.crossing_names == ['Crossing 1', 'Crossing 2']
+        assert list(results.crossing) == [0, 0, 0, 1, 1]
+        assert list(results.flow) == [0.0, 100.0, 200.0, 10.0, 20.0]
+        assert list(results.column('headwater')) == [100.0, 103.5, 106.25, 90.5, 91.5]
+        assert list(results.overtopping_flow[:3]) == [0.0, 0.0, 12.5]
+        assert math.isnan(results.tailwater[3])
+        assert results.control_types == ['N/A', 'Inlet Control', 'Outlet Control']
+        assert list(results.control) == [0, 1, 2, 1, 1]
+        assert list(results.crossing_rows(1)) == [3, 4]
+
+        crossing = results.get_crossing(0)
+        assert list(crossing['outlet_velocity']) == [0.0, 5.5, 7.25]
+        assert crossing['control'] == ['N/A', 'Inlet Control', 'Outlet Control']
+
+    def test_read_directory(self):
+        """Read a directory of rst files into one table."""
+        first_file = self.write_rst_file('test_read_directory_1.rst')
+        second_file = self.write_rst_file('test_read_directory_2.rst')
+        results = Hy8RunnerResultsReader().read_directory(self.results_dir, 'test_read_directory_*.rst')
+
+        assert results.sources == [first_file, second_file]
+        assert 10 == len(results)
+        assert 4 == results.num_crossings
+        assert list(results.source) == [0] * 5 + [1] * 5
+        assert list(results.crossing_offsets) == [0, 3, 5, 8, 10]
+        assert list(results.control[5:]) == [0, 1, 2, 1, 1]
+
+    def test_extend(self):
+        """Concatenate two results tables."""
+        rst_file = self.write_rst_file('test_extend.rst')
+        reader = Hy8RunnerResultsReader()
+        results = reader.read(rst_file)
+        other = reader.read(rst_file)
+        other.control_types[0] = 'Entrance Control'
+        results.extend(other)
+
+        assert 10 == len(results)
+        assert results.control_types == ['N/A', 'Inlet Control', 'Outlet Control', 'Entrance Control']
+        assert list(results.control[5:]) == [3, 1, 2, 1, 1]
+        assert list(results.source) == [0] * 5 + [1] * 5
+        assert results.get_crossing(2)['control'][0] == 'Entrance Control'
+
+    def test_hy8_runner_read_results(self):
+        """Read the rst file next to the HY-8 file of an HY-8 Runner."""
+        self.write_rst_file('test_hy8_runner_read_results.rst')
+        hy8_runner = Hy8Runner(hy8_file=os.path.join(self.results_dir, 'test_hy8_runner_read_results.hy8'))
+        results = hy8_runner.read_results()
+        assert 5 == len(results)
+
+    def test_read_captured(self):
+        """Read the rst file of a real HY-8 run: every result card is found, with one value per flow."""
+        results = Hy8RunnerResultsReader().read(get_captured_file('.rst'))
+        crossings = get_captured_crossings()
+
+        assert results.crossing_names == [crossing.name for crossing in crossings]
+        for index, crossing in enumerate(crossings):
+            values = results.get_crossing(index)
+            assert list(values['flow']) == crossing.flow.flow_list
+            for name in results.float_columns:
+                assert not any([math.isnan(value) for value in values[name]]), name
+            assert '' not in values['control']
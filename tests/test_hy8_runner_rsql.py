@@ -0,0 +1,101 @@
+"""Performs testing for hy8 runner rsql reader class."""
+# 1. Standard python modules
+import math
+import os
+import sqlite3
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_rsql import Hy8RunnerRsqlReader
+from tests.hy8_captured import get_captured_crossings, get_captured_file
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerRsqlReader:
+    """A class that will test reading columns from the rsql results database."""
+
+    test_dir = os.path.dirname(__file__)
+    results_dir = os.path.join(test_dir, 'files', 'hy8_results_files')
+
+    def write_rsql_file(self, basename):
+        """Write an rsql file with 3 crossings and 4 flows."""
+        os.makedirs(self.results_dir, exist_ok=True)
+        rsql_file = os.path.join(self.results_dir, basename)
+        if os.path.exists(rsql_file):
+            os.remove(rsql_file)
+        connection = sqlite3.connect(rsql_file)
+        connection.execute('CREATE TABLE Results (CrossingIndex INTEGER, FlowIndex INTEGER, Flow REAL, '
+                           'Freeboard REAL, ControlType TEXT)')
+        rows = [(crossing, flow, 50.0 * flow, 10.0 - crossing - 0.5 * flow, 'Inlet Control')
+                for crossing in range(3) for flow in range(4)]
+        rows[0] = (0, 0, 0.0, None, 'N/A')
+        connection.executemany('INSERT INTO Results VALUES (?, ?, ?, ?, ?)', rows)
+        connection.commit()
+        connection.close()
+        return rsql_file
+
+    def test_read(self):
+        """Read selected columns for selected crossings and flows."""
+        rsql_file = self.write_rsql_file('test_read.rsql')
+        with Hy8RunnerRsqlReader(rsql_file) as reader:
+            assert reader.tables() == ['Results']
+            assert 'Freeboard' in reader.columns()
+
+            values = reader.read(['Freeboard'], crossings=[2, 1], flows=[3])
+            assert list(values) == ['CrossingIndex', 'FlowIndex', 'Freeboard']
+            assert list(values['CrossingIndex']) == [1, 2]
+            assert list(values['FlowIndex']) == [3, 3]
+            assert list(values['Freeboard']) == [7.5, 6.5]
+            assert values['Freeboard'].typecode == 'd'
+
+            values = reader.read(['Freeboard', 'ControlType'], crossings=[0])
+            assert 4 == len(values['Freeboard'])
+            assert math.isnan(values['Freeboard'][0])
+            assert values['ControlType'][:2] == ['N/A', 'Inlet Control']
+
+            values = reader.read(['Flow'])
+            assert 12 == len(values['Flow'])
+
+            with pytest.raises(KeyError):
+                reader.read(['Freeboard; DROP TABLE Results'])
+            with pytest.raises(PermissionError):
+                reader.create_index()
+
+    def test_create_index(self):
+        """Create an index on the crossing and flow columns."""
+        rsql_file = self.write_rsql_file('test_create_index.rsql')
+        with Hy8RunnerRsqlReader(rsql_file, read_only=False) as reader:
+            reader.create_index()
+            plan = reader.connection.execute(
+                'EXPLAIN QUERY PLAN SELECT Freeboard FROM Results WHERE CrossingIndex = 1').fetchall()
+            assert 'idx_Results_CrossingIndex_FlowIndex' in str(plan)
+
+    def test_hy8_runner_read_rsql(self):
+        """Read the rsql file next to the HY-8 file of an HY-8 Runner."""
+        self.write_rsql_file('test_hy8_runner_read_rsql.rsql')
+        hy8_runner = Hy8Runner(hy8_file=os.path.join(self.results_dir, 'test_hy8_runner_read_rsql.hy8'))
+        values = hy8_runner.read_rsql(['Freeboard'], flows=[1])
+        assert list(values['Freeboard']) == [9.5, 8.5, 7.5]
+
+    def test_read_captured(self):
+        """Read the rsql file of a real HY-8 run with the default table and key columns."""
+        crossings = get_captured_crossings()
+        with Hy8RunnerRsqlReader(get_captured_file('.rsql')) as reader:
+            assert reader.table in reader.tables()
+            values = reader.read([])
+
+        assert sorted(set(values['CrossingIndex'])) == list(range(len(crossings)))
+        for index, crossing in enumerate(crossings):
+            flows = [flow for crossing_index, flow in zip(values['CrossingIndex'], values['FlowIndex'])
+                     if crossing_index == index]
+            assert flows == list(range(len(crossing.flow.flow_list)))
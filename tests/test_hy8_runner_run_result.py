@@ -0,0 +1,179 @@
+"""Performs testing for hy8 runner run results, timeouts and retries."""
+# 1. Standard python modules
+import asyncio
+import os
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_batch import Hy8BatchRunner
+from hy8runner.hy8_runner_run_result import (get_output_suffix, Hy8RunnerRetryPolicy, Hy8RunnerRunResult,
+                                             snapshot_output_files)
+from tests.hy8_stand_in import create_stand_in_hy8
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerRetryPolicy:
+    """A class that will test when failed runs are tried again."""
+
+    def test_should_retry(self):
+        """Retry failed and timed out runs until the attempts are used up."""
+        retry_policy = Hy8RunnerRetryPolicy(max_attempts=3, delay=0.5, backoff=2.0, retry_returncodes=[1])
+        run_result = Hy8RunnerRunResult(['HY864.exe'])
+        run_result.attempts = 1
+        run_result.returncode = 1
+        assert retry_policy.should_retry(run_result)
+        run_result.returncode = 2
+        assert not retry_policy.should_retry(run_result)
+        run_result.returncode = None
+        run_result.timed_out = True
+        assert retry_policy.should_retry(run_result)
+        run_result.attempts = 3
+        assert not retry_policy.should_retry(run_result)
+        run_result.attempts = 1
+        run_result.timed_out = False
+        run_result.returncode = 0
+        assert not retry_policy.should_retry(run_result)
+        assert [retry_policy.get_delay(attempt) for attempt in (1, 2, 3)] == [0.5, 1.0, 2.0]
+
+    def test_status(self):
+        """Report the status of a run."""
+        run_result = Hy8RunnerRunResult(['HY864.exe'])
+        run_result.returncode = 0
+        assert run_result.status == 'success'
+        run_result.returncode = 1
+        assert run_result.status == 'failed'
+        run_result.timed_out = True
+        assert run_result.status == 'timeout'
+        run_result.error = 'No such file'
+        assert run_result.status == 'error'
+
+
+class TestHy8RunnerRunResult:
+    """A class that will test the results of running a stand-in HY-8 executable."""
+
+    test_dir = os.path.dirname(__file__)
+    run_dir = os.path.join(test_dir, 'files', 'hy8_run_result_files')
+
+    def create_hy8_runner(self, hy8_exe_dir, basename):
+        """Create and write a valid HY-8 Runner."""
+        hy8_runner = Hy8Runner(hy8_exe_dir, os.path.join(self.run_dir, basename))
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.create_hy8_file()
+        return hy8_runner
+
+    def test_run_open_save(self):
+        """Capture the output and list the output files of a run."""
+        hy8_exe_dir = os.path.join(self.run_dir, 'test_run_open_save_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_open_save.hy8')
+
+        run_result = hy8_runner.run_open_save()
+        assert run_result.succeeded
+        assert run_result.status == 'success'
+        assert run_result.attempts == 1
+        assert run_result.elapsed > 0.0
+        assert 'HY-8 stand-in -OpenRunSave' in run_result.stdout
+        assert run_result.stderr == ''
+        assert [os.path.splitext(output_file)[1] for output_file in run_result.output_files] == \
+            ['.plt', '.rsql', '.rst']
+
+    def test_projects_sharing_a_name_prefix(self):
+        """List only the output files of each project when job_1 and job_10 run in one directory."""
+        hy8_exe_dir = os.path.join(self.run_dir, 'test_prefix_exe')
+        create_stand_in_hy8(hy8_exe_dir, startup=0.2)
+        hy8_runners = [self.create_hy8_runner(hy8_exe_dir, f'job_{number}.hy8') for number in (1, 10)]
+        job_results = Hy8BatchRunner(hy8_runners, 'OpenRunSave', max_workers=2).run()
+        for job_result, hy8_runner in zip(job_results, hy8_runners):
+            stem = os.path.splitext(hy8_runner.hy8_file)[0]
+            assert job_result.run_result.output_files == [stem + '.plt', stem + '.rsql', stem + '.rst']
+
+        job_1_file = hy8_runners[0].hy8_file
+        stem = os.path.splitext(job_1_file)[0]
+        assert sorted(snapshot_output_files(job_1_file)) == [stem + '.plt', stem + '.rsql', stem + '.rst']
+        assert get_output_suffix(stem + '.rst', job_1_file) == '.rst'
+        assert get_output_suffix(stem + '--Culvert0--WaterProfile0.bmp', job_1_file) == '--Culvert0--WaterProfile0.bmp'
+        assert get_output_suffix(stem + '0.rst', job_1_file) is None
+        assert get_output_suffix(stem + '.txt', job_1_file) is None
+
+    def test_run_failed(self):
+        """Capture the error output of a failed run."""
+        hy8_exe_dir = os.path.join(self.run_dir, 'test_run_failed_exe')
+        create_stand_in_hy8(hy8_exe_dir, returncode=4)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_failed.hy8')
+
+        run_result = hy8_runner.run_build_full_report()
+        assert run_result.status == 'failed'
+        assert run_result.returncode == 4
+        assert 'stand-in failure' in run_result.stderr
+        assert run_result.output_files == []
+
+    def test_run_timeout(self):
+        """Kill a run that takes longer than the timeout."""
+        hy8_exe_dir = os.path.join(self.run_dir, 'test_run_timeout_exe')
+        create_stand_in_hy8(hy8_exe_dir, startup=5.0)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_timeout.hy8')
+
+        run_result = hy8_runner.run_open_save(timeout=0.5)
+        assert run_result.timed_out
+        assert run_result.status == 'timeout'
+        assert run_result.returncode is None
+        assert run_result.elapsed < 5.0
+
+        run_result = asyncio.run(hy8_runner.run_open_save_async(timeout=0.5))
+        assert run_result.status == 'timeout'
+        assert run_result.elapsed < 5.0
+
+    def test_run_retry(self):
+        """Retry transient failures until HY-8 succeeds."""
+        hy8_exe_dir = os.path.join(self.run_dir, 'test_run_retry_exe')
+        create_stand_in_hy8(hy8_exe_dir, fail_count=2)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_retry.hy8')
+        hy8_runner.retry_policy = Hy8RunnerRetryPolicy(max_attempts=3, delay=0.01)
+
+        run_result = hy8_runner.run_open_save()
+        assert run_result.succeeded
+        assert run_result.attempts == 3
+
+        create_stand_in_hy8(hy8_exe_dir, fail_count=2)
+        hy8_runner.retry_policy = Hy8RunnerRetryPolicy(max_attempts=2)
+        run_result = asyncio.run(hy8_runner.run_open_save_async())
+        assert run_result.status == 'failed'
+        assert run_result.attempts == 2
+        assert 'transient failure' in run_result.stderr
+
+    def test_run_missing_executable(self):
+        """Report an executable that cannot be started."""
+        hy8_runner = self.create_hy8_runner(os.path.join(self.run_dir, 'missing'), 'test_run_missing.hy8')
+        run_result = hy8_runner.run_open_save()
+        assert run_result.status == 'error'
+        assert run_result.error
+        assert asyncio.run(hy8_runner.run_open_save_async()).status == 'error'
+
+    def test_batch_timeout_and_retry(self):
+        """Pass the timeout and retry policy of a batch to each run."""
+        hy8_exe_dir = os.path.join(self.run_dir, 'test_batch_exe')
+        create_stand_in_hy8(hy8_exe_dir, fail_count=1)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_batch.hy8')
+        job_results = Hy8BatchRunner([hy8_runner], 'OpenRunSave', timeout=10.0,
+                                     retry_policy=Hy8RunnerRetryPolicy(max_attempts=2)).run()
+        assert job_results[0].status == 'success'
+        assert job_results[0].run_result.attempts == 2
+
+        create_stand_in_hy8(hy8_exe_dir, startup=5.0)
+        job_results = asyncio.run(Hy8BatchRunner([hy8_runner], 'OpenRunSave', timeout=0.5).run_async())
+        assert job_results[0].status == 'timeout'
+        assert job_results[0].returncode is None
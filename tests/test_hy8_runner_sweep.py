@@ -0,0 +1,96 @@
+"""Performs testing for hy8 parameter sweep class."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from tests.hy8_stand_in import create_stand_in_hy8
+from hy8runner.hy8_runner_sweep import Hy8RunnerSweep
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerSweep:
+    """A class that will test sweeping culvert parameters."""
+
+    test_dir = os.path.dirname(__file__)
+    sweep_dir = os.path.join(test_dir, 'files', 'hy8_sweep_files')
+
+    def create_base_crossing(self):
+        """Create a valid crossing to sweep."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        return hy8_runner.crossings[0]
+
+    def test_cartesian(self):
+        """Generate every combination of the parameter values lazily."""
+        base_crossing = self.create_base_crossing()
+        sweep = Hy8RunnerSweep(base_crossing, {'span': [3, 4, 5], 'material': ['concrete', 'corrugated steel']})
+        assert len(sweep) == 6
+        assert sweep.categorical_names == ['material']
+        designs = sweep.iter_designs()
+        assert next(designs) == (3, 'concrete')
+        assert next(designs) == (3, 'corrugated steel')
+
+        design_index, values, crossing = list(sweep.iter_crossings())[5]
+        assert design_index == 5
+        assert values == (5, 'corrugated steel')
+        assert crossing.culverts[0].material == 'corrugated steel'
+        assert crossing.culverts[0].rise == 4
+        assert base_crossing.culverts[0].material == 'concrete'
+
+        with pytest.raises(ValueError):
+            Hy8RunnerSweep(base_crossing, {'diameter': [3]})
+        with pytest.raises(ValueError):
+            Hy8RunnerSweep(base_crossing, {'span': (3, 5)}, design='latin-hypercube')
+
+    def test_latin_hypercube(self):
+        """Sample each range once per stratum, repeatably for a seed."""
+        sweep = Hy8RunnerSweep(self.create_base_crossing(),
+                               {'span': (2.0, 6.0), 'number_of_barrels': (1, 4), 'material': ['concrete', 'steel']},
+                               design='latin-hypercube', num_samples=8, seed=7)
+        designs = list(sweep.iter_designs())
+        assert designs == list(sweep.iter_designs())
+        assert len(designs) == 8
+        spans = sorted([values[0] for values in designs])
+        for stratum, span in enumerate(spans):
+            assert 2.0 + 0.5 * stratum <= span < 2.0 + 0.5 * (stratum + 1)
+        assert sorted([values[1] for values in designs]) == [1, 1, 2, 2, 3, 3, 4, 4]
+        assert sorted([values[2] for values in designs]) == ['concrete'] * 4 + ['steel'] * 4
+
+    def test_run(self):
+        """Run the variants packed into projects and index the results by parameter values."""
+        hy8_exe_dir = os.path.join(self.sweep_dir, 'test_run_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        sweep = Hy8RunnerSweep(self.create_base_crossing(), {'span': [3.0, 4.0, 5.0],
+                                                             'material': ['concrete', 'corrugated steel'],
+                                                             'inlet_invert_elevation': [100.0, 101.0]})
+        sweep_results = sweep.run(os.path.join(self.sweep_dir, 'test_run'), hy8_exe_dir, pack_size=4, max_workers=2,
+                                  chunk_size=5)
+        assert len(sweep_results) == 12
+        assert len(sweep_results.failed) == 0
+        assert list(sweep_results.design_index) == list(range(12))
+
+        positions = sweep_results.find(span=4.0, inlet_invert_elevation=101.0)
+        assert [sweep_results.get_value('material', position) for position in positions] == \
+            ['concrete', 'corrugated steel']
+        variant = sweep_results.get_variant(positions[0])
+        assert list(variant['headwater']) == pytest.approx([101.0 + 4.0 * 0.01 * flow for flow in variant['flow']])
+
+        assert len(sweep_results.column('span')) == len(sweep_results.column('headwater')) == 12 * 5
+        assert sweep_results.column('material')[:11] == ['concrete'] * 10 + ['corrugated steel']
+        assert list(sweep_results.column('design_index')[5:10]) == [1] * 5
@@ -0,0 +1,149 @@
+"""Performs testing for hy8 crossing table class."""
+# 1. Standard python modules
+import os
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_config import Hy8RunnerConfig
+from hy8runner.hy8_runner_table import Hy8CrossingTable
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8CrossingTable:
+    """A class that will test the columnar crossing table."""
+
+    test_dir = os.path.dirname(__file__)
+    table_dir = os.path.join(test_dir, 'files', 'hy8_table_files')
+
+    def create_project(self):
+        """Create a project whose crossings use each flow method, a rating curve, and several culverts."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.project_title = 'Table'
+        hy8_runner.set_discharge_min_design_max_flow(0.0, 50.0, 100.0)
+        hy8_runner.set_tw_constant(98.0, 100.0)
+        hy8_runner.set_roadway_width(25.0)
+        hy8_runner.set_roadway_stations_and_elevations([0.0, 100.0, 200.0], [110.0, 112.0, 111.0])
+        hy8_runner.set_culvert_barrel_span_and_rise(5.0, 4.0)
+        hy8_runner.set_culvert_barrel_site_data(0.0, 100.0, 40.0, 98.0)
+        hy8_runner.add_culvert_barrel()
+        hy8_runner.set_culvert_barrel_shape('box')
+        hy8_runner.set_culvert_barrel_span_and_rise(6.0, 3.0)
+        hy8_runner.set_culvert_barrel_number_of_barrels(2)
+
+        hy8_runner.add_crossing()
+        hy8_runner.set_discharge_min_max_inc_flow(0.0, 1.0, 0.1)
+        hy8_runner.set_tw_rating_curve(97.0, [[0.0, 97.0, 0.0], [100.0, 99.5, 2.5]])
+        hy8_runner.set_roadway_surface('gravel')
+        hy8_runner.set_constant_roadway(150.0, 112.0)
+        hy8_runner.set_culvert_barrel_material('corrugated steel')
+        hy8_runner.set_culvert_barrel_span_and_rise(3.0, 3.0)
+        hy8_runner.crossings[-1].uuid = '38fb71e5-255b-451c-b616-2e219d9f82ad'
+
+        hy8_runner.add_crossing()
+        hy8_runner.set_discharge_user_list_flow([5.0, 15.0, 45.0])
+        hy8_runner.set_tw_trapezoidal(4.0, 2.0, 0.01, 0.03, 96.0)
+        hy8_runner.set_roadway_stations_and_elevations([0.0, 60.0], [108.0, 109.0])
+        hy8_runner.set_culvert_barrel_span_and_rise(2.0, 2.0)
+        return hy8_runner
+
+    def test_from_crossings(self):
+        """Import crossing objects into columns."""
+        hy8_runner = self.create_project()
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+
+        assert len(table) == 3
+        assert table.num_culverts == 4
+        assert list(table.offsets['culverts']) == [0, 2, 3, 4]
+        assert list(table.roadway_width) == [25.0, 0.0, 0.0]
+        assert list(table.span) == [5.0, 6.0, 3.0, 2.0]
+        assert list(table.number_of_barrels) == [1, 2, 1, 1]
+        assert [table.levels['shape'][code] for code in table.shape] == ['circle', 'box', 'circle', 'circle']
+        assert list(table.rating_elevation[table.get_slice('rating_elevation', 1)]) == [97.0, 99.5]
+        assert list(table.flows[table.get_slice('flows', 2)]) == [5.0, 15.0, 45.0]
+        assert table.get_flows(0) == [0.0, 50.0, 100.0]
+        assert len(table.get_flows(1)) == 11
+        assert table.column('tw_type')[2] == 2
+        with pytest.raises(KeyError):
+            table.column('diameter')
+
+    def test_to_crossings(self):
+        """Export the columns back to crossing objects that write the same text."""
+        hy8_runner = self.create_project()
+        expected = hy8_runner.to_hy8_string(project_date=1.0)
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+
+        hy8_runner.crossings = table.to_crossings()
+        assert hy8_runner.crossings[1].tw_rating_curve == [[0.0, 97.0, 0.0], [100.0, 99.5, 2.5]]
+        assert hy8_runner.crossings[0].culverts[1].shape == 'box'
+        assert hy8_runner.to_hy8_string(project_date=1.0) == expected
+
+    def test_iter_hy8_strings(self):
+        """Stream the same HY-8 text as the object model, one crossing block at a time."""
+        hy8_runner = self.create_project()
+        hy8_runner.si_units = True
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+
+        chunks = list(table.iter_hy8_strings(hy8_runner.config, project_title='Table', project_date=1.0))
+        assert len(chunks) == 5
+        assert chunks[1].startswith('STARTCROSSING   "Crossing 1"\n')
+        assert ''.join(chunks) == hy8_runner.to_hy8_string(project_date=1.0)
+        assert table.to_hy8_string(Hy8RunnerConfig(), project_date=1.0).startswith('HY8PROJECTFILE80.0\nUNITS  0\n')
+
+    def test_write_hy8_file(self):
+        """Write an HY-8 file from the table that reads back into the same crossings."""
+        os.makedirs(self.table_dir, exist_ok=True)
+        hy8_file = os.path.join(self.table_dir, 'table.hy8')
+        hy8_runner = self.create_project()
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+
+        table.write_hy8_file(hy8_file, project_title='Table', project_date=1.0)
+        with open(hy8_file) as file:
+            assert file.read() == hy8_runner.to_hy8_string(project_date=1.0)
+
+        read_runner = Hy8Runner.from_hy8_file(hy8_file)
+        assert read_runner.to_hy8_string(project_date=1.0) == hy8_runner.to_hy8_string(project_date=1.0)
+
+    def test_same_bytes_as_crossings(self):
+        """Write the same bytes as the crossing objects, for values given as ints or floats."""
+        os.makedirs(self.table_dir, exist_ok=True)
+        hy8_file = os.path.join(self.table_dir, 'same_bytes.hy8')
+        expected_file = os.path.join(self.table_dir, 'same_bytes_expected.hy8')
+        hy8_runner = self.create_project()
+        hy8_runner.add_crossing()
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_rating_curve(97, [[0, 97, 0], [100, 99.5, 2]])
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.set_culvert_barrel_number_of_barrels(3)
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+
+        table.write_hy8_file(hy8_file, hy8_runner.config, project_title='Table', project_date=1.0)
+        with open(expected_file, 'w') as file:
+            file.write(hy8_runner.to_hy8_string(project_date=1.0))
+        with open(hy8_file, 'rb') as file, open(expected_file, 'rb') as expected:
+            assert file.read() == expected.read()
+        assert 'ROADWIDTH 25\n' in table.to_hy8_string(project_date=1.0)
+        assert table.get_value('roadway_width', 3) == 25 and table.get_value('roadway_width', 0) == 25.0
+        assert table.get_crossing(3).tw_rating_curve == [[0, 97, 0], [100, 99.5, 2]]
+
+    def test_unknown_levels(self):
+        """Keep text values outside the known levels as new levels."""
+        hy8_runner = Hy8Runner()
+        hy8_runner.crossings[0].culverts[0].material = 'plastic'
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+
+        assert table.levels['material'] == ['concrete', 'corrugated steel', 'plastic']
+        assert table.get_crossing(0).culverts[0].material == 'plastic'
+        assert table.to_hy8_string(project_date=1.0) == hy8_runner.to_hy8_string(project_date=1.0)
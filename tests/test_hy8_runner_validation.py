@@ -0,0 +1,128 @@
+"""Performs testing for hy8 validation engine classes."""
+# 1. Standard python modules
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_table import Hy8CrossingTable
+from hy8runner.hy8_runner_validation import Hy8RunnerValidator
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerValidator:
+    """A class that will test validating an inventory of crossings."""
+
+    def create_project(self, num_crossings):
+        """Create a project of valid crossings."""
+        hy8_runner = Hy8Runner()
+        for index in range(num_crossings):
+            if index > 0:
+                hy8_runner.add_crossing()
+            hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+            hy8_runner.set_tw_constant(98, 100)
+            hy8_runner.set_roadway_width(25)
+            hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+            hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+            hy8_runner.set_culvert_barrel_site_data(0, 100, 100, 98)
+        return hy8_runner
+
+    def test_validate_valid(self):
+        """Validate crossings without errors."""
+        hy8_runner = self.create_project(3)
+        result = Hy8RunnerValidator().validate(hy8_runner.crossings)
+        assert result.is_valid
+        assert len(result) == 0
+        assert list(result.valid) == [1, 1, 1]
+        assert result.get_messages() == ''
+
+    def test_validate_errors(self):
+        """Report the errors of every crossing and barrel with codes and fields."""
+        hy8_runner = self.create_project(3)
+        hy8_runner.set_discharge_user_list_flow([10, 5], index=0)
+        hy8_runner.set_roadway_width(0, index=0)
+        hy8_runner.add_culvert_barrel(2)
+        hy8_runner.set_culvert_barrel_shape('box', 2)
+        hy8_runner.set_culvert_barrel_span_and_rise(0, 0, 2)
+        table = Hy8CrossingTable.from_crossings(hy8_runner.crossings)
+        result = Hy8RunnerValidator().validate(table)
+
+        assert not result.is_valid
+        assert list(result.valid) == [0, 1, 0]
+        assert result.get_errors() == [
+            (0, -1, 'flow_list_not_increasing', 'flows'),
+            (0, -1, 'roadway_width_not_positive', 'roadway_width'),
+            (2, 1, 'span_not_positive', 'span'),
+            (2, 1, 'box_rise_not_positive', 'rise'),
+        ]
+        assert result.get_errors(1) == []
+        assert result.get_messages(2) == \
+            'Crossing: Crossing 3 with index: 2 Culvert barrel: Culvert 2\tspan of the culvert must be specified.\n' \
+            'Crossing: Crossing 3 with index: 2 Culvert barrel: Culvert 2\trise of the box culvert must be specified.\n'
+
+    def test_fail_fast(self):
+        """Stop at the first error in fail-fast mode."""
+        hy8_runner = self.create_project(3)
+        hy8_runner.set_roadway_width(0, index=1)
+        hy8_runner.set_roadway_width(0, index=2)
+        hy8_runner.set_culvert_barrel_span_and_rise(0, 0, 0)
+
+        result = Hy8RunnerValidator(fail_fast=True).validate(hy8_runner.crossings)
+        assert result.complete is False
+        assert result.get_errors() == [(1, -1, 'roadway_width_not_positive', 'roadway_width')]
+
+        result = Hy8RunnerValidator().validate(hy8_runner.crossings)
+        assert result.complete is True
+        assert len(result) == 3
+
+    def test_tailwater_channel(self):
+        """Check a rectangular tailwater channel with the original rules and leave the other shapes unchecked."""
+        hy8_runner = self.create_project(3)
+        hy8_runner.set_tw_rectangular(0, 0, 0, 0, index=0)
+        hy8_runner.set_tw_triangular(2, 0, 0, 97, index=1)
+        hy8_runner.set_tw_rectangular(10, 0, 0.035, 0, index=2)
+        result = Hy8RunnerValidator().validate(hy8_runner.crossings)
+        assert result.get_errors() == [
+            (2, -1, 'tw_bottom_width_positive', 'tw_bottom_width'),
+            (2, -1, 'tw_manning_n_positive', 'tw_manning_n'),
+        ]
+
+    def test_default_tailwater(self):
+        """Accept the tailwater of a new runner."""
+        errors = Hy8RunnerValidator().validate(Hy8Runner().crossings).get_errors()
+        assert [error for error in errors if error[2].startswith('tw_')] == []
+
+    def test_messages_of_every_crossing(self):
+        """Keep the messages of earlier crossings in Hy8Runner.validate_crossings_data."""
+        hy8_runner = self.create_project(2)
+        hy8_runner.set_roadway_width(0, index=0)
+        _, messages = hy8_runner.validate_crossings_data()
+        assert messages.startswith('Crossing: Crossing 1 with index: 0 Roadway width must be greater than zero.\n')
+
+    def test_validate_model_reuses_table(self):
+        """Build the crossing table of Hy8Runner.validate_model again only when a crossing changed."""
+        hy8_runner = self.create_project(2)
+        table = hy8_runner.validate_model().table
+        assert hy8_runner.validate_model().table is table
+
+        hy8_runner.set_roadway_width(0, index=1)
+        result = hy8_runner.validate_model()
+        assert result.table is not table
+        assert result.get_errors() == [(1, -1, 'roadway_width_not_positive', 'roadway_width')]
+        table = result.table
+
+        hy8_runner.crossings[1].roadway_stations.append(300.0)
+        assert hy8_runner.validate_model().table is not table
+        table = hy8_runner.validate_model().table
+
+        hy8_runner.add_crossing()
+        result = hy8_runner.validate_model()
+        assert result.table is not table
+        assert len(result.table) == 3
@@ -0,0 +1,125 @@
+"""Performs testing for hy8 runner workspace class."""
+# 1. Standard python modules
+import asyncio
+import os
+import shutil
+
+# 2. Third party modules
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from hy8runner.hy8_runner import Hy8Runner
+from hy8runner.hy8_runner_batch import Hy8BatchRunner
+from hy8runner.hy8_runner_cache import Hy8RunnerResultsCache
+from tests.hy8_stand_in import create_stand_in_hy8
+from hy8runner.hy8_runner_workspace import Hy8RunnerWorkspace
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+# This is not a FHWA product nor is it endorsed by FHWA.
+# FHWA will not be providing any technical supporting, funding or maintenance.
+
+
+class TestHy8RunnerWorkspace:
+    """A class that will test running HY-8 in scratch workspaces."""
+
+    test_dir = os.path.dirname(__file__)
+    workspace_test_dir = os.path.join(test_dir, 'files', 'hy8_workspace_files')
+
+    def create_hy8_runner(self, hy8_exe_dir, basename, scratch_dir):
+        """Create and write a valid HY-8 Runner that runs in a workspace."""
+        hy8_runner = Hy8Runner(hy8_exe_dir, os.path.join(self.workspace_test_dir, basename))
+        hy8_runner.set_discharge_min_max_inc_flow(0, 200, 50)
+        hy8_runner.set_tw_constant(98, 100)
+        hy8_runner.set_roadway_width(25)
+        hy8_runner.set_roadway_stations_and_elevations([0, 100, 200], [110, 112, 111])
+        hy8_runner.set_culvert_barrel_span_and_rise(5, 4)
+        hy8_runner.set_culvert_barrel_site_data(0, 100, 40, 98)
+        hy8_runner.scratch_dir = scratch_dir
+        hy8_runner.create_hy8_file()
+        return hy8_runner
+
+    def create_scratch_dir(self, name):
+        """Create an empty scratch directory."""
+        scratch_dir = os.path.join(self.workspace_test_dir, name)
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+        return scratch_dir
+
+    def test_collect(self):
+        """Move only the requested files back and remove the workspace."""
+        hy8_file = os.path.join(self.workspace_test_dir, 'test_collect.hy8')
+        os.makedirs(self.workspace_test_dir, exist_ok=True)
+        with open(hy8_file, 'w') as file:
+            file.write('HY8PROJECTFILE80.0\n')
+        with Hy8RunnerWorkspace(hy8_file, self.create_scratch_dir('test_collect_scratch'), ['.rst']) as workspace:
+            assert os.path.dirname(workspace.run_hy8_file) != os.path.dirname(hy8_file)
+            run_stem = os.path.splitext(workspace.run_hy8_file)[0]
+            for extension in ('.rst', '.plt'):
+                with open(run_stem + extension, 'w') as file:
+                    file.write(extension)
+            moved_files = workspace.collect([run_stem + '.plt', run_stem + '.rst'])
+            directory = workspace.directory
+        assert moved_files == [os.path.join(self.workspace_test_dir, 'test_collect.rst')]
+        assert not os.path.exists(directory)
+
+    def test_run_open_save(self):
+        """Run HY-8 in a workspace and move the requested output files back."""
+        hy8_exe_dir = os.path.join(self.workspace_test_dir, 'test_run_open_save_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        scratch_dir = self.create_scratch_dir('test_run_open_save_scratch')
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_run_open_save.hy8', scratch_dir)
+        hy8_runner.scratch_artifacts = ['.rst', '.rsql']
+        for extension in ('.rst', '.plt', '.rsql'):
+            if os.path.exists(hy8_runner.get_output_file(extension)):
+                os.remove(hy8_runner.get_output_file(extension))
+
+        run_result = hy8_runner.run_open_save()
+        assert run_result.succeeded
+        assert run_result.command[-1] == hy8_runner.hy8_file
+        assert run_result.output_files == [hy8_runner.get_output_file('.rsql'), hy8_runner.get_output_file('.rst')]
+        assert not os.path.exists(hy8_runner.get_output_file('.plt'))
+        assert os.listdir(scratch_dir) == []
+        assert hy8_runner.read_results().num_crossings == 1
+
+        run_result = asyncio.run(hy8_runner.run_open_save_async())
+        assert run_result.succeeded
+        assert os.listdir(scratch_dir) == []
+
+    def test_cached_artifacts(self):
+        """Restore only the requested files from the results cache."""
+        hy8_exe_dir = os.path.join(self.workspace_test_dir, 'test_cached_artifacts_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        hy8_runner = self.create_hy8_runner(hy8_exe_dir, 'test_cached_artifacts.hy8',
+                                            self.create_scratch_dir('test_cached_artifacts_scratch'))
+        hy8_runner.results_cache = Hy8RunnerResultsCache(self.create_scratch_dir('test_cached_artifacts_cache'))
+        hy8_runner.run_open_save()
+        hy8_runner.scratch_artifacts = ['.plt']
+        run_result = hy8_runner.run_open_save()
+        assert run_result.cached
+        assert run_result.output_files == [hy8_runner.get_output_file('.plt')]
+
+    def test_missing_hy8_file(self):
+        """Report an HY-8 file that can not be copied into a workspace."""
+        hy8_runner = Hy8Runner(os.path.join(self.workspace_test_dir, 'missing'),
+                               os.path.join(self.workspace_test_dir, 'test_missing_hy8_file.hy8'))
+        hy8_runner.scratch_dir = self.create_scratch_dir('test_missing_hy8_file_scratch')
+        run_result = hy8_runner.run_open_save()
+        assert run_result.status == 'error'
+        assert run_result.attempts == 0
+        assert os.listdir(hy8_runner.scratch_dir) == []
+
+    def test_batch(self):
+        """Run projects given as paths in workspaces."""
+        hy8_exe_dir = os.path.join(self.workspace_test_dir, 'test_batch_exe')
+        create_stand_in_hy8(hy8_exe_dir)
+        scratch_dir = self.create_scratch_dir('test_batch_scratch')
+        hy8_files = [self.create_hy8_runner(hy8_exe_dir, f'test_batch_{index}.hy8', None).hy8_file
+                     for index in range(4)]
+        job_results = Hy8BatchRunner(hy8_files, 'OpenRunSave', max_workers=4, hy8_exe_path=hy8_exe_dir,
+                                     scratch_dir=scratch_dir).run()
+        assert [job_result.status for job_result in job_results] == ['success'] * 4
+        for hy8_file in hy8_files:
+            assert os.path.exists(os.path.splitext(hy8_file)[0] + '.rst')
+        assert os.listdir(scratch_dir) == []